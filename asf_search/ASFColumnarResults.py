@@ -0,0 +1,460 @@
+from array import array
+import json
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from asf_search import ASFSession, ASFSearchOptions, ASFProduct
+from asf_search import ASF_LOGGER
+from asf_search.exceptions import ASFSearchError
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+class _StringColumn:
+    """Strings stored as a single UTF-8 buffer with int64 offsets, like Arrow's `large_string`"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('q', [0])
+        self.valid = array('b')
+
+    def append(self, value: Any):
+        value = _to_string(value)
+        if value is not None:
+            self.data.extend(value.encode('utf-8'))
+        self.offsets.append(len(self.data))
+        self.valid.append(value is not None)
+
+    def get(self, idx: int) -> Optional[str]:
+        if not self.valid[idx]:
+            return None
+
+        return self.data[self.offsets[idx] : self.offsets[idx + 1]].decode('utf-8')
+
+    def to_numpy(self) -> np.ndarray:
+        return np.array([self.get(idx) for idx in range(len(self.valid))], dtype=object)
+
+    def to_arrow(self) -> 'pa.Array':
+        return pa.LargeStringArray.from_buffers(
+            len(self.valid),
+            pa.py_buffer(np.frombuffer(self.offsets, dtype=np.int64)),
+            pa.py_buffer(bytes(self.data)),
+            _validity_bitmap(self.valid),
+        )
+
+
+class _DictionaryColumn:
+    """Low cardinality strings stored as int32 codes into a list of unique values"""
+
+    def __init__(self):
+        self.codes = array('i')
+        self.values = []
+        self.value_codes = {}
+
+    def append(self, value: Any):
+        value = _to_string(value)
+        if value is None:
+            self.codes.append(-1)
+            return
+
+        if (code := self.value_codes.get(value)) is None:
+            code = len(self.values)
+            self.value_codes[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, idx: int) -> Optional[str]:
+        code = self.codes[idx]
+        return None if code < 0 else self.values[code]
+
+    def to_numpy(self) -> np.ndarray:
+        values = np.array(self.values + [None], dtype=object)
+        return values[np.frombuffer(self.codes, dtype=np.int32)]
+
+    def to_arrow(self) -> 'pa.Array':
+        codes = np.frombuffer(self.codes, dtype=np.int32)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=codes < 0), pa.array(self.values, type=pa.string())
+        )
+
+
+class _TimestampColumn:
+    """
+    UTC timestamps stored as int64 milliseconds since the epoch, along with the format
+    of the ISO 8601 string each was read from, so `get()` returns the same string
+    """
+
+    _missing = np.iinfo(np.int64).min  # NaT
+    # (numpy datetime unit, suffix) of each format code
+    _formats = [('s', 'Z'), ('ms', 'Z'), ('us', 'Z'), ('s', ''), ('ms', ''), ('us', '')]
+    _fraction_units = {0: 's', 3: 'ms', 6: 'us'}
+
+    def __init__(self):
+        self.values = array('q')
+        self.formats = array('b')
+        # values that aren't a timestamp's formatted string, by index
+        self.originals = {}
+
+    def append(self, value: Any):
+        try:
+            timestamp = int(np.datetime64(value.rstrip('Z'), 'ms').astype(np.int64))
+        except (AttributeError, ValueError):
+            timestamp = self._missing
+
+        code = -1
+        if timestamp != self._missing:
+            unit = self._fraction_units.get(len(value.rstrip('Z').partition('.')[2]))
+            if unit is not None:
+                code = self._formats.index((unit, 'Z' if value.endswith('Z') else ''))
+
+        if value is not None and (code < 0 or self._format(timestamp, code) != value):
+            self.originals[len(self.values)] = value
+        self.values.append(timestamp)
+        self.formats.append(code)
+
+    def get(self, idx: int) -> Optional[str]:
+        if idx in self.originals:
+            return self.originals[idx]
+
+        value = self.values[idx]
+        if value == self._missing:
+            return None
+
+        return self._format(value, self.formats[idx])
+
+    def _format(self, value: int, code: int) -> str:
+        unit, suffix = self._formats[code]
+        return f'{np.datetime_as_string(np.datetime64(value, "ms"), unit=unit)}{suffix}'
+
+    def to_numpy(self) -> np.ndarray:
+        return np.frombuffer(self.values, dtype=np.int64).view('datetime64[ms]')
+
+    def to_arrow(self) -> 'pa.Array':
+        values = np.frombuffer(self.values, dtype=np.int64)
+        return pa.array(values, type=pa.timestamp('ms', tz='UTC'), mask=values == self._missing)
+
+
+class _FloatColumn:
+    """float64 values, missing values are stored as NaN"""
+
+    def __init__(self):
+        self.values = array('d')
+
+    def append(self, value: Any):
+        try:
+            self.values.append(float(value))
+        except (TypeError, ValueError):
+            self.values.append(math.nan)
+
+    def get(self, idx: int) -> Optional[float]:
+        value = self.values[idx]
+        return None if math.isnan(value) else value
+
+    def to_numpy(self) -> np.ndarray:
+        return np.frombuffer(self.values, dtype=np.float64)
+
+    def to_arrow(self) -> 'pa.Array':
+        values = self.to_numpy()
+        return pa.array(values, mask=np.isnan(values))
+
+
+class _IntColumn:
+    """int64 values with a separate validity array"""
+
+    def __init__(self):
+        self.values = array('q')
+        self.valid = array('b')
+
+    def append(self, value: Any):
+        try:
+            self.values.append(int(value))
+            self.valid.append(True)
+        except (TypeError, ValueError, OverflowError):
+            self.values.append(0)
+            self.valid.append(False)
+
+    def get(self, idx: int) -> Optional[int]:
+        return self.values[idx] if self.valid[idx] else None
+
+    def to_numpy(self) -> np.ma.MaskedArray:
+        return np.ma.masked_array(
+            np.frombuffer(self.values, dtype=np.int64),
+            mask=~np.frombuffer(self.valid, dtype=np.bool_),
+        )
+
+    def to_arrow(self) -> 'pa.Array':
+        return pa.array(
+            np.frombuffer(self.values, dtype=np.int64),
+            mask=~np.frombuffer(self.valid, dtype=np.bool_),
+        )
+
+
+class _BytesColumn(_IntColumn):
+    """Product size in bytes, per file sizes (ex: OPERA-S1 `bytes`) are stored as their total"""
+
+    def append(self, value: Any):
+        if isinstance(value, dict):
+            try:
+                value = sum(int(file['bytes']) for file in value.values())
+            except (KeyError, TypeError, ValueError):
+                value = None
+
+        super().append(value)
+
+
+class _FootprintColumn:
+    """Polygon outer rings stored as one flat lon/lat float64 buffer with int64 ring offsets"""
+
+    def __init__(self):
+        self.coordinates = array('d')
+        self.offsets = array('q', [0])
+        self.valid = array('b')
+
+    def append(self, geometry: Optional[Dict]):
+        try:
+            ring = geometry['coordinates'][0]
+            for lon, lat in ring:
+                self.coordinates.append(lon)
+                self.coordinates.append(lat)
+            valid = True
+        except (KeyError, IndexError, TypeError, ValueError):
+            valid = False
+
+        self.offsets.append(len(self.coordinates) // 2)
+        self.valid.append(valid)
+
+    def get(self, idx: int) -> Dict:
+        if not self.valid[idx]:
+            return {'coordinates': None, 'type': 'Polygon'}
+
+        start, end = self.offsets[idx] * 2, self.offsets[idx + 1] * 2
+        coordinates = self.coordinates[start:end]
+        ring = [[coordinates[i], coordinates[i + 1]] for i in range(0, len(coordinates), 2)]
+
+        return {'coordinates': [ring], 'type': 'Polygon'}
+
+    def to_arrow(self) -> 'pa.Array':
+        points = pa.FixedSizeListArray.from_arrays(
+            pa.array(np.frombuffer(self.coordinates, dtype=np.float64)), 2
+        )
+        return pa.LargeListArray.from_arrays(
+            pa.array(np.frombuffer(self.offsets, dtype=np.int64)),
+            points,
+            mask=pa.array(~np.frombuffer(self.valid, dtype=np.bool_)),
+        )
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return '+'.join(value)  # ex: OPERA-S1 polarization ['VV', 'VH'] -> 'VV+VH'
+
+    return json.dumps(value)
+
+
+def _validity_bitmap(valid: array) -> 'pa.Buffer':
+    return pa.py_buffer(np.packbits(np.frombuffer(valid, dtype=np.bool_), bitorder='little'))
+
+
+class ASFColumnarResults:
+    """
+    Stores the core properties and footprints of search results in typed arrays,
+    rather than as `ASFProduct` objects holding their full CMR UMM, to keep memory use
+    low for very large result sets.
+
+    - timestamps are stored as int64 milliseconds since the epoch
+    - unique string ids (like `fileID`) are stored in a single UTF-8 buffer,
+        repetitive ones (like `platform`) are dictionary encoded
+    - footprints are stored as a flat buffer of coordinates
+
+    Fill it directly from `search_generator()` pages:
+    ```
+    results = ASFColumnarResults()
+    for page in asf.search_generator(...):
+        results.extend(page)
+    ```
+
+    Indexing or iterating returns `ASFColumnarProduct` row views, which behave like
+    `ASFProduct` for the columns stored here. Use `to_arrow()` or `to_pandas()`
+    (requires the optional `pyarrow` and `pandas` packages) for column based processing.
+
+    Non-string values in string columns are stored joined with '+' when they're
+    lists of strings (ex: OPERA-S1 polarization), and as json otherwise.
+    Per file sizes (ex: OPERA-S1 bytes) are stored as their total.
+    Properties not in `_schema` (and the CMR UMM) are not kept
+    """
+
+    _schema = {
+        'fileID': _StringColumn,
+        'sceneName': _StringColumn,
+        'fileName': _StringColumn,
+        'url': _StringColumn,
+        'md5sum': _StringColumn,
+        'groupID': _StringColumn,
+        'startTime': _TimestampColumn,
+        'stopTime': _TimestampColumn,
+        'processingDate': _TimestampColumn,
+        'platform': _DictionaryColumn,
+        'sensor': _DictionaryColumn,
+        'beamModeType': _DictionaryColumn,
+        'polarization': _DictionaryColumn,
+        'processingLevel': _DictionaryColumn,
+        'flightDirection': _DictionaryColumn,
+        'granuleType': _DictionaryColumn,
+        'centerLat': _FloatColumn,
+        'centerLon': _FloatColumn,
+        'bytes': _BytesColumn,
+        'pathNumber': _IntColumn,
+        'frameNumber': _IntColumn,
+        'orbit': _IntColumn,
+    }
+    """The properties stored for each product, and how each is stored"""
+
+    def __init__(self, products: Iterable[ASFProduct] = (), opts: ASFSearchOptions = None):
+        self.searchOptions = opts
+        self.searchComplete = False
+
+        self._columns = {name: column() for name, column in self._schema.items()}
+        self._footprints = _FootprintColumn()
+        self._length = 0
+        self._session = None
+
+        self.extend(products)
+
+    def append(self, product: ASFProduct) -> None:
+        """Stores the properties and footprint of a single product"""
+        properties = product.properties
+        for name, column in self._columns.items():
+            column.append(properties.get(name))
+        self._footprints.append(product.geometry)
+        self._length += 1
+
+    def extend(self, products: Iterable[ASFProduct]) -> None:
+        """
+        Stores each product, such as a page from `search_generator()`.
+        Pages also update `searchOptions` and `searchComplete`
+        """
+        for product in products:
+            self.append(product)
+
+        if (opts := getattr(products, 'searchOptions', None)) is not None:
+            self.searchOptions = opts
+        if hasattr(products, 'searchComplete'):
+            self.searchComplete = products.searchComplete
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union['ASFColumnarProduct', List['ASFColumnarProduct']]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._length))]
+
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError('ASFColumnarResults index out of range')
+
+        return ASFColumnarProduct(self, idx)
+
+    def __iter__(self) -> Iterator['ASFColumnarProduct']:
+        for idx in range(self._length):
+            yield ASFColumnarProduct(self, idx)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        :returns a stored property as a numpy array
+        (`datetime64[ms]` for timestamps, a masked array for integers,
+        and an object array for strings)
+        """
+        return self._columns[name].to_numpy()
+
+    def get_properties(self, idx: int) -> Dict:
+        """:returns the stored properties of the product at `idx`"""
+        return {name: column.get(idx) for name, column in self._columns.items()}
+
+    def get_geometry(self, idx: int) -> Dict:
+        """:returns the footprint of the product at `idx`"""
+        return self._footprints.get(idx)
+
+    def geojson(self) -> Dict:
+        return {
+            'type': 'FeatureCollection',
+            'features': [product.geojson() for product in self],
+        }
+
+    def to_arrow(self) -> 'pa.Table':
+        """
+        :returns the results as a `pyarrow.Table`, one column per stored property
+        plus a `geometry` column of lon/lat pairs
+
+        requires installing optional dependencies via pip or conda to use the `pyarrow` package:
+
+        `python3 -m pip install asf-search[extras]`
+        """
+        if pa is None:
+            raise ImportError(
+                'Could not find pyarrow package in current python environment.'
+                '"pyarrow" is an optional dependency of asf-search required'
+                'for converting columnar results to arrow and pandas.'
+                'Enable by including the appropriate pip or conda install.'
+                'Ex: `python3 -m pip install asf-search[extras]`'
+            )
+
+        columns = {name: column.to_arrow() for name, column in self._columns.items()}
+        columns['geometry'] = self._footprints.to_arrow()
+
+        return pa.table(columns)
+
+    def to_pandas(self) -> 'pandas.DataFrame':  # noqa: F821
+        """
+        :returns the results as a `pandas.DataFrame`, see `to_arrow()`.
+        Dictionary encoded columns become categoricals
+        """
+        return self.to_arrow().to_pandas()
+
+    def raise_if_incomplete(self) -> None:
+        if not self.searchComplete:
+            msg = (
+                'Results are incomplete due to a search error. '
+                'See logging for more details. (ASFColumnarResults.raise_if_incomplete called)'
+            )
+
+            ASF_LOGGER.error(msg)
+            raise ASFSearchError(msg)
+
+    def _get_session(self) -> ASFSession:
+        if self._session is None:
+            self._session = getattr(self.searchOptions, 'session', None) or ASFSession()
+
+        return self._session
+
+
+class ASFColumnarProduct(ASFProduct):
+    """
+    A row of `ASFColumnarResults`, reading `properties` and `geometry` from the columns
+    the first time each is accessed. The CMR UMM isn't stored,
+    so `umm` and `meta` are always `None` and `baseline` is unavailable
+    """
+
+    _lazy = True
+
+    def __init__(self, results: ASFColumnarResults, idx: int):
+        self._results = results
+        self._idx = idx
+        super().__init__({}, session=results._get_session())
+
+    def _translate_properties(self, item: Dict) -> Dict:
+        return self._results.get_properties(self._idx)
+
+    def _translate_geometry(self, item: Dict) -> Dict:
+        return self._results.get_geometry(self._idx)
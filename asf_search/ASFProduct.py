@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Tuple, Type, List, final
+from typing import Any, Callable, Dict, Optional, Tuple, Type, List, final
 import warnings
 from shapely.geometry import shape, Point, Polygon, mapping
 import json
@@ -38,6 +38,8 @@ class ASFProduct:
         - `stack()`
         - `remotezip()`
 
+    `properties`, `geometry` and `baseline` are read from the umm when the product is created,
+    or the first time each is accessed for products created with `ASFProduct.lazy()`
 
     """
 
@@ -128,18 +130,127 @@ class ASFProduct:
     combine `ASFProduct._base_properties` with their own separately defined `_base_properties`
     """
 
+    _fallback_properties = {
+        'beamModeType': {'path': ['AdditionalAttributes', ('Name', 'BEAM_MODE'), 'Values', 0]},
+        'platform': {'path': ['Platforms', 0, 'ShortName']},
+    }
+    """
+    Properties read from the CMR UMM only when `_base_properties` didn't find a value for them
+    """
+
     _url_types = ['GET DATA', 'EXTENDED METADATA', 'GET DATA VIA DIRECT ACCESS', 'GET RELATED VISUALIZATION', 'VIEW RELATED INFORMATION', 'USE SERVICE API']
     
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
+    _lazy = False
+    """
+    When set, `properties`, `geometry` and `baseline` aren't read from the umm in `__init__()`,
+    see `ASFProduct.lazy()`
+    """
+
+    _default_session = None
+    """The session for products created without one, created the first time it's needed"""
+
+    def __init__(self, args: Dict = {}, session: ASFSession = None):
         self.meta = args.get('meta')
         self.umm = args.get('umm')
+        self.session = session if session is not None else ASFProduct._get_default_session()
+
+        if not self._lazy:
+            self._materialize()
+
+    @staticmethod
+    def _get_default_session() -> ASFSession:
+        if ASFProduct._default_session is None:
+            ASFProduct._default_session = ASFSession()
 
-        translated = self.translate_product(args)
+        return ASFProduct._default_session
+
+    @classmethod
+    def lazy(cls, args: Dict = {}, session: ASFSession = None) -> 'ASFProduct':
+        """
+        Creates a product that only keeps the CMR UMM response on creation.
+        `properties`, `geometry` and `baseline` are each read from the umm
+        the first time they're accessed, and `centroid()` the first time it's called,
+        then cached. Otherwise behaves exactly like a product created with `cls(args, session)`
+
+        :param args: the CMR UMM response for the product, with `umm` and `meta` keys
+        :param session: the session used to query CMR for the product
+        """
+        product = cls.__new__(cls)
+        product._lazy = True
+        product.__init__(args, session)
+
+        return product
+
+    @property
+    def properties(self) -> Dict:
+        if '_properties' not in self.__dict__:
+            item = {'umm': self.umm, 'meta': self.meta}
+            if self._overrides_translate_product():
+                translated = self.translate_product(item)
+                self._properties = translated['properties']
+                self.__dict__.setdefault('_geometry', translated['geometry'])
+            else:
+                self._properties = self._translate_properties(item)
+            self._init_properties()
+
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties: Dict):
+        self._properties = properties
+
+    @property
+    def geometry(self) -> Dict:
+        if '_geometry' not in self.__dict__:
+            item = {'umm': self.umm, 'meta': self.meta}
+            if self._overrides_translate_product():
+                self._geometry = self.translate_product(item)['geometry']
+            else:
+                self._geometry = self._translate_geometry(item)
 
-        self.properties = translated['properties']
-        self.geometry = translated['geometry']
-        self.baseline = None
-        self.session = session
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry: Dict):
+        self._geometry = geometry
+
+    @property
+    def baseline(self) -> Optional[Dict]:
+        if '_baseline' not in self.__dict__:
+            self._baseline = self._get_baseline()
+
+        return self._baseline
+
+    @baseline.setter
+    def baseline(self, baseline: Optional[Dict]):
+        self._baseline = baseline
+
+    def _materialize(self) -> None:
+        """Reads any of `properties`, `geometry` and `baseline` that haven't been read yet"""
+        self._properties = self.properties
+        self._geometry = self.geometry
+        self._baseline = self.baseline
+
+    @classmethod
+    def _overrides_translate_product(cls) -> bool:
+        """
+        Whether a subclass overrides `translate_product()`, in which case `properties`
+        and `geometry` are read with it instead of `_translate_properties()`/`_translate_geometry()`
+        """
+        return cls.translate_product is not ASFProduct.translate_product
+
+    def _init_properties(self) -> None:
+        """
+        Called once `properties` have been read from `_base_properties`,
+        subclasses override this to add or modify properties that need more than a umm path
+        """
+        pass
+
+    def _get_baseline(self) -> Optional[Dict]:
+        """
+        :returns the product's baseline values, `None` unless overridden by a subclass
+        """
+        return None
 
     def __str__(self):
         return json.dumps(self.geojson(), indent=2, sort_keys=True)
@@ -325,16 +436,24 @@ class ASFProduct:
 
     def centroid(self) -> Point:
         """
-        Finds the centroid of a product
+        Finds the centroid of a product, cached until `geometry` is replaced
         """
-        coords = mapping(shape(self.geometry))['coordinates'][0]
+        geometry = self.geometry
+        cached = self.__dict__.get('_centroid')
+        if cached is not None and cached[0] is geometry:
+            return cached[1]
+
+        coords = mapping(shape(geometry))['coordinates'][0]
         lons = [p[0] for p in coords]
         if max(lons) - min(lons) > 180:
             unwrapped_coords = [a if a[0] > 0 else [a[0] + 360, a[1]] for a in coords]
         else:
             unwrapped_coords = [a for a in coords]
 
-        return Polygon(unwrapped_coords).centroid
+        centroid = Polygon(unwrapped_coords).centroid
+        self._centroid = (geometry, centroid)
+
+        return centroid
 
     def remotezip(self, session: ASFSession) -> 'RemoteZip':  # type: ignore # noqa: F821
         """Returns a RemoteZip object which can be used to download
@@ -360,24 +479,38 @@ class ASFProduct:
     def translate_product(self, item: Dict) -> Dict:
         """
         Generates `properties` and `geometry` from the CMR UMM response
+
+        Subclasses may override this, `_init_properties()` is still called
+        with the `properties` it returns
         """
+        return {
+            'geometry': self._translate_geometry(item),
+            'properties': self._translate_properties(item),
+            'type': 'Feature',
+        }
+
+    def _translate_geometry(self, item: Dict) -> Dict:
+        """Generates `geometry` from the CMR UMM response"""
         try:
             coordinates = item['umm']['SpatialExtent']['HorizontalSpatialDomain']['Geometry'][
                 'GPolygons'
             ][0]['Boundary']['Points']
             coordinates = [[c['Longitude'], c['Latitude']] for c in coordinates]
             geometry = {'coordinates': [coordinates], 'type': 'Polygon'}
-        except KeyError:
+        except (KeyError, TypeError):
             geometry = {'coordinates': None, 'type': 'Polygon'}
 
+        return geometry
+
+    def _translate_properties(self, item: Dict) -> Dict:
+        """Generates `properties` from `_base_properties` and the CMR UMM response"""
         umm = item.get('umm')
 
-        # additionalAttributes = {attr['Name']: attr['Values'] for attr in umm['AdditionalAttributes']}
+        property_readers, fallback_readers = self._get_property_readers()
+        # Lists like `AdditionalAttributes` are indexed once per item, and shared between readers
+        umm_indexes = {}
 
-        properties = {
-            prop: self._read_umm_property(umm, umm_mapping)
-            for prop, umm_mapping in self._base_properties.items()
-        }
+        properties = {prop: read(umm, umm_indexes) for prop, read in property_readers.items()}
 
         if properties.get('url') is not None:
             properties['fileName'] = properties['url'].split('/')[-1]
@@ -385,15 +518,126 @@ class ASFProduct:
             properties['fileName'] = None
 
         # Fallbacks
-        if properties.get('beamModeType') is None:
-            properties['beamModeType'] = self.umm_get(
-                umm, 'AdditionalAttributes', ('Name', 'BEAM_MODE'), 'Values', 0
+        for prop, read in fallback_readers.items():
+            if properties.get(prop) is None:
+                properties[prop] = read(umm, umm_indexes)
+
+        return properties
+
+    @classmethod
+    def _get_property_readers(
+        cls,
+    ) -> Tuple[Dict[str, Callable[[Dict, Dict], Any]], Dict[str, Callable[[Dict, Dict], Any]]]:
+        """
+        Compiles `_base_properties` and `_fallback_properties` into property readers,
+        once per subclass. Recompiled if either is replaced on the class.
+
+        Each reader is called with the umm and a dict of umm indexes shared between readers
+        """
+        compiled = cls.__dict__.get('_compiled_property_readers')
+        if (
+            compiled is None
+            or compiled[0] is not cls._base_properties
+            or compiled[1] is not cls._fallback_properties
+        ):
+            compiled = (
+                cls._base_properties,
+                cls._fallback_properties,
+                {
+                    prop: cls._compile_umm_property(mapping)
+                    for prop, mapping in cls._base_properties.items()
+                },
+                {
+                    prop: cls._compile_umm_property(mapping)
+                    for prop, mapping in cls._fallback_properties.items()
+                },
             )
+            cls._compiled_property_readers = compiled
+
+        return compiled[2], compiled[3]
+
+    @staticmethod
+    def _compile_umm_property(mapping: Dict) -> Callable[[Dict, Dict], Any]:
+        """
+        Compiles a `_base_properties` entry into a reader equivalent to `_read_umm_property()`.
+
+        Instead of searching a list of dicts (like `AdditionalAttributes`) for a
+        key value pair, the list is indexed by that key the first time any reader needs it,
+        and the index is stored in the `umm_indexes` dict passed to every reader
+        """
+        path = mapping['path']
+        cast = mapping.get('cast')
 
-        if properties.get('platform') is None:
-            properties['platform'] = self.umm_get(umm, 'Platforms', 0, 'ShortName')
+        search_idx = next((idx for idx, key in enumerate(path) if isinstance(key, tuple)), None)
+
+        if search_idx is None:
+
+            def read(umm: Dict, umm_indexes: Dict) -> Any:
+                return ASFProduct.umm_get(umm, *path)
+
+        else:
+            list_path = tuple(path[:search_idx])
+            (search_key, search_value) = path[search_idx]
+            remaining_path = path[search_idx + 1 :]
+
+            if isinstance(search_value, List):
+                (search_value, output_key) = search_value[0]
+
+                def read(umm: Dict, umm_indexes: Dict) -> Any:
+                    index = ASFProduct._get_umm_index(
+                        umm, umm_indexes, list_path, search_key, match_all=True
+                    )
+                    if (children := index.get(search_value)) is None:
+                        return None
+
+                    return [ASFProduct.umm_get(child, output_key) for child in children]
+
+            else:
+
+                def read(umm: Dict, umm_indexes: Dict) -> Any:
+                    index = ASFProduct._get_umm_index(umm, umm_indexes, list_path, search_key)
+                    if (child := index.get(search_value)) is None:
+                        return None
+
+                    return ASFProduct.umm_get(child, *remaining_path)
+
+        if cast is None:
+            return read
+
+        def read_and_cast(umm: Dict, umm_indexes: Dict) -> Any:
+            return ASFProduct.umm_cast(cast, read(umm, umm_indexes))
+
+        return read_and_cast
+
+    @staticmethod
+    def _get_umm_index(
+        umm: Dict, umm_indexes: Dict, list_path: Tuple, key: str, match_all: bool = False
+    ) -> Dict:
+        """
+        Indexes the list of dicts at `list_path` in the umm by each dict's `key` value,
+        (ex: `AdditionalAttributes` by `Name`), caching the index in `umm_indexes`.
+
+        Matches `umm_get()` search behavior: values `umm_get()` treats as missing
+        are never matched, and only the first dict with a given value is indexed
+        unless `match_all` is set, in which case every dict is kept
+        """
+        index_key = (list_path, key, match_all)
+        if (index := umm_indexes.get(index_key)) is not None:
+            return index
+
+        index = {}
+        for child in ASFProduct.umm_get(umm, *list_path) or []:
+            value = ASFProduct.umm_get(child, key)
+            if value is None or not isinstance(value, (str, int, float)):
+                continue
+
+            if match_all:
+                index.setdefault(value, []).append(child)
+            else:
+                index.setdefault(value, child)
 
-        return {'geometry': geometry, 'properties': properties, 'type': 'Feature'}
+        umm_indexes[index_key] = index
+        return index
 
     def get_sort_keys(self) -> Tuple[str, str]:
         """
@@ -1,9 +1,47 @@
 from asf_search.constants import INTERNAL
 from asf_search.ASFSession import ASFSession
 
-config = {
-    'host': INTERNAL.CMR_HOST,
-    'provider': INTERNAL.DEFAULT_PROVIDER,
-    'session': ASFSession(),
-    'collectionAlias': True,
-}
+
+class _SearchConfig(dict):
+    """
+    Default values for config options. The default `session` is only created
+    the first time it's read, rather than when asf_search is imported
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if value is _DEFAULT_SESSION:
+            value = ASFSession()
+            self[key] = value
+
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+_DEFAULT_SESSION = object()
+
+config = _SearchConfig(
+    {
+        'host': INTERNAL.CMR_HOST,
+        'provider': INTERNAL.DEFAULT_PROVIDER,
+        'session': _DEFAULT_SESSION,
+        'collectionAlias': True,
+        'maxWorkers': 1,
+        'asCompleted': False,
+        'prefetchDepth': 0,
+        'streamPages': False,
+        'lazyProducts': False,
+        'parseWorkers': 0,
+        'adaptivePageSize': False,
+        'collapseSubqueries': False,
+        'temporalShards': 0,
+        'balanceShards': False,
+        'spatialTiles': 0,
+        'sortedStream': False,
+        'dropDuplicates': False,
+        'duplicateBloomCapacity': 0,
+        'resumeFromCheckpoint': False,
+    }
+)
@@ -82,4 +82,20 @@ validator_map = {
     'host': parse_string,
     'provider': parse_string,
     'collectionAlias': bool,
+    'maxWorkers': int,
+    'asCompleted': bool,
+    'prefetchDepth': int,
+    'streamPages': bool,
+    'lazyProducts': bool,
+    'parseWorkers': int,
+    'adaptivePageSize': bool,
+    'collapseSubqueries': bool,
+    'temporalShards': int,
+    'balanceShards': bool,
+    'spatialTiles': int,
+    'sortedStream': bool,
+    'dropDuplicates': bool,
+    'duplicateBloomCapacity': int,
+    'checkpoint': parse_string,
+    'resumeFromCheckpoint': bool,
 }
@@ -1,4 +1,3 @@
-import dateparser
 from datetime import datetime, timezone
 
 import requests
@@ -51,6 +50,8 @@ def parse_date(value: Union[str, datetime]) -> Union[datetime, str]:
     if isinstance(value, datetime):
         return _to_utc(value)
 
+    import dateparser  # slow to import, so only imported once a date needs parsing
+
     date = dateparser.parse(str(value))
     if date is None:
         raise ValueError(f"Invalid date: '{value}'.")
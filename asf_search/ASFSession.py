@@ -1,7 +1,9 @@
 from logging import warn
 import platform
-from typing import List, Union
+import time
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
 from requests.utils import get_netrc_auth
 import http.cookiejar
 
@@ -9,6 +11,13 @@ from asf_search import ASF_LOGGER, __name__ as asf_name, __version__ as asf_vers
 from asf_search.exceptions import ASFAuthenticationError
 import warnings
 
+if TYPE_CHECKING:
+    from urllib3.util.retry import Retry
+
+    from asf_search.CMR.cache import CMRCache, CountCache
+    from asf_search.CMR.hedge import RequestHedger
+    from asf_search.CMR.throttle import CircuitBreaker, RateLimiter
+
 
 class ASFSession(requests.Session):
     def __init__(
@@ -20,6 +29,15 @@ class ASFSession(requests.Session):
         cmr_collections: str = None,
         auth_domains: List[str] = None,
         auth_cookie_names: List[str] = None,
+        cmr_cache: 'CMRCache' = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        max_retries: Union[int, 'Retry'] = None,
+        keep_alive: bool = True,
+        rate_limiter: 'RateLimiter' = None,
+        circuit_breaker: 'CircuitBreaker' = None,
+        request_hedger: 'RequestHedger' = None,
+        count_cache: 'CountCache' = None,
     ):
         """
         ASFSession is a subclass of `requests.Session`, and is meant to ease
@@ -57,6 +75,52 @@ class ASFSession(requests.Session):
         `auth_cookie_names`:
             the list of cookie names to use when verifying
             with `auth_with_creds()` & `auth_with_cookiejar()`
+        `cmr_cache`:
+            an optional `asf_search.CMRCache`. When set, CMR search pages requested
+            with this session are read from and written to the on-disk cache.
+            Defaults to `None` (no caching)
+        `pool_connections`:
+            the number of hosts to keep connection pools for.
+            Defaults to `asf_search.constants.INTERNAL.HTTP_POOL_CONNECTIONS`
+        `pool_maxsize`:
+            the number of connections kept open per host. Set this to at least the
+            `maxWorkers` used for searches sharing this session.
+            Defaults to `asf_search.constants.INTERNAL.HTTP_POOL_MAXSIZE`
+        `max_retries`:
+            retries for failed connections, as a number or a `urllib3.util.Retry`,
+            applied to every request made with this session.
+            Defaults to `asf_search.constants.INTERNAL.HTTP_MAX_RETRIES`
+        `keep_alive`:
+            reuse connections between requests. Defaults to `True`
+        `rate_limiter`:
+            an optional `asf_search.RateLimiter`. When set, requests to CMR made with
+            this session wait for a token from the limiter's bucket for their host.
+            Defaults to `None` (no limit)
+        `circuit_breaker`:
+            an optional `asf_search.CircuitBreaker`. When set, requests to a CMR host
+            raise `ASFCircuitOpenError` instead of being sent while that host's circuit
+            is open. Defaults to `None`
+        `request_hedger`:
+            an optional `asf_search.RequestHedger`. When set, CMR search page requests
+            made with this session that take longer than usual are sent a second time,
+            using whichever response arrives first. Defaults to `None` (no hedging)
+        `count_cache`:
+            an optional `asf_search.CountCache`. When set, CMR hit counts requested
+            with this session are reused for the cache's `ttl`. Defaults to `None`
+
+        The rate limiter and circuit breaker apply to requests to `INTERNAL.CMR_HOST`,
+        and to any host the rate limiter has its own limit for. Either can be shared by
+        several sessions, and by every thread using them.
+
+        Every request made with the session, including CMR searches from any
+        subquery or search worker using it, shares its connection pools.
+        See `configure_pool()` to change the pool settings later.
+
+        Once authenticated, one session can be shared by any number of threads running
+        searches and downloads at the same time. Searches send their CMR paging cursor
+        with each request instead of storing it on the session, and downloads don't modify
+        the session. Authenticating (`auth_with_*()`) and `configure_pool()` do modify it,
+        so call them before sharing the session between threads.
 
         More information on Earthdata Login can be found here:
         https://urs.earthdata.nasa.gov/documentation/faq
@@ -87,6 +151,17 @@ class ASFSession(requests.Session):
         )
 
         self.cmr_host = INTERNAL.CMR_HOST
+        self.cmr_cache = cmr_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.request_hedger = request_hedger
+        self.count_cache = count_cache
+
+        self.pool_connections = INTERNAL.HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = INTERNAL.HTTP_POOL_MAXSIZE
+        self.max_retries = INTERNAL.HTTP_MAX_RETRIES
+        self.keep_alive = True
+        self.configure_pool(pool_connections, pool_maxsize, max_retries, keep_alive)
 
         if cmr_host is not None:
             warnings.warn(
@@ -109,6 +184,44 @@ class ASFSession(requests.Session):
             and self.cookies == other.cookies
         )
 
+    def configure_pool(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        max_retries: Union[int, 'Retry'] = None,
+        keep_alive: bool = None,
+    ):
+        """
+        Replaces the session's http and https transport adapters with ones using the given
+        connection pool settings, see `ASFSession()` for each option.
+        Options left as `None` keep their current value.
+        Connections already open in the previous pools aren't reused
+
+        Returns
+        ----------
+        ASFSession
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if max_retries is not None:
+            self.max_retries = max_retries
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+        self.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+
+        return self
+
     def auth_with_creds(self, username: str, password: str):
         """
         Authenticates the session using EDL username/password credentials
@@ -281,6 +394,81 @@ class ASFSession(requests.Session):
     def _get_domain(self, url: str):
         return requests.utils.urlparse(url).hostname
 
+    def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        """
+        Overrides requests.Session.request() to apply the session's
+        `rate_limiter` and `circuit_breaker` to CMR requests
+        """
+        host = self._get_throttled_host(url)
+        if host is None:
+            return super().request(method, url, *args, **kwargs)
+
+        delay = self._before_throttled_request(host)
+        if delay > 0:
+            ASF_LOGGER.debug(f'RATE LIMIT: waiting {delay:.2f}s for {host}')
+            time.sleep(delay)
+
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.RequestException:
+            self._after_throttled_request(host, None)
+            raise
+
+        self._after_throttled_request(host, response.status_code, response.headers)
+        return response
+
+    def _get_throttled_host(self, url: str) -> Optional[str]:
+        """:returns the host of `url` if the rate limiter or circuit breaker apply to it"""
+        if self.rate_limiter is None and self.circuit_breaker is None:
+            return None
+
+        from asf_search.constants import INTERNAL
+
+        host = self._get_domain(url)
+        if host in (INTERNAL.CMR_HOST, self.cmr_host) or (
+            self.rate_limiter is not None and host in self.rate_limiter.hosts
+        ):
+            return host
+
+        return None
+
+    def _before_throttled_request(self, host: str) -> float:
+        """
+        Checks the circuit breaker and takes a rate limiter token for a request to `host`
+
+        :returns the number of seconds to wait before sending the request
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(host)
+
+        if self.rate_limiter is not None:
+            return self.rate_limiter.reserve(host)
+
+        return 0.0
+
+    def _after_throttled_request(
+        self, host: str, status_code: Optional[int], headers: Mapping = None
+    ) -> None:
+        """
+        Records the outcome of a request to `host`, `status_code` is `None`
+        if the request failed without a response (connection errors, timeouts)
+        """
+        failed = status_code is None or status_code == 429 or status_code >= 500
+        if self.circuit_breaker is not None:
+            if failed:
+                self.circuit_breaker.record_failure(host)
+            else:
+                self.circuit_breaker.record_success(host)
+
+        if status_code == 429 and self.rate_limiter is not None:
+            retry_after = (headers or {}).get('Retry-After')
+            try:
+                seconds = float(retry_after)
+            except (TypeError, ValueError):
+                seconds = 1.0 / self.rate_limiter.get_limit(host)[0]
+
+            self.rate_limiter.pause(host, seconds)
+
     # multi-processing does an implicit copy of ASFSession objects,
     # this ensures ASFSession class variables are included
     def __getstate__(self):
@@ -294,5 +482,14 @@ class ASFSession(requests.Session):
             'cmr_collections': self.cmr_collections,
             'auth_domains': self.auth_domains,
             'auth_cookie_names': self.auth_cookie_names,
+            'cmr_cache': self.cmr_cache,
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'max_retries': self.max_retries,
+            'keep_alive': self.keep_alive,
+            'rate_limiter': self.rate_limiter,
+            'circuit_breaker': self.circuit_breaker,
+            'request_hedger': self.request_hedger,
+            'count_cache': self.count_cache,
         }
         return state
@@ -1,7 +1,7 @@
 from enum import Enum
 import copy
-from typing import Dict, Union
-from asf_search import ASFSession, ASFProduct
+from typing import Dict, Optional, Union
+from asf_search import ASFProduct
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.exceptions import ASFBaselineError
 
@@ -27,9 +27,8 @@ class ASFStackableProduct(ASFProduct):
     baseline_type = BaselineCalcType.PRE_CALCULATED
     """Determines how asf-search will attempt to stack products of this type."""
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
-        self.baseline = self.get_baseline_calc_properties()
+    def _get_baseline(self) -> Optional[Dict]:
+        return self.get_baseline_calc_properties()
 
     def get_baseline_calc_properties(self) -> Dict:
         insarBaseline = self.umm_cast(
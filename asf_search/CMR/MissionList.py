@@ -1,20 +1,25 @@
 from typing import Dict
+from asf_search.ASFSession import ASFSession
 from asf_search.exceptions import CMRError
 from asf_search.constants.INTERNAL import CMR_HOST, CMR_COLLECTIONS_PATH
 
-import requests
 
-
-def get_campaigns(data) -> Dict:
+def get_campaigns(data, session: ASFSession = None) -> Dict:
     """Queries CMR Collections endpoint for
     collections associated with the given platform
 
     :param data: a dictionary with required keys:
     'include_facets', 'provider', 'platform[]' and optional key: 'instrument[]'
+    :param session: the session to query CMR with, defaults to the default search session
 
     :return: Dictionary containing CMR umm_json response
     """
-    response = requests.post(f'https://{CMR_HOST}{CMR_COLLECTIONS_PATH}', data=data)
+    if session is None:
+        from asf_search.ASFSearchOptions.config import config
+
+        session = config['session']
+
+    response = session.post(f'https://{CMR_HOST}{CMR_COLLECTIONS_PATH}', data=data)
     if response.status_code != 200:
         raise CMRError(f'CMR_ERROR {response.status_code}: {response.text}')
 
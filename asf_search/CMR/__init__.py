@@ -1,11 +1,16 @@
 from .MissionList import get_campaigns  # noqa: F401
-from .subquery import build_subqueries  # noqa: F401
+from .subquery import build_subqueries, plan_subqueries, SubqueryPlan  # noqa: F401
 from .translate import translate_opts  # noqa: F401
 from .field_map import field_map  # noqa: F401
+from .cache import CMRCache, CountCache  # noqa: F401
+from .throttle import RateLimiter, CircuitBreaker  # noqa: F401
+from .hedge import RequestHedger  # noqa: F401
 from .datasets import (  # noqa: F401
     dataset_collections,  # noqa: F401
     collections_per_platform,  # noqa: F401
     collections_by_processing_level,  # noqa: F401
     get_concept_id_alias,  # noqa: F401
     get_dataset_concept_ids,  # noqa: F401
+    CollectionRegistry,  # noqa: F401
+    get_collection_registry,  # noqa: F401
 )
@@ -0,0 +1,268 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from asf_search import ASF_LOGGER
+
+
+class CMRCache:
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = 3600,
+        max_size: int = 512 * 1024 * 1024,
+    ):
+        """
+        An on-disk cache of raw CMR search responses.
+        Attach to an `ASFSession` (`ASFSession(cmr_cache=CMRCache())`) to have searches
+        made with that session read repeated pages from disk instead of CMR.
+
+        Pages are keyed on the translated CMR search parameters, the CMR endpoint,
+        the CMR-Search-After token used to request them, and the session's EDL token.
+
+        Parameters
+        ----------
+        `path`:
+            The directory to store cached pages in.
+            Defaults to `~/.cache/asf_search/cmr`
+        `ttl`:
+            How long in seconds a cached page is considered valid. Defaults to 1 hour
+        `max_size`:
+            The maximum total size in bytes of the cache directory.
+            Least recently used pages are evicted first. Defaults to 512 MB
+        """
+        self.path = (
+            os.path.join(os.path.expanduser('~'), '.cache', 'asf_search', 'cmr')
+            if path is None
+            else path
+        )
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0}
+
+        os.makedirs(self.path, exist_ok=True)
+        self._entries = self._load_entries()
+        self._evict()
+
+    def key(
+        self,
+        url: str,
+        translated_opts: List[Tuple[str, str]],
+        search_after: Optional[str] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        """
+        Builds the cache key for a CMR request.
+        Parameters are sorted by name only, so the order of repeated parameters
+        (like `sort_key[]`) is preserved
+        """
+        return _request_key(url, translated_opts, search_after, authorization)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        :returns the cached response body and CMR-Search-After header for `key`,
+        or `None` if it isn't cached or has expired
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._stats['misses'] += 1
+                return None
+
+            try:
+                with open(self._get_filepath(key), 'rb') as f:
+                    meta = json.loads(f.readline())
+                    body = f.read()
+            except (OSError, ValueError):
+                self._remove(key)
+                self._stats['misses'] += 1
+                return None
+
+            if time.time() - meta['created'] > self.ttl:
+                self._remove(key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            # Mark as most recently used, the file mtime persists this between sessions
+            self._entries.move_to_end(key)
+            os.utime(self._get_filepath(key))
+            self._stats['hits'] += 1
+
+            return body, meta['search_after']
+
+    def set(self, key: str, body: bytes, search_after: Optional[str] = None) -> None:
+        """Stores a response body and its CMR-Search-After header under `key`"""
+        meta = json.dumps({'created': time.time(), 'search_after': search_after})
+        data = meta.encode('utf-8') + b'\n' + body
+
+        if len(data) > self.max_size:
+            return
+
+        with self._lock:
+            filepath = self._get_filepath(key)
+            temp_filepath = f'{filepath}.{threading.get_ident()}.tmp'
+            try:
+                with open(temp_filepath, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_filepath, filepath)
+            except OSError as exc:
+                ASF_LOGGER.warning(f'Failed to write CMR response to cache: {exc}')
+                return
+
+            self._entries[key] = len(data)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes every cached page"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> Dict:
+        """
+        :returns cache hits, misses, expired pages, evictions,
+        and the current number of cached pages and their size in bytes
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'size': sum(self._entries.values()),
+            }
+
+    def _evict(self) -> None:
+        size = sum(self._entries.values())
+        while size > self.max_size and len(self._entries):
+            key = next(iter(self._entries))
+            size -= self._entries[key]
+            self._remove(key)
+            self._stats['evictions'] += 1
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        try:
+            os.remove(self._get_filepath(key))
+        except OSError:
+            pass
+
+    def _load_entries(self) -> 'OrderedDict[str, int]':
+        """Indexes pages already in the cache directory, least recently used first"""
+        entries = []
+        for filename in os.listdir(self.path):
+            if not filename.endswith('.page'):
+                continue
+
+            stat = os.stat(os.path.join(self.path, filename))
+            entries.append((stat.st_mtime, filename[: -len('.page')], stat.st_size))
+
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    def _get_filepath(self, key: str) -> str:
+        return os.path.join(self.path, f'{key}.page')
+
+    # The lock can't be pickled, multi-processing copies of a session get their own
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CountCache:
+    def __init__(self, ttl: float = 30, max_entries: int = 4096):
+        """
+        An in-memory cache of CMR hit counts.
+        Attach to an `ASFSession` (`ASFSession(count_cache=CountCache())`) to have
+        `search_count()` and `search_count_breakdown()` reuse the count of any subquery
+        requested with that session in the last `ttl` seconds, for example when refreshing
+        counts as search filters change.
+
+        Counts are keyed like `CMRCache` pages, on the translated CMR search parameters,
+        the CMR endpoint and the session's EDL token.
+
+        Parameters
+        ----------
+        `ttl`:
+            How long in seconds a count is reused. Defaults to 30 seconds
+        `max_entries`:
+            The maximum number of counts kept. Least recently used counts are evicted first.
+            Defaults to 4096
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        # key -> (hits, time counted)
+        self._entries: 'OrderedDict[str, Tuple[int, float]]' = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def key(
+        self,
+        url: str,
+        translated_opts: List[Tuple[str, str]],
+        authorization: Optional[str] = None,
+    ) -> str:
+        """Builds the cache key for a CMR count request"""
+        return _request_key(url, translated_opts, None, authorization)
+
+    def get(self, key: str) -> Optional[int]:
+        """:returns the cached hit count for `key`, or `None` if it isn't cached or has expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                self._entries.pop(key, None)
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def set(self, key: str, hits: int) -> None:
+        """Stores a hit count under `key`"""
+        with self._lock:
+            self._entries[key] = (hits, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached count"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """:returns cache hits, misses, and the current number of cached counts"""
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _request_key(
+    url: str,
+    translated_opts: List[Tuple[str, str]],
+    search_after: Optional[str] = None,
+    authorization: Optional[str] = None,
+) -> str:
+    canonical_opts = sorted([(key, str(val)) for key, val in translated_opts], key=lambda p: p[0])
+    payload = json.dumps([url, canonical_opts, search_after or '', authorization or ''])
+
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, FrozenSet, Iterable, List
 
 
 dataset_collections = {
@@ -1442,3 +1442,106 @@ def get_dataset_concept_ids(datasets: List[str]) -> List[str]:
             )
 
     return output
+
+
+class CollectionRegistry:
+    """
+    The collection dicts above compiled into frozensets of concept-ids per dataset,
+    platform and processing level, along with reverse indexes from each concept-id
+    back to its datasets, platforms and processing levels.
+
+    Built once on first use, see `get_collection_registry()`
+    """
+
+    asf_frame_platforms = frozenset(['SENTINEL-1A', 'SENTINEL-1B', 'ALOS'])
+    """Platforms searched by ASF frame rather than ESA frame"""
+
+    def __init__(self):
+        self.dataset_concept_ids = {
+            dataset: frozenset(
+                concept_id
+                for concept_ids in collections_by_short_name.values()
+                for concept_id in concept_ids
+            )
+            for dataset, collections_by_short_name in dataset_collections.items()
+        }
+        self.platform_concept_ids = {
+            platform: frozenset(concept_ids)
+            for platform, concept_ids in collections_per_platform.items()
+        }
+        self.processing_level_concept_ids = {
+            processing_level: frozenset(concept_ids)
+            for processing_level, concept_ids in collections_by_processing_level.items()
+        }
+
+        self.datasets_by_concept_id = self._reverse_index(self.dataset_concept_ids)
+        self.platforms_by_concept_id = self._reverse_index(self.platform_concept_ids)
+        self.processing_levels_by_concept_id = self._reverse_index(
+            self.processing_level_concept_ids
+        )
+
+        self.asf_frame_concept_ids = self.get_concept_id_alias(
+            self.asf_frame_platforms, self.platform_concept_ids
+        )
+
+    @staticmethod
+    def get_concept_id_alias(
+        param_list: Iterable[str], concept_id_sets: Dict[str, FrozenSet[str]]
+    ) -> FrozenSet[str]:
+        """
+        Set based `get_concept_id_alias()`
+
+        param: param_list (Iterable[str]): search values to alias
+        param: concept_id_sets (dict): one of this registry's search value to concept-ids dicts
+
+        returns FrozenSet[str]: the concept-ids for all of the search values,
+        or an empty set if any of the search values are not keys in concept_id_sets
+        """
+        aliases = []
+        for param in param_list:
+            if alias := concept_id_sets.get(param):
+                aliases.append(alias)
+            else:
+                return frozenset()
+
+        return frozenset().union(*aliases)
+
+    def get_dataset_concept_ids(self, datasets: Iterable[str]) -> FrozenSet[str]:
+        """
+        Set based `get_dataset_concept_ids()`, raising a ValueError for invalid datasets
+        """
+        concept_ids = []
+        for dataset in datasets:
+            if (dataset_concept_ids := self.dataset_concept_ids.get(dataset)) is None:
+                raise ValueError(
+                    f'Could not find dataset named "{dataset}" provided for dataset keyword.'
+                )
+            concept_ids.append(dataset_concept_ids)
+
+        return frozenset().union(*concept_ids)
+
+    @staticmethod
+    def _reverse_index(
+        concept_id_sets: Dict[str, FrozenSet[str]],
+    ) -> Dict[str, FrozenSet[str]]:
+        index = {}
+        for key, concept_ids in concept_id_sets.items():
+            for concept_id in concept_ids:
+                index.setdefault(concept_id, set()).add(key)
+
+        return {concept_id: frozenset(keys) for concept_id, keys in index.items()}
+
+
+_collection_registry = None
+
+
+def get_collection_registry() -> CollectionRegistry:
+    """
+    :returns the `CollectionRegistry` for the collection dicts in this module,
+    building it on the first call
+    """
+    global _collection_registry
+    if _collection_registry is None:
+        _collection_registry = CollectionRegistry()
+
+    return _collection_registry
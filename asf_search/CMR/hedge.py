@@ -0,0 +1,199 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from requests import Response
+
+from asf_search import ASF_LOGGER
+
+
+class RequestHedger:
+    def __init__(
+        self,
+        percentile: float = 95,
+        window: int = 100,
+        min_samples: int = 20,
+        min_delay: float = 0.5,
+        max_hedge_ratio: float = 0.1,
+        max_workers: int = 16,
+    ):
+        """
+        Sends a duplicate of a slow CMR page request, using whichever response arrives first.
+        Attach to an `ASFSession` (`ASFSession(request_hedger=RequestHedger())`) to hedge
+        the CMR search pages requested with that session (`get_page()`, used by `search()`,
+        `search_generator()` and `search_count()`). Asynchronous searches aren't hedged.
+
+        A request is hedged once it's been waiting longer than the `percentile` latency of
+        the last `window` successful requests. Hedging starts after `min_samples` requests
+        have completed, and is limited to `max_hedge_ratio` of all requests so a CMR slowdown
+        doesn't double the load on it. See `stats()` for how many requests were hedged.
+
+        Parameters
+        ----------
+        `percentile`:
+            The latency percentile (0-100) after which a duplicate request is sent.
+            Defaults to 95
+        `window`:
+            The number of recent request latencies the percentile is taken from.
+            Defaults to 100
+        `min_samples`:
+            The number of latencies to observe before hedging. Defaults to 20
+        `min_delay`:
+            The shortest time in seconds to wait before hedging. Defaults to 0.5 seconds
+        `max_hedge_ratio`:
+            The largest fraction of requests that can be hedged. Defaults to 0.1
+        `max_workers`:
+            The number of threads duplicate requests are sent from. Defaults to 16
+        """
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._executor = None
+        self._latencies = deque(maxlen=window)
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0}
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        :returns how long in seconds to wait for a response before hedging,
+        or `None` if not enough latencies have been observed yet
+        """
+        with self._lock:
+            if len(self._latencies) < max(1, self.min_samples):
+                return None
+
+            latencies = sorted(self._latencies)
+
+        idx = max(0, math.ceil(self.percentile / 100 * len(latencies)) - 1)
+        return max(self.min_delay, latencies[idx])
+
+    def record_latency(self, seconds: float) -> None:
+        """Adds a successful request's latency to the window"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def request(self, send: Callable[[], Response]) -> Response:
+        """
+        Calls `send`, calling it again if it hasn't returned within `hedge_delay()`
+
+        :returns the first response without a connection error or 5xx status,
+        or the original request's outcome if both fail
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            self._stats['requests'] += 1
+            can_hedge = (
+                delay is not None
+                and self._stats['hedged'] < self.max_hedge_ratio * self._stats['requests']
+            )
+
+        if not can_hedge:
+            return self._timed(send)
+
+        original = self._send_now(send)
+        done, _ = wait([original], timeout=delay)
+        if done:
+            return original.result()
+
+        with self._lock:
+            # another request may have used up the hedging budget while this one waited
+            if self._stats['hedged'] >= self.max_hedge_ratio * self._stats['requests']:
+                can_hedge = False
+            else:
+                self._stats['hedged'] += 1
+
+        if not can_hedge:
+            return original.result()
+
+        ASF_LOGGER.debug(f'HEDGE: no response after {delay:.2f}s, sending duplicate request')
+        hedge = self._get_executor().submit(self._timed, send)
+
+        pending = {original, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if self._succeeded(future)), None)
+            if winner is not None:
+                break
+        else:
+            winner = original
+
+        for future in {original, hedge} - {winner}:
+            future.add_done_callback(self._close_response)
+
+        if winner is hedge:
+            with self._lock:
+                self._stats['hedge_wins'] += 1
+
+        return winner.result()
+
+    def stats(self) -> Dict:
+        """
+        :returns the number of requests made, how many were hedged,
+        how many of those the duplicate request answered first,
+        and the current hedging delay (`None` until `min_samples` latencies are observed)
+        """
+        with self._lock:
+            stats = {**self._stats}
+
+        return {**stats, 'hedge_delay': self.hedge_delay()}
+
+    def _timed(self, send: Callable[[], Response]) -> Response:
+        perf = time.monotonic()
+        response = send()
+        if response.status_code < 500:
+            self.record_latency(time.monotonic() - perf)
+
+        return response
+
+    def _send_now(self, send: Callable[[], Response]) -> Future:
+        """
+        Sends a request from a thread of its own, so it's never queued behind other
+        requests and the hedging delay starts when it's sent
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def run():
+            try:
+                future.set_result(self._timed(send))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name='asf_search_request', daemon=True).start()
+        return future
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='asf_search_hedge'
+                )
+
+            return self._executor
+
+    @staticmethod
+    def _succeeded(future: Future) -> bool:
+        return future.exception() is None and future.result().status_code < 500
+
+    @staticmethod
+    def _close_response(future: Future) -> None:
+        if future.exception() is None:
+            future.result().close()
+
+    # The lock and threads can't be pickled, multi-processing copies of a session get their own
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        state['_executor'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,16 +1,78 @@
-from typing import List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
 import itertools
-from copy import copy
 
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.constants import CMR_PAGE_SIZE
-from asf_search.CMR.datasets import (
-    collections_by_processing_level,
-    collections_per_platform,
-    get_concept_id_alias,
-    get_dataset_concept_ids,
+from asf_search.CMR.datasets import get_collection_registry
+from asf_search.CMR.field_map import field_map
+
+# CMR ANDs every attribute[] in a request, unless options[attribute][or] is set for all of them
+attribute_param_names = frozenset(
+    key for key, field in field_map.items() if field['key'] == 'attribute[]'
 )
-from numpy import intersect1d, union1d
+# integer parameters CMR accepts inclusive ranges for
+int_range_param_names = frozenset(['absoluteOrbit', 'asfFrame', 'frame', 'relativeOrbit'])
+# range parameters are joined into a single value when translated, so can't be OR'd as lists
+range_param_names = frozenset([*int_range_param_names, 'offNadirAngle'])
+
+
+class SubqueryPlan:
+    def __init__(
+        self,
+        subqueries: List[ASFSearchOptions],
+        split_params: Dict[str, list],
+        merged_params: Dict[str, str],
+        list_params: Dict[str, list],
+        divided_params: Dict[str, str] = None,
+    ):
+        """
+        The subqueries a search is split into, see `plan_subqueries()`
+
+        :param subqueries: the subqueries, one CMR query each
+        :param split_params: parameters with one value per subquery, by their values
+        :param merged_params: parameters whose values were combined, by how they were combined
+        :param list_params: parameters sent to CMR as multi-valued parameters, by their values
+        :param divided_params: parameters each subquery's value was divided between
+        several subqueries by (`spatialTiles`, `temporalShards`), by how they were divided
+        """
+        self.subqueries = subqueries
+        self.split_params = split_params
+        self.merged_params = merged_params
+        self.list_params = list_params
+        self.divided_params = {} if divided_params is None else divided_params
+
+    def __len__(self):
+        return len(self.subqueries)
+
+    def explain(self) -> str:
+        """:returns a description of the plan, and the split parameter values of each subquery"""
+        lines = [f'{len(self.subqueries)} subquer{"y" if len(self.subqueries) == 1 else "ies"}']
+
+        if self.merged_params:
+            lines.append('  merged:')
+            lines.extend(f'    {key}: {how}' for key, how in self.merged_params.items())
+
+        split_params = {key: vals for key, vals in self.split_params.items() if len(vals) > 1}
+        if split_params:
+            lines.append('  split, one subquery per combination of:')
+            lines.extend(f'    {key}: {len(vals)} values' for key, vals in split_params.items())
+
+        if self.divided_params:
+            lines.append('  divided between subqueries:')
+            lines.extend(f'    {key}: {how}' for key, how in self.divided_params.items())
+
+        if self.list_params:
+            lines.append('  sent as multi-valued CMR parameters:')
+            for key, vals in self.list_params.items():
+                count = len(vals) if isinstance(vals, list) else 1
+                lines.append(f'    {key}: {count} value{"" if count == 1 else "s"}')
+
+        if split_params:
+            for idx, subquery in enumerate(self.subqueries):
+                values = ', '.join(f'{key}={getattr(subquery, key)}' for key in split_params)
+                lines.append(f'  subquery {idx + 1}: {values}')
+
+        return '\n'.join(lines)
 
 
 def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
@@ -21,6 +83,26 @@ def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
     :param opts: The search options to split into sub-queries
     :return list: A list of ASFSearchOptions objects
     """
+    return plan_subqueries(opts).subqueries
+
+
+def plan_subqueries(opts: ASFSearchOptions, collapse: bool = None) -> SubqueryPlan:
+    """
+    Plans the subqueries for a search, splitting list parameters CMR can't match
+    as multi-valued parameters into the cartesian product of their values
+
+    With `collapse` set (defaults to `opts.collapseSubqueries`), fewer subqueries are built
+    where CMR can match the same granules in one query:
+    - consecutive integers of range parameters (like `relativeOrbit`) become ranges
+    - when a request's only attribute parameter (like `beamMode`) has several values,
+    they're sent in one request with `options[attribute][or]`
+
+    :param opts: The search options to split into sub-queries
+    :return SubqueryPlan: the subqueries, and how each parameter was planned
+    """
+    if collapse is None:
+        collapse = opts.collapseSubqueries
+
     params = dict(opts)
 
     # Break out two big list offenders into manageable chunks
@@ -41,23 +123,106 @@ def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
     ]  # these parameters will dodge the subquery system
     skip_param_names = [
         'maxResults',
+        'maxWorkers',
+        'asCompleted',
+        'prefetchDepth',
+        'streamPages',
+        'lazyProducts',
+        'parseWorkers',
+        'adaptivePageSize',
+        'collapseSubqueries',
+        'temporalShards',
+        'balanceShards',
+        'spatialTiles',
+        'sortedStream',
+        'dropDuplicates',
+        'duplicateBloomCapacity',
+        'checkpoint',
+        'resumeFromCheckpoint',
     ]  # these params exist in opts, but shouldn't be passed on to subqueries at ALL
 
     collections, aliased_keywords = get_keyword_concept_ids(params, opts.collectionAlias)
-    params['collections'] = list(union1d(collections, params.get('collections', [])))
+    params['collections'] = sorted(set(collections).union(params.get('collections', [])))
 
     for keyword in [*skip_param_names, *aliased_keywords]:
         params.pop(keyword, None)
 
+    merged_params, or_params = {}, []
+    if collapse:
+        merged_params, or_params = _collapse_params(params)
+
     subquery_params, list_params = {}, {}
     for key, value in params.items():
-        if key in list_param_names:
+        if key in list_param_names or key in or_params:
             list_params[key] = value
         else:
             subquery_params[key] = value
 
+    if or_params:
+        list_params['cmr_keywords'] = [
+            *list_params.get('cmr_keywords', []),
+            ('options[attribute][or]', 'true'),
+        ]
+
     sub_queries = cartesian_product(subquery_params)
-    return [_build_subquery(query, opts, list_params) for query in sub_queries]
+    return SubqueryPlan(
+        [_build_subquery(query, opts, list_params) for query in sub_queries],
+        {
+            key: value if isinstance(value, list) else [value]
+            for key, value in subquery_params.items()
+        },
+        merged_params,
+        {key: value for key, value in list_params.items() if value},
+    )
+
+
+def _collapse_params(params: dict) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Rewrites `params` to need fewer subqueries, see `plan_subqueries()`
+
+    :returns how each collapsed parameter was combined, by parameter name,
+    and the parameters to send whole in every subquery with `options[attribute][or]`
+    """
+    merged_params, or_params = {}, []
+
+    for key in int_range_param_names.intersection(params):
+        values = params[key]
+        if not isinstance(values, list):
+            continue
+
+        collapsed = _collapse_int_ranges(values)
+        if len(collapsed) < len(values):
+            merged_params[key] = f'{len(values)} values collapsed into {len(collapsed)} ranges'
+            params[key] = collapsed
+
+    custom_keys = [keyword[0] for keyword in params.get('cmr_keywords', [])]
+    attribute_params = attribute_param_names.intersection(params)
+    if len(attribute_params) == 1 and not any(
+        key == 'attribute[]' or key.startswith('options[attribute]') for key in custom_keys
+    ):
+        key = next(iter(attribute_params))
+        values = params[key]
+        if key not in range_param_names and isinstance(values, list) and len(values) > 1:
+            merged_params[key] = f"{len(values)} values OR'd in each subquery"
+            or_params.append(key)
+
+    return merged_params, or_params
+
+
+def _collapse_int_ranges(values: List) -> List:
+    """
+    Collapses runs of consecutive integers into inclusive `(min, max)` ranges,
+    keeping any ranges already given as they are
+    """
+    ints = sorted({value for value in values if isinstance(value, int)})
+    ranges = [value for value in values if not isinstance(value, int)]
+
+    collapsed = []
+    for _, run in itertools.groupby(enumerate(ints), key=lambda pair: pair[1] - pair[0]):
+        run = [value for _, value in run]
+        collapsed.append(run[0] if len(run) == 1 else (run[0], run[-1]))
+
+    return [*collapsed, *ranges]
 
 
 def _build_subquery(
@@ -76,7 +241,8 @@ def _build_subquery(
 
     q['provider'] = opts.provider
     q['host'] = opts.host
-    q['session'] = copy(opts.session)
+    # every subquery shares the search's session, and with it the session's connection pools
+    q['session'] = opts.session
 
     return ASFSearchOptions(**q, **list_params)
 
@@ -94,21 +260,22 @@ def get_keyword_concept_ids(params: dict, use_collection_alias: bool = True) ->
         - list of concept-ids for dataset, platform, and processingLevel
         - list of aliased keywords to remove from final parameters
     """
-    collections = []
+    registry = get_collection_registry()
+    collections = frozenset()
     aliased_keywords = []
 
     if use_collection_alias:
         if 'processingLevel' in params.keys():
-            collections = get_concept_id_alias(
-                params.get('processingLevel'), collections_by_processing_level
+            collections = registry.get_concept_id_alias(
+                params.get('processingLevel'), registry.processing_level_concept_ids
             )
             if len(collections):
                 aliased_keywords.append('processingLevel')
 
         if 'platform' in params.keys():
-            platform_concept_ids = get_concept_id_alias(
+            platform_concept_ids = registry.get_concept_id_alias(
                 [platform.upper() for platform in params.get('platform')],
-                collections_per_platform,
+                registry.platform_concept_ids,
             )
             if len(platform_concept_ids):
                 aliased_keywords.append('platform')
@@ -116,19 +283,21 @@ def get_keyword_concept_ids(params: dict, use_collection_alias: bool = True) ->
 
     if 'dataset' in params.keys():
         aliased_keywords.append('dataset')
-        dataset_concept_ids = get_dataset_concept_ids(params.get('dataset'))
+        dataset_concept_ids = registry.get_dataset_concept_ids(params.get('dataset'))
         collections = _get_intersection(dataset_concept_ids, collections)
 
-    return collections, aliased_keywords
+    return sorted(collections), aliased_keywords
 
 
-def _get_intersection(keyword_concept_ids: List[str], intersecting_ids: List[str]) -> List[str]:
+def _get_intersection(
+    keyword_concept_ids: FrozenSet[str], intersecting_ids: FrozenSet[str]
+) -> FrozenSet[str]:
     """
-    Returns the intersection between two lists. If the second list is empty the first list
+    Returns the intersection between two sets. If the second set is empty the first set
     is return unchaged
     """
     if len(intersecting_ids):
-        return list(intersect1d(intersecting_ids, keyword_concept_ids))
+        return intersecting_ids & keyword_concept_ids
 
     return keyword_concept_ids
 
@@ -0,0 +1,202 @@
+import math
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from asf_search import ASF_LOGGER
+from asf_search.exceptions import ASFCircuitOpenError
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = None,
+        hosts: Dict[str, Tuple[float, Optional[int]]] = None,
+    ):
+        """
+        A token bucket rate limiter, with one bucket per host.
+        Attach to an `ASFSession` (`ASFSession(rate_limiter=RateLimiter())`) to limit the
+        CMR requests made with that session. The same `RateLimiter` can be attached to
+        several sessions, and is shared by every thread making requests with them,
+        so the limit applies to all of them together.
+
+        Requests that would exceed the limit wait for a token rather than failing,
+        and are let through in the order they asked for one.
+
+        Parameters
+        ----------
+        `rate`:
+            The sustained number of requests per second allowed to each host. Defaults to 5
+        `burst`:
+            The number of requests that can be made at once after a host has been idle.
+            Defaults to `rate` rounded up
+        `hosts`:
+            `(rate, burst)` limits for specific hosts, overriding `rate` and `burst`
+        """
+        self.rate = rate
+        self.burst = burst
+        self.hosts = {} if hosts is None else dict(hosts)
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, list] = {}
+
+    def set_limit(self, host: str, rate: float, burst: int = None) -> None:
+        """Sets the rate and burst limit for a single host"""
+        with self._lock:
+            self.hosts[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def get_limit(self, host: str) -> Tuple[float, int]:
+        """:returns the `(rate, burst)` limit for `host`"""
+        rate, burst = self.hosts.get(host, (self.rate, self.burst))
+        return rate, max(1, math.ceil(rate)) if burst is None else burst
+
+    def reserve(self, host: str) -> float:
+        """
+        Takes a token from `host`'s bucket
+
+        :returns the number of seconds to wait before the token can be used
+        """
+        rate, burst = self.get_limit(host)
+        now = time.monotonic()
+        with self._lock:
+            # [available tokens, last refill time], tokens go negative as requests queue up
+            bucket = self._buckets.setdefault(host, [float(burst), now])
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            bucket[0] -= 1
+
+            return max(0.0, -bucket[0] / rate)
+
+    def acquire(self, host: str) -> float:
+        """
+        Blocks until a request can be made to `host`
+
+        :returns the number of seconds waited
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            ASF_LOGGER.debug(f'RATE LIMIT: waiting {delay:.2f}s for {host}')
+            time.sleep(delay)
+
+        return delay
+
+    def pause(self, host: str, seconds: float) -> None:
+        """
+        Stops handing out tokens for `host` for `seconds`,
+        for example when the host has asked clients to back off (HTTP 429, `Retry-After`)
+        """
+        rate, burst = self.get_limit(host)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(host, [float(burst), now])
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            bucket[0] = min(bucket[0], -seconds * rate)
+
+    # The lock can't be pickled, multi-processing copies of a session get their own
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        A circuit breaker, tracked separately for each host.
+        Attach to an `ASFSession` (`ASFSession(circuit_breaker=CircuitBreaker())`) to stop
+        the CMR requests made with that session once a host keeps failing, instead of
+        every search worker retrying against it.
+
+        After `failure_threshold` failed requests in a row (connection errors, timeouts,
+        HTTP 429 and 5xx responses) the host's circuit opens, and requests to it raise
+        `ASFCircuitOpenError` without being sent. After `reset_timeout` seconds a single
+        request is let through, closing the circuit again if it succeeds.
+
+        Parameters
+        ----------
+        `failure_threshold`:
+            The number of consecutive failures that opens a host's circuit. Defaults to 5
+        `reset_timeout`:
+            How long in seconds a circuit stays open before a request is let through
+            to test the host. Defaults to 30 seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        # host -> [state, consecutive failures, time the circuit opened or was last tested]
+        self._circuits: Dict[str, list] = {}
+
+    def state(self, host: str) -> str:
+        """:returns the state of `host`'s circuit, `'closed'`, `'open'` or `'half-open'`"""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return self.CLOSED if circuit is None else circuit[0]
+
+    def before_request(self, host: str) -> None:
+        """Raises `ASFCircuitOpenError` if a request to `host` shouldn't be sent"""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit[0] == self.CLOSED:
+                return
+
+            now = time.monotonic()
+            remaining = circuit[2] + self.reset_timeout - now
+            if remaining <= 0:
+                # let this request test the host, others are turned away until it finishes,
+                # or until another `reset_timeout` passes without it finishing
+                circuit[0] = self.HALF_OPEN
+                circuit[2] = now
+                return
+
+        raise ASFCircuitOpenError(
+            f'Requests to {host} are paused after {self.failure_threshold} consecutive '
+            f'failures, retry in {max(0.0, remaining):.0f}s'
+        )
+
+    def record_success(self, host: str) -> None:
+        """Closes `host`'s circuit"""
+        with self._lock:
+            self._circuits.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        """Counts a failed request to `host`, opening its circuit at `failure_threshold`"""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, [self.CLOSED, 0, 0.0])
+            circuit[1] += 1
+            if circuit[0] == self.HALF_OPEN or circuit[1] >= self.failure_threshold:
+                if circuit[0] != self.OPEN:
+                    ASF_LOGGER.warning(
+                        f'CIRCUIT BREAKER: pausing requests to {host} for {self.reset_timeout}s '
+                        f'after {circuit[1]} consecutive failures'
+                    )
+                circuit[0] = self.OPEN
+                circuit[2] = time.monotonic()
+
+    def reset(self, host: str = None) -> None:
+        """Closes `host`'s circuit, or every circuit if no host is given"""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,14 +1,13 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from asf_search.ASFSearchOptions import ASFSearchOptions
-from asf_search.CMR.datasets import get_concept_id_alias
+from asf_search.CMR.datasets import get_collection_registry
 from asf_search.constants import CMR_PAGE_SIZE
 import re
 from shapely import wkt
 from shapely.geometry import Polygon
 from shapely.geometry.base import BaseGeometry
 from .field_map import field_map
-from .datasets import collections_per_platform
 import logging
 
 try:
@@ -115,18 +114,14 @@ def fix_cmr_shapes(fixed_params: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def should_use_asf_frame(cmr_opts):
-    asf_frame_platforms = ['SENTINEL-1A', 'SENTINEL-1B', 'ALOS']
-
-    asf_frame_collections = get_concept_id_alias(asf_frame_platforms, collections_per_platform)
+    registry = get_collection_registry()
 
     return any(
-        [
-            p[0] == 'platform[]'
-            and p[1].upper() in asf_frame_platforms
-            or p[0] == 'echo_collection_id[]'
-            and p[1] in asf_frame_collections
-            for p in cmr_opts
-        ]
+        p[0] == 'platform[]'
+        and p[1].upper() in registry.asf_frame_platforms
+        or p[0] == 'echo_collection_id[]'
+        and p[1] in registry.asf_frame_concept_ids
+        for p in cmr_opts
     )
 
 
@@ -19,5 +19,5 @@ class AIRSARProduct(ASFProduct):
         'md5sum': {'path': ['AdditionalAttributes', ('Name', 'MD5SUM'), 'Values', 0]},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
+    def __init__(self, args: Dict = {}, session: ASFSession = None):
         super().__init__(args, session)
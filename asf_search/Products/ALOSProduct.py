@@ -1,5 +1,5 @@
-from typing import Dict, Union
-from asf_search import ASFSession, ASFStackableProduct
+from typing import Union
+from asf_search import ASFStackableProduct
 from asf_search.CMR.translate import try_parse_float, try_parse_int, try_round_float
 from asf_search.constants import PRODUCT_TYPE
 
@@ -33,8 +33,8 @@ class ALOSProduct(ASFStackableProduct):
         'beamModeType': {'path': ['AdditionalAttributes', ('Name', 'BEAM_MODE_TYPE'), 'Values', 0]},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
+    def _init_properties(self):
+        super()._init_properties()
 
         if self.properties.get('groupID') is None:
             self.properties['groupID'] = self.properties['sceneName']
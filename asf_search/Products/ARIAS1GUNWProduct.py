@@ -1,5 +1,4 @@
 from typing import Dict
-from asf_search import ASFSession
 from asf_search.ASFProduct import ASFProduct
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.Products import S1Product
@@ -30,8 +29,8 @@ class ARIAS1GUNWProduct(S1Product):
         'ariaVersion': {'path': ['AdditionalAttributes', ('Name', 'VERSION'), 'Values', 0]},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
+    def _init_properties(self):
+        super()._init_properties()
         self.properties['orbit'] = [orbit['OrbitNumber'] for orbit in self.properties['orbit']]
 
         urls = self.umm_get(self.umm, 'RelatedUrls', ('Type', [('USE SERVICE API', 'URL')]), 0)
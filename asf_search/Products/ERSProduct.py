@@ -25,7 +25,7 @@ class ERSProduct(ASFStackableProduct):
         'insarStackId': {'path': ['AdditionalAttributes', ('Name', 'INSAR_STACK_ID'), 'Values', 0]},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
+    def __init__(self, args: Dict = {}, session: ASFSession = None):
         super().__init__(args, session)
 
     @staticmethod
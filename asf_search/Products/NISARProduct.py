@@ -1,5 +1,5 @@
-from typing import Dict, Tuple, Union
-from asf_search import ASFSearchOptions, ASFSession, ASFStackableProduct
+from typing import Tuple, Union
+from asf_search import ASFSearchOptions, ASFStackableProduct
 
 
 class NISARProduct(ASFStackableProduct):
@@ -14,8 +14,8 @@ class NISARProduct(ASFStackableProduct):
         'pgeVersion': {'path': ['PGEVersionClass', 'PGEVersion']},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
+    def _init_properties(self):
+        super()._init_properties()
 
         self.properties['additionalUrls'] = self._get_additional_urls()
         self.properties['s3Urls'] = self._get_s3_uris()
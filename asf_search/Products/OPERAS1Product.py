@@ -1,5 +1,5 @@
 from typing import Dict, Tuple
-from asf_search import ASFSearchOptions, ASFSession
+from asf_search import ASFSearchOptions
 from asf_search.CMR.translate import try_parse_date
 from asf_search.Products import S1Product
 
@@ -42,10 +42,8 @@ class OPERAS1Product(S1Product):
         'C2803501758-ASF',
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
-
-        self.baseline = None
+    def _init_properties(self):
+        super()._init_properties()
 
         self.properties['beamMode'] = self.umm_get(
             self.umm, 'AdditionalAttributes', ('Name', 'BEAM_MODE'), 'Values', 0
@@ -104,6 +102,9 @@ class OPERAS1Product(S1Product):
     def is_valid_reference(self):
         return False
 
+    def _get_baseline(self) -> None:
+        return None
+
     def get_stack_opts(self, opts: ASFSearchOptions = None) -> ASFSearchOptions:
         """
         Build search options that can be used to find an insar stack for this product
@@ -19,7 +19,7 @@ class RADARSATProduct(ASFStackableProduct):
         'esaFrame': {'path': ['AdditionalAttributes', ('Name', 'CENTER_ESA_FRAME'), 'Values', 0], 'cast': try_parse_int},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
+    def __init__(self, args: Dict = {}, session: ASFSession = None):
         super().__init__(args, session)
 
     @staticmethod
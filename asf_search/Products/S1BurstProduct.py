@@ -1,6 +1,6 @@
 import copy
-from typing import Dict, Union
-from asf_search import ASFSearchOptions, ASFSession
+from typing import Union
+from asf_search import ASFSearchOptions
 from asf_search.Products import S1Product
 from asf_search.CMR.translate import try_parse_date
 from asf_search.CMR.translate import try_parse_int
@@ -34,8 +34,8 @@ class S1BurstProduct(S1Product):
         'azimuthAnxTime': {'path': ['AdditionalAttributes', ('Name', 'AZIMUTH_ANX_TIME'), 'Values', 0]},
     }
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
+    def _init_properties(self):
+        super()._init_properties()
         self.properties["sceneName"] = self.properties["fileID"]
 
         # Gathers burst properties into `burst` specific dict
@@ -1,6 +1,6 @@
 import copy
 from typing import Dict, List, Optional, Tuple
-from asf_search import ASFSearchOptions, ASFSession, ASFStackableProduct
+from asf_search import ASFSearchOptions, ASFStackableProduct
 from asf_search.CMR.translate import try_parse_date
 from asf_search.CMR.translate import try_parse_int
 from asf_search.constants import PLATFORM
@@ -32,14 +32,11 @@ class S1Product(ASFStackableProduct):
 
     baseline_type = ASFStackableProduct.BaselineCalcType.CALCULATED
 
-    def __init__(self, args: Dict = {}, session: ASFSession = ASFSession()):
-        super().__init__(args, session)
+    def _init_properties(self):
+        super()._init_properties()
 
         self.properties['s3Urls'] = self._get_s3_uris()
 
-        if self.has_baseline():
-            self.baseline = self.get_baseline_calc_properties()
-
     def has_baseline(self) -> bool:
         baseline = self.get_baseline_calc_properties()
 
@@ -2,7 +2,11 @@
 from importlib_metadata import PackageNotFoundError, version
 
 ## Setup logging now, so it's available if __version__ fails:
+import importlib
 import logging
+import sys
+import types
+
 ASF_LOGGER = logging.getLogger(__name__)
 # Add null handle so we do nothing by default. It's up to whatever
 # imports us, if they want logging.
@@ -29,30 +33,229 @@ ASF_LOGGER = logging.getLogger(__name__)
 # imports us, if they want logging.
 ASF_LOGGER.addHandler(logging.NullHandler())
 
-from .ASFSession import ASFSession  # noqa: F401, E402
-from .ASFProduct import ASFProduct  # noqa: F401 E402
-from .ASFStackableProduct import ASFStackableProduct  # noqa: F401 E402
-from .ASFSearchResults import ASFSearchResults  # noqa: F401 E402
-from .ASFSearchOptions import ASFSearchOptions, validators  # noqa: F401 E402
-from .Products import *  # noqa: F403 F401 E402
-from .exceptions import *  # noqa: F403 F401 E402
-from .constants import (  # noqa: F401 E402
-    BEAMMODE,  # noqa: F401 E402
-    FLIGHT_DIRECTION,  # noqa: F401 E402
-    INSTRUMENT,  # noqa: F401 E402
-    PLATFORM,  # noqa: F401 E402
-    POLARIZATION,  # noqa: F401 E402
-    PRODUCT_TYPE,  # noqa: F401 E402
-    INTERNAL,  # noqa: F401 E402
-    DATASET,  # noqa: F401 E402
-)
-from .health import *  # noqa: F403 F401 E402
-from .search import *  # noqa: F403 F401 E402
-from .download import *  # noqa: F403 F401 E402
-from .CMR import *  # noqa: F403 F401 E402
-from .baseline import *  # noqa: F403 F401 E402
-from .WKT import validate_wkt  # noqa: F401 E402
-from .export import *  # noqa: F403 F401 E402
+# Everything else is imported the first time it's accessed (PEP 562),
+# so `import asf_search` doesn't pay for shapely, numpy, dateparser etc. until they're needed
+_lazy_imports = {
+    'ASFSession': '.ASFSession',
+    'ASFProduct': '.ASFProduct',
+    'ASFStackableProduct': '.ASFStackableProduct',
+    'ASFSearchResults': '.ASFSearchResults',
+    'ASFSearchOptions': '.ASFSearchOptions',
+    'validators': '.ASFSearchOptions',
+    'ASFColumnarResults': '.ASFColumnarResults',
+    'ASFColumnarProduct': '.ASFColumnarResults',
+    **dict.fromkeys(
+        [
+            'S1Product',
+            'ALOSProduct',
+            'RADARSATProduct',
+            'AIRSARProduct',
+            'ERSProduct',
+            'JERSProduct',
+            'UAVSARProduct',
+            'SIRCProduct',
+            'SEASATProduct',
+            'SMAPProduct',
+            'S1BurstProduct',
+            'OPERAS1Product',
+            'ARIAS1GUNWProduct',
+            'NISARProduct',
+        ],
+        '.Products',
+    ),
+    **dict.fromkeys(
+        [
+            'ASFError',
+            'ASFSearchError',
+            'ASFSearch4xxError',
+            'ASFSearch429Error',
+            'ASFSearch5xxError',
+            'ASFCircuitOpenError',
+            'ASFBaselineError',
+            'ASFDownloadError',
+            'ASFAuthenticationError',
+            'ASFWKTError',
+            'CMRError',
+            'CMRConceptIDError',
+            'CMRIncompleteError',
+        ],
+        '.exceptions',
+    ),
+    **dict.fromkeys(
+        [
+            'BEAMMODE',
+            'FLIGHT_DIRECTION',
+            'INSTRUMENT',
+            'PLATFORM',
+            'POLARIZATION',
+            'PRODUCT_TYPE',
+            'INTERNAL',
+            'DATASET',
+        ],
+        '.constants',
+    ),
+    'health': '.health',
+    **dict.fromkeys(
+        [
+            'search',
+            'search_async',
+            'granule_search',
+            'product_search',
+            'product_search_async',
+            'geo_search',
+            'geo_search_async',
+            'stack_from_id',
+            'campaigns',
+            'search_count',
+            'search_count_async',
+            'search_count_breakdown',
+            'explain',
+            'search_estimate',
+            'SearchEstimate',
+            'BloomFilter',
+            'SearchCheckpoint',
+            'resume_search_generator',
+            'search_generator',
+            'search_generator_async',
+            'preprocess_opts',
+            'get_product_type',
+            'register_product_type',
+            'baseline_search',
+            'error_reporting',
+        ],
+        '.search',
+    ),
+    **dict.fromkeys(
+        ['download_urls', 'download_url', 'FileDownloadType', 'file_download_type', 'remotezip'],
+        '.download',
+    ),
+    **dict.fromkeys(
+        [
+            'get_campaigns',
+            'build_subqueries',
+            'plan_subqueries',
+            'SubqueryPlan',
+            'translate_opts',
+            'field_map',
+            'CMRCache',
+            'CountCache',
+            'RateLimiter',
+            'CircuitBreaker',
+            'RequestHedger',
+            'dataset_collections',
+            'collections_per_platform',
+            'collections_by_processing_level',
+            'get_concept_id_alias',
+            'get_dataset_concept_ids',
+            'CollectionRegistry',
+            'get_collection_registry',
+            # submodules re-exported by the `from .CMR import *` this package used to run
+            'MissionList',
+            'datasets',
+            'subquery',
+            'translate',
+        ],
+        '.CMR',
+    ),
+    **dict.fromkeys(
+        [
+            'calculate_perpendicular_baselines',
+            'get_granule_position',
+            'get_along_beam_vector',
+            'get_up_beam_vector',
+            'get_paired_granule_baseline',
+            'get_shared_sv_time',
+            'get_pos_at_rel_time',
+            'get_vel_at_rel_time',
+            'interpolate',
+            'radius_fix',
+            'get_baseline_from_stack',
+            'find_new_reference',
+            'check_reference',
+            'calculate_temporal_baselines',
+            'offset_perpendicular_baselines',
+            # names re-exported by the `from .baseline import *` this package used to run
+            'calc',
+            'stack',
+            'a',
+            'f',
+            'cos',
+            'sin',
+            'sqrt',
+            'radians',
+            'np',
+            'pytz',
+            'parse_datetime',
+            'List',
+            'Tuple',
+            'Union',
+        ],
+        '.baseline',
+    ),
+    'validate_wkt': '.WKT',
+    **dict.fromkeys(
+        [
+            'ASFSearchResults_to_properties_list',
+            'results_to_csv',
+            'results_to_metalink',
+            'results_to_kml',
+            'results_to_jsonlite',
+            'results_to_jsonlite2',
+            'results_to_geojson',
+            # submodules re-exported by the `from .export import *` this package used to run
+            'csv',
+            'export_translators',
+            'geojson',
+            'jsonlite',
+            'jsonlite2',
+            'kml',
+            'metalink',
+        ],
+        '.export',
+    ),
+}
+
+_lazy_submodules = [
+    'CMR',
+    'Products',
+    'WKT',
+    'baseline',
+    'constants',
+    'download',
+    'exceptions',
+    'export',
+]
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    elif name in _lazy_submodules:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_imports, *_lazy_submodules})
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value):
+        # Importing a submodule sets it as an attribute of this package, which would
+        # shadow classes named after their module (`asf_search.ASFProduct` etc.)
+        if name in _lazy_imports and getattr(value, '__name__', None) == f'{__name__}.{name}':
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+__all__ = ['ASF_LOGGER', 'REPORT_ERRORS'] + list(_lazy_imports)
 
 REPORT_ERRORS = True
 """Enables automatic search error reporting to ASF, send any questions to uso@asf.alaska.edu"""
@@ -8,6 +8,36 @@ CMR_COLLECTIONS = '/search/collections'
 CMR_COLLECTIONS_PATH = f'{CMR_COLLECTIONS}.{CMR_FORMAT_EXT}'
 CMR_HEALTH_PATH = '/search/health'
 CMR_PAGE_SIZE = 250
+
+# Page size bounds and targets for the `adaptivePageSize` search option
+CMR_MIN_PAGE_SIZE = 25
+CMR_MAX_PAGE_SIZE = 2000
+CMR_PAGE_TARGET_TIME = 5.0
+CMR_PAGE_MAX_BYTES = 16 * 1024 * 1024
+
+# Pages each concurrent subquery worker (`maxWorkers`) fetches ahead of the page being yielded
+# before it waits for the consumer
+SUBQUERY_PAGE_BUFFER = 4
+
+# Rough size of one granule's UMM in a CMR response, and the number of subqueries a search
+# can be split into before `search_estimate()` warns about it
+CMR_ITEM_BYTES_ESTIMATE = 12 * 1024
+SUBQUERY_WARNING_COUNT = 100
+
+# Shortest time window, in seconds, the `temporalShards` search option splits subqueries into,
+# and the number of windows per shard hits are counted in to balance them (`balanceShards`)
+TEMPORAL_SHARD_MIN_SECONDS = 24 * 60 * 60
+TEMPORAL_SHARD_SAMPLES = 4
+
+# Chance a product is wrongly dropped as a duplicate by a search's `duplicateBloomCapacity`
+# Bloom filter, until it holds more products than its capacity
+DUPLICATE_BLOOM_ERROR_RATE = 1e-6
+
+# Connection pool defaults for new ASFSession objects, see ASFSession.configure_pool()
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+HTTP_MAX_RETRIES = 0
+
 EDL_HOST = 'urs.earthdata.nasa.gov'
 EDL_CLIENT_ID = 'BO_n7nTIlMljdvU6kRRB3g'
 
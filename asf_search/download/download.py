@@ -1,3 +1,4 @@
+from copy import copy
 from typing import Iterable
 from multiprocessing import Pool
 import os.path
@@ -90,7 +91,10 @@ def remotezip(url: str, session: ASFSession) -> 'RemoteZip':  # type: ignore # n
             'Ex: `python3 -m pip install asf-search[extras]`'
         )
 
-    session.hooks['response'].append(strip_auth_if_aws)
+    # hook a shallow copy, sharing the session's connections and auth,
+    # rather than adding a hook to `session` for every remote zip opened with it
+    session = copy(session)
+    session.hooks = {**session.hooks, 'response': [*session.hooks['response'], strip_auth_if_aws]}
     return RemoteZip(url, session=session)
 
 
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class ASFError(Exception):
     """Base ASF Exception, not intended for direct use"""
 
@@ -10,10 +13,23 @@ class ASFSearch4xxError(ASFSearchError):
     """Raise when CMR returns a 4xx error"""
 
 
+class ASFSearch429Error(ASFSearch4xxError):
+    """Raise when CMR returns HTTP 429 (Too Many Requests)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # seconds to wait before retrying, `None` to back off as after a 5xx error
+        self.retry_after = retry_after
+
+
 class ASFSearch5xxError(ASFSearchError):
     """Raise when CMR returns a 5xx error"""
 
 
+class ASFCircuitOpenError(ASFSearchError):
+    """Raise when requests to a host are paused by an open `CircuitBreaker`"""
+
+
 class ASFBaselineError(ASFSearchError):
     """Raise when baseline related errors occur"""
 
@@ -1,13 +1,15 @@
 from types import FunctionType
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from asf_search import ASFSearchResults
+if TYPE_CHECKING:
+    from asf_search import ASFSearchResults
 
 
 # ASFProduct.properties don't have every property required of certain output formats,
 # This grabs the missing properties from ASFProduct.umm required by the given format
 def ASFSearchResults_to_properties_list(
-    results: ASFSearchResults, get_additional_fields: FunctionType
+    results: 'ASFSearchResults', get_additional_fields: FunctionType
 ):
     property_list = []
 
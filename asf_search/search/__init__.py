@@ -1,8 +1,21 @@
-from .search import search  # noqa: F401
+from .search import search, search_async  # noqa: F401
 from .granule_search import granule_search  # noqa: F401
-from .product_search import product_search  # noqa: F401
-from .geo_search import geo_search  # noqa: F401
+from .product_search import product_search, product_search_async  # noqa: F401
+from .geo_search import geo_search, geo_search_async  # noqa: F401
 from .baseline_search import stack_from_id  # noqa: F401
 from .campaigns import campaigns  # noqa: F401
-from .search_count import search_count  # noqa: F401
-from .search_generator import search_generator, preprocess_opts  # noqa: F401
+from .search_count import (  # noqa: F401
+    search_count,
+    search_count_async,
+    search_count_breakdown,
+)
+from .explain import explain, search_estimate, SearchEstimate  # noqa: F401
+from .duplicates import BloomFilter  # noqa: F401
+from .checkpoint import SearchCheckpoint, resume_search_generator  # noqa: F401
+from .search_generator import (  # noqa: F401
+    search_generator,
+    search_generator_async,
+    preprocess_opts,
+    get_product_type,
+    register_product_type,
+)
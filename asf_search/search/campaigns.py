@@ -1,14 +1,16 @@
 from typing import Dict, List, Union
+from asf_search.ASFSession import ASFSession
 from asf_search.CMR.MissionList import get_campaigns
 
 
-def campaigns(platform: str) -> List[str]:
+def campaigns(platform: str, session: ASFSession = None) -> List[str]:
     """
     Returns a list of campaign names for the given platform,
     each name being usable as a campaign for asf_search.search() and asf_search.geo_search()
 
     :param platform: The name of the platform to gather campaign names for.
     Platforms currently supported include UAVSAR, AIRSAR, and SENTINEL-1 INTERFEROGRAM (BETA)
+    :param session: The session to query CMR with, defaults to the default search session
 
     :return: A list of campaign names for the given platform
     """
@@ -26,7 +28,7 @@ def campaigns(platform: str) -> List[str]:
         else:
             data['platform[]'] = platform
 
-    missions = get_campaigns(data)
+    missions = get_campaigns(data, session)
     mission_names = _get_project_names(missions)
 
     return mission_names
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+from typing import Dict, Generator, Iterable, List, Optional, Set, Union
+
+from asf_search import ASF_LOGGER
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.ASFSearchResults import ASFSearchResults
+from asf_search.CMR import translate_opts
+from asf_search.search.duplicates import BloomFilter
+
+
+class SearchCheckpoint:
+    def __init__(
+        self,
+        path: str,
+        fingerprint: str,
+        subquery_idx: int = 0,
+        search_after: Optional[str] = None,
+        fetched: int = 0,
+        dropped: int = 0,
+        subquery_count: int = 0,
+        total: int = 0,
+        seen_count: int = 0,
+        complete: bool = False,
+    ):
+        """
+        A search's progress through its subqueries, saved to `path` by
+        `search_generator(checkpoint=...)` after each page and read back by
+        `resume_search_generator()`. A new checkpoint is the start of the search.
+
+        The CMR concept-id and revision-id of products a de-duplicating search
+        (`dropDuplicates` or `spatialTiles`) has returned are appended to `{path}.seen`
+
+        Parameters
+        ----------
+        `path`:
+            The file the checkpoint is saved to
+        `fingerprint`:
+            Identifies the subqueries the search is split into, see `search_fingerprint()`
+        `subquery_idx`:
+            The subquery the search continues from
+        `search_after`:
+            The CMR-Search-After header to request that subquery's next page with,
+            `None` to start from its first page
+        `fetched`:
+            The number of products fetched from CMR for that subquery so far
+        `dropped`:
+            The number of those products dropped by the subquery's temporal shard
+        `subquery_count`:
+            The number of those products already yielded or dropped as duplicates
+        `total`:
+            The number of products the search has yielded
+        `seen_count`:
+            The number of keys written to `{path}.seen` as of this checkpoint
+        `complete`:
+            Whether the search has finished
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.subquery_idx = subquery_idx
+        self.search_after = search_after
+        self.fetched = fetched
+        self.dropped = dropped
+        self.subquery_count = subquery_count
+        self.total = total
+        self.seen_count = seen_count
+        self.complete = complete
+
+    @property
+    def seen_path(self) -> str:
+        return f'{self.path}.seen'
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> 'SearchCheckpoint':
+        """
+        Reads the checkpoint saved to `path`
+
+        :raises ValueError: if the checkpoint was saved by a search with other subqueries
+        """
+        with open(path, 'r') as f:
+            state = json.load(f)
+
+        if state['fingerprint'] != fingerprint:
+            raise ValueError(
+                f'Checkpoint "{path}" was saved by a search with different subqueries. '
+                'Resume with the same search parameters, and a fixed `end` date '
+                'when using `temporalShards`'
+            )
+
+        return cls(path, **state)
+
+    def save(self) -> None:
+        """Writes the checkpoint to `path`, replacing the previous one in a single step"""
+        state = {
+            'fingerprint': self.fingerprint,
+            'subquery_idx': self.subquery_idx,
+            'search_after': self.search_after,
+            'fetched': self.fetched,
+            'dropped': self.dropped,
+            'subquery_count': self.subquery_count,
+            'total': self.total,
+            'seen_count': self.seen_count,
+            'complete': self.complete,
+        }
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)
+
+    def cursor(self) -> Dict:
+        """:returns where the checkpoint's subquery continues from, see `update()`"""
+        return {'search_after': self.search_after, 'fetched': self.fetched, 'dropped': self.dropped}
+
+    def update(
+        self,
+        subquery_idx: int,
+        cursor: Dict,
+        subquery_count: int,
+        total: int,
+        seen_keys: Iterable[str] = (),
+    ) -> None:
+        """
+        Moves the checkpoint past a page that's been yielded, and saves it
+
+        :param subquery_idx: the subquery the page is from
+        :param cursor: the subquery's `search_after`, `fetched` and `dropped` after the page,
+        a `search_after` of `None` meaning the subquery has no pages left
+        :param subquery_count: the subquery's products yielded or dropped as duplicates
+        :param total: the number of products the search has yielded
+        :param seen_keys: the duplicate keys first seen in the page
+        """
+        if cursor['search_after'] is None:
+            self.subquery_idx, self.subquery_count = subquery_idx + 1, 0
+            self.search_after, self.fetched, self.dropped = None, 0, 0
+        else:
+            self.subquery_idx, self.subquery_count = subquery_idx, subquery_count
+            self.search_after = cursor['search_after']
+            self.fetched, self.dropped = cursor['fetched'], cursor['dropped']
+
+        self.total = total
+        self._append_seen_keys(seen_keys)
+        self.save()
+
+    def finish(self) -> None:
+        """Marks the search as finished, and saves the checkpoint"""
+        self.complete = True
+        self.save()
+
+    def load_seen_keys(self, seen_keys: Union[Set[str], BloomFilter]) -> None:
+        """
+        Adds the keys written as of this checkpoint to `seen_keys`,
+        discarding any written after it
+        """
+        if self.seen_count == 0:
+            return
+
+        with open(self.seen_path, 'r') as f:
+            keys = [line.rstrip('\n') for _, line in zip(range(self.seen_count), f)]
+
+        for key in keys:
+            seen_keys.add(key)
+        self._write_seen_keys(keys, 'w')
+
+    def _append_seen_keys(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if len(keys):
+            # keys written after the last checkpoint are dropped, so a new search overwrites them
+            self._write_seen_keys(keys, 'a' if self.seen_count else 'w')
+            self.seen_count += len(keys)
+
+    def _write_seen_keys(self, keys: List[str], mode: str) -> None:
+        with open(self.seen_path, mode) as f:
+            f.writelines(f'{key}\n' for key in keys)
+
+
+def search_fingerprint(queries: List[ASFSearchOptions]) -> str:
+    """:returns a hash of the CMR keywords of every subquery, in order"""
+    translated = [translate_opts(query) for query in queries]
+    return hashlib.sha256(json.dumps(translated, default=str).encode('utf-8')).hexdigest()
+
+
+def resume_search_generator(
+    checkpoint: str, opts: ASFSearchOptions = None, **kwargs
+) -> Generator[ASFSearchResults, None, None]:
+    """
+    Continues a `search_generator()` search from the last page saved to its `checkpoint`,
+    yielding the pages an uninterrupted search would have yielded after it.
+    Starts the search from the beginning if no checkpoint has been saved yet,
+    and yields nothing if the search had already finished.
+
+    Accepts the same search parameters as `asf_search.search_generator()`, which must
+    describe the same search the checkpoint was saved by.
+
+    Parameters
+    ----------
+    checkpoint:
+        The checkpoint file passed to `search_generator(checkpoint=...)`
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+
+    Yields
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct, page by page)
+    """
+    # search_generator imports this module
+    from asf_search.search.search_generator import search_generator
+
+    resume = os.path.exists(checkpoint)
+    if not resume:
+        ASF_LOGGER.info(f'CHECKPOINT: "{checkpoint}" not found, starting search from the beginning')
+
+    yield from search_generator(
+        opts=opts, **kwargs, checkpoint=checkpoint, resumeFromCheckpoint=resume
+    )
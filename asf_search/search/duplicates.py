@@ -0,0 +1,92 @@
+import hashlib
+import math
+from typing import List, Optional, Set, Union
+
+from asf_search import ASF_LOGGER
+from asf_search.ASFProduct import ASFProduct
+from asf_search.constants import INTERNAL
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = None):
+        """
+        A fixed size, probabilistic set of strings, for remembering which products a
+        multi-million product search has already returned in bounded memory.
+        Attach to a search with the `duplicateBloomCapacity` search option.
+
+        Strings added are always found again, and strings never added are wrongly found
+        about `error_rate` of the time while no more than `capacity` strings have been added.
+
+        Parameters
+        ----------
+        `capacity`:
+            The number of strings the filter is sized for. Adding more raises the error rate
+        `error_rate`:
+            The chance a string never added is found, up to `capacity` strings.
+            Defaults to `INTERNAL.DUPLICATE_BLOOM_ERROR_RATE`
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = INTERNAL.DUPLICATE_BLOOM_ERROR_RATE if error_rate is None else error_rate
+
+        self.bit_count = math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.bit_count / self.capacity * math.log(2)))
+
+        self._bits = bytearray(math.ceil(self.bit_count / 8))
+        self._count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+        for idx in range(self.hash_count):
+            yield (first + idx * second) % self.bit_count
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+        self._count += 1
+        if self._count == self.capacity + 1:
+            ASF_LOGGER.warning(
+                f'BLOOM FILTER: more than {self.capacity} keys added, '
+                f'the error rate is now above {self.error_rate}'
+            )
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+    def __len__(self):
+        """:returns the number of keys added"""
+        return self._count
+
+
+def duplicate_key(product: ASFProduct) -> Optional[str]:
+    """
+    :returns the CMR concept-id and revision-id identifying `product`,
+    or `None` if it has no concept-id
+    """
+    concept_id = product.meta.get('concept-id') if product.meta else None
+    if concept_id is None:
+        return None
+
+    return f'{concept_id}:{product.meta.get("revision-id")}'
+
+
+def drop_duplicates(
+    items: List[ASFProduct], seen_keys: Union[Set[str], BloomFilter]
+) -> List[ASFProduct]:
+    """
+    :returns the products whose `duplicate_key()` isn't in `seen_keys` yet,
+    adding their keys to it
+    """
+    unique_items = []
+    for item in items:
+        key = duplicate_key(item)
+        if key is None:
+            unique_items.append(item)
+        elif key not in seen_keys:
+            seen_keys.add(key)
+            unique_items.append(item)
+
+    return unique_items
@@ -1,4 +1,4 @@
-from asf_search import ASFSearchOptions
+from asf_search import ASFSearchOptions, ASFSession
 from asf_search import INTERNAL
 import requests
 import logging
@@ -25,10 +25,20 @@ def report_search_error(search_options: ASFSearchOptions, message: str):
     message = f'Error Message: {str(message)}\nUser Agent: {user_agent} \
     \nSearch Options: {{\n{search_options_list}\n}}'
 
-    response = requests.post(
-        f'https://{INTERNAL.ERROR_REPORTING_ENDPOINT}',
-        data={'Message': f'This error message and info was automatically generated:\n\n{message}'},
-    )
+    # A new session with the search session's pool settings, but none of its EDL token
+    # or cookies (which are scoped to every asf.alaska.edu host, the report's included)
+    session = search_options.session
+    with ASFSession(
+        pool_connections=getattr(session, 'pool_connections', None),
+        pool_maxsize=getattr(session, 'pool_maxsize', None),
+        max_retries=getattr(session, 'max_retries', None),
+    ) as report_session:
+        response = report_session.post(
+            f'https://{INTERNAL.ERROR_REPORTING_ENDPOINT}',
+            data={
+                'Message': f'This error message and info was automatically generated:\n\n{message}'
+            },
+        )
 
     try:
         response.raise_for_status()
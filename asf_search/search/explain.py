@@ -0,0 +1,166 @@
+import math
+from typing import List, Optional
+
+from asf_search import ASF_LOGGER, INTERNAL
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.CMR.subquery import SubqueryPlan, plan_subqueries
+from asf_search.CMR.translate import translate_opts
+from asf_search.search.search_count import _get_subquery_counts
+from asf_search.search.search_generator import _build_search_opts
+from asf_search.search.spatial_tiles import tile_subqueries
+from asf_search.search.temporal_shards import shard_subqueries
+
+
+def explain(opts: ASFSearchOptions = None, **kwargs) -> str:
+    """
+    Describes the CMR subqueries a search would be split into, without querying CMR.
+    Accepts the same search parameters as `asf_search.search()` as keyword arguments,
+    set `collapseSubqueries=True` to see how the subqueries would be merged.
+
+    Subqueries divided by `spatialTiles` and `temporalShards` are included. With
+    `balanceShards`, the time windows are described as if evenly sized, since balancing
+    them needs CMR hit counts.
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+
+    Returns
+    -------
+    A description of the subqueries, and how each parameter is split between them
+    """
+    opts, _ = _build_search_opts(opts, kwargs)
+    return _plan_search(opts, balance_shards=False).explain()
+
+
+def _plan_search(opts: ASFSearchOptions, balance_shards: bool = None) -> SubqueryPlan:
+    """
+    Plans the subqueries `search_generator()` runs for `opts`,
+    dividing them by `spatialTiles` and `temporalShards` the same way
+
+    :param balance_shards: overrides `opts.balanceShards`
+    """
+    plan = plan_subqueries(opts)
+    if opts.spatialTiles <= 1 and opts.temporalShards <= 1:
+        return plan
+
+    queries = plan.subqueries
+    divided_params = {}
+    if opts.spatialTiles > 1:
+        queries = tile_subqueries(queries, opts.spatialTiles)
+        divided_params['intersectsWith'] = f'up to {opts.spatialTiles} spatial tiles'
+
+    if opts.temporalShards > 1:
+        balance = opts.balanceShards if balance_shards is None else balance_shards
+        queries, _ = shard_subqueries(queries, opts.temporalShards, balance, opts)
+        divided_params['start/end'] = (
+            f'up to {opts.temporalShards} {"balanced" if balance else "even"} time windows'
+        )
+
+    return SubqueryPlan(
+        queries, plan.split_params, plan.merged_params, plan.list_params, divided_params
+    )
+
+
+class SearchEstimate:
+    def __init__(
+        self,
+        plan: SubqueryPlan,
+        hits: List[int],
+        max_results: Optional[int] = None,
+        page_size: int = None,
+    ):
+        """
+        The cost of running a search, see `search_estimate()`
+
+        :param plan: the subqueries the search is split into
+        :param hits: the number of CMR hits of each subquery
+        :param max_results: the search's `maxResults`, if limited
+        :param page_size: the number of products per CMR page,
+        defaults to `INTERNAL.CMR_PAGE_SIZE`
+        """
+        self.plan = plan
+        self.subqueries = plan.subqueries
+        self.translated_opts = [translate_opts(query) for query in plan.subqueries]
+        self.hits = hits
+        self.max_results = max_results
+        self.page_size = INTERNAL.CMR_PAGE_SIZE if page_size is None else page_size
+
+        # subqueries are searched in order, later ones aren't needed once maxResults is reached
+        self.pages = []
+        remaining = max_results
+        for subquery_hits in hits:
+            if remaining is not None and remaining <= 0:
+                self.pages.append(0)
+                continue
+
+            wanted = subquery_hits if remaining is None else min(subquery_hits, remaining)
+            self.pages.append(max(1, math.ceil(wanted / self.page_size)))
+            if remaining is not None:
+                remaining -= wanted
+
+        self.total_hits = sum(hits)
+        self.results = self.total_hits if max_results is None else min(self.total_hits, max_results)
+        self.requests = sum(self.pages)
+        self.bytes = self.results * INTERNAL.CMR_ITEM_BYTES_ESTIMATE
+
+        self.warnings = []
+        if len(self.subqueries) > INTERNAL.SUBQUERY_WARNING_COUNT:
+            self.warnings.append(
+                f'Search is split into {len(self.subqueries)} subqueries, more than '
+                f'{INTERNAL.SUBQUERY_WARNING_COUNT}. Consider fewer list parameter values, '
+                'or `collapseSubqueries=True`'
+            )
+
+    def __len__(self):
+        return len(self.subqueries)
+
+    def __str__(self):
+        lines = [
+            self.plan.explain(),
+            f'{self.total_hits} CMR hits'
+            + (f', limited to {self.results} results' if self.results < self.total_hits else ''),
+            f'{self.requests} page requests of up to {self.page_size} products',
+            f'~{self.bytes / (1024 * 1024):.1f} MiB of UMM',
+            *(f'WARNING: {warning}' for warning in self.warnings),
+        ]
+        return '\n'.join(lines)
+
+
+def search_estimate(opts: ASFSearchOptions = None, **kwargs) -> SearchEstimate:
+    """
+    Estimates the cost of a search before running it: the subqueries it's split into,
+    each subquery's hit count, and the number of CMR page requests and bytes needed
+    to fetch the results. Accepts the same search parameters as `asf_search.search()`
+    as keyword arguments, including `maxResults`.
+
+    Hit counts are requested with `page_size=0`, one request per subquery, sent at once
+    like `search_count()`'s. Sizes are rough, based on `INTERNAL.CMR_ITEM_BYTES_ESTIMATE`
+    bytes per product and pages of `INTERNAL.CMR_PAGE_SIZE` products.
+    A warning is logged, and kept in `SearchEstimate.warnings`, when the search is split
+    into more than `INTERNAL.SUBQUERY_WARNING_COUNT` subqueries.
+
+    Subqueries divided by `spatialTiles` and `temporalShards` are estimated separately.
+    Granules overlapping several tiles or time windows are counted by each of them,
+    so hits can be higher than the number of results the search returns.
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+
+    Returns
+    -------
+    A `SearchEstimate`, printable as a summary
+    """
+    opts, max_results = _build_search_opts(opts, kwargs)
+    plan = _plan_search(opts)
+
+    estimate = SearchEstimate(plan, _get_subquery_counts(opts, plan.subqueries), max_results)
+    for warning in estimate.warnings:
+        ASF_LOGGER.warning(f'SEARCH ESTIMATE: {warning}')
+
+    return estimate
@@ -3,6 +3,7 @@ import datetime
 from copy import copy
 
 from asf_search.search import search
+from asf_search.search.search import search_async
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.ASFSearchResults import ASFSearchResults
 
@@ -54,6 +55,8 @@ def geo_search(
     shortName: Union[str, Sequence[str]] = None,
     cmr_keywords: Union[Tuple[str, str], Sequence[Tuple[str, str]]] = None,
     maxResults: int = None,
+    maxWorkers: int = None,
+    spatialTiles: int = None,
     opts: ASFSearchOptions = None,
 ) -> ASFSearchResults:
     """
@@ -147,6 +150,15 @@ def geo_search(
         used for Sentinel-1 Interferogram (BETA)
     maxResults:
         The maximum number of results to be returned by the search
+    maxWorkers:
+        The number of subqueries to run at once, see `asf_search.search()`.
+        Defaults to 1 (subqueries run one after another)
+    spatialTiles:
+        Split a polygon `intersectsWith` AOI along a longitude/latitude grid of about this
+        many tiles, searched as separate subqueries, so large AOIs can be fetched in parallel
+        with `maxWorkers`. Granules overlapping several tiles are returned once, by the first
+        tile that finds them, and results are found tile by tile, so with `maxResults` set
+        they're the first found rather than the latest. Defaults to 0 (not split)
     opts:
         An ASFSearchOptions object describing the search parameters to be used.
         Search parameters specified outside this object will override in event of a conflict.
@@ -163,3 +175,32 @@ def geo_search(
     opts.merge_args(**data)
 
     return search(opts=opts)
+
+
+async def geo_search_async(
+    intersectsWith: str = None,
+    opts: ASFSearchOptions = None,
+    client: 'aiohttp.ClientSession' = None,  # type: ignore # noqa: F821
+    **kwargs,
+) -> ASFSearchResults:
+    """
+    Asynchronous counterpart to `asf_search.geo_search()`.
+    Accepts the same search parameters as `geo_search()` as keyword arguments.
+
+    Parameters
+    ----------
+    intersectsWith:
+        Search by polygon, linestring,
+        or point defined in 2D Well-Known Text (WKT)
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    client:
+        The `aiohttp.ClientSession` used to query CMR.
+        Defaults to a new client that is closed once the search finishes.
+
+    Returns
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct)
+    """
+    return await search_async(opts=opts, client=client, intersectsWith=intersectsWith, **kwargs)
@@ -0,0 +1,93 @@
+from typing import List, Optional
+
+from asf_search import ASF_LOGGER
+from asf_search.constants import INTERNAL
+
+
+class PageSizer:
+    def __init__(
+        self,
+        adaptive: bool = False,
+        page_size: int = None,
+        min_page_size: int = None,
+        max_page_size: int = None,
+        target_time: float = None,
+        max_bytes: int = None,
+    ):
+        """
+        Chooses the `page_size` of each CMR page requested for a subquery.
+
+        Pages are never larger than the number of results still wanted (see `next_page_size()`).
+        With `adaptive` set, the page size is also moved towards the number of items CMR can
+        return in `target_time` seconds and `max_bytes` bytes, based on the pages seen so far.
+
+        Defaults are read from `asf_search.constants.INTERNAL` when the sizer is created:
+        `page_size` from `CMR_PAGE_SIZE`, `min_page_size` from `CMR_MIN_PAGE_SIZE`,
+        `max_page_size` from `CMR_MAX_PAGE_SIZE`, `target_time` from `CMR_PAGE_TARGET_TIME`
+        and `max_bytes` from `CMR_PAGE_MAX_BYTES`
+        """
+        self.adaptive = adaptive
+        self.page_size = INTERNAL.CMR_PAGE_SIZE if page_size is None else page_size
+        self.max_page_size = (
+            max(self.page_size, INTERNAL.CMR_MAX_PAGE_SIZE)
+            if max_page_size is None
+            else max_page_size
+        )
+        self.min_page_size = min(
+            self.page_size,
+            INTERNAL.CMR_MIN_PAGE_SIZE if min_page_size is None else min_page_size,
+        )
+        self.target_time = INTERNAL.CMR_PAGE_TARGET_TIME if target_time is None else target_time
+        self.max_bytes = INTERNAL.CMR_PAGE_MAX_BYTES if max_bytes is None else max_bytes
+
+    def next_page_size(self, remaining: Optional[int] = None) -> int:
+        """
+        :param remaining: the number of results still wanted from the subquery, if limited
+        :returns the page size to request the next page with
+        """
+        if remaining is None:
+            return self.page_size
+
+        return max(1, min(self.page_size, remaining))
+
+    def observe(self, item_count: int, elapsed: float, size: Optional[int] = None) -> None:
+        """
+        Adjusts the page size after a page is received, if `adaptive` is set
+
+        :param item_count: the number of items in the page
+        :param elapsed: the time in seconds it took to request and read the page
+        :param size: the size of the response in bytes, if known
+        """
+        if not self.adaptive or item_count == 0 or elapsed <= 0:
+            return
+
+        fitted_size = self.target_time * item_count / elapsed
+        if size:
+            fitted_size = min(fitted_size, self.max_bytes * item_count / size)
+
+        # move halfway to the fitted size, so one unusually slow page doesn't swing it too far
+        page_size = round((self.page_size + fitted_size) / 2)
+        page_size = min(self.max_page_size, max(self.min_page_size, page_size))
+        if page_size != self.page_size:
+            ASF_LOGGER.debug(
+                f'PAGE SIZE: {item_count} items took {elapsed:.2f}s, '
+                f'page size {self.page_size} -> {page_size}'
+            )
+            self.page_size = page_size
+
+
+def get_page_size(translated_opts: List, default: int = None) -> Optional[int]:
+    """:returns the `page_size` requested by translated cmr keywords, or `default` if not set"""
+    for key, val in translated_opts:
+        if key == 'page_size':
+            return int(val)
+
+    return default
+
+
+def set_page_size(translated_opts: List, page_size: int) -> List:
+    """:returns a copy of translated cmr keywords requesting `page_size` items per page"""
+    if get_page_size(translated_opts) is None:
+        return [*translated_opts, ('page_size', page_size)]
+
+    return [(key, page_size if key == 'page_size' else val) for key, val in translated_opts]
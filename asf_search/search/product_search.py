@@ -2,6 +2,7 @@ from typing import Sequence
 from copy import copy
 
 from asf_search.search import search
+from asf_search.search.search import search_async
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.ASFSearchResults import ASFSearchResults
 
@@ -29,3 +30,34 @@ def product_search(product_list: Sequence[str], opts: ASFSearchOptions = None) -
     opts.merge_args(product_list=product_list)
 
     return search(opts=opts)
+
+
+async def product_search_async(
+    product_list: Sequence[str],
+    opts: ASFSearchOptions = None,
+    client: 'aiohttp.ClientSession' = None,  # type: ignore # noqa: F821
+) -> ASFSearchResults:
+    """
+    Asynchronous counterpart to `asf_search.product_search()`
+
+    Parameters
+    ----------
+    :param product_list:
+        List of specific products.
+        Guaranteed to be at most one product per product name.
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    client:
+        The `aiohttp.ClientSession` used to query CMR.
+        Defaults to a new client that is closed once the search finishes.
+
+    Returns
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct)
+    """
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    opts.merge_args(product_list=product_list)
+
+    return await search_async(opts=opts, client=client)
@@ -5,7 +5,7 @@ import datetime
 
 from asf_search import ASF_LOGGER, ASFSearchResults
 from asf_search.ASFSearchOptions import ASFSearchOptions
-from asf_search.search.search_generator import search_generator
+from asf_search.search.search_generator import search_generator, search_generator_async
 
 
 def search(
@@ -55,6 +55,20 @@ def search(
     shortName: Union[str, Sequence[str]] = None,
     cmr_keywords: Union[Tuple[str, str], Sequence[Tuple[str, str]]] = None,
     maxResults: int = None,
+    maxWorkers: int = None,
+    asCompleted: bool = None,
+    prefetchDepth: int = None,
+    streamPages: bool = None,
+    lazyProducts: bool = None,
+    parseWorkers: int = None,
+    adaptivePageSize: bool = None,
+    collapseSubqueries: bool = None,
+    temporalShards: int = None,
+    balanceShards: bool = None,
+    spatialTiles: int = None,
+    sortedStream: bool = None,
+    dropDuplicates: bool = None,
+    duplicateBloomCapacity: int = None,
     opts: ASFSearchOptions = None,
 ) -> ASFSearchResults:
     """
@@ -153,6 +167,74 @@ def search(
         used for Sentinel-1 Interferogram (BETA)
     maxResults:
         The maximum number of results to be returned by the search
+    maxWorkers:
+        The number of threads used to run subqueries concurrently.
+        Defaults to 1 (subqueries are run one after another)
+    asCompleted:
+        When running subqueries concurrently, return pages in the order they arrive
+        instead of in subquery order. Defaults to False
+    prefetchDepth:
+        The number of pages to request ahead of the page currently being parsed,
+        overlapping CMR response time with product parsing.
+        Defaults to 0 (each page is requested once the previous page has been consumed)
+    streamPages:
+        Decode each CMR page incrementally from the response stream, building products
+        as their UMM arrives instead of after the whole page is decoded.
+        Requires the optional `ijson` package. Defaults to False
+    lazyProducts:
+        Create products with `ASFProduct.lazy()`, reading each product's `properties`,
+        `geometry` and `baseline` from its UMM the first time they're accessed. Defaults to False
+    parseWorkers:
+        The number of processes each CMR page's products are built on,
+        for CPU bound harvests of many pages. CMR is still queried from this process.
+        The processes are spawned, so scripts using them need an `if __name__ == '__main__':`
+        guard, and are shared by every search with the same `parseWorkers`.
+        Has no effect with `lazyProducts`, and pages aren't streamed (`streamPages`) when set.
+        Defaults to 0 (products are built in this process)
+    adaptivePageSize:
+        Tune each subquery's CMR page size to the response times and sizes of its previous
+        pages, aiming for pages of `INTERNAL.CMR_PAGE_TARGET_TIME` seconds and at most
+        `INTERNAL.CMR_PAGE_MAX_BYTES` bytes. Pages are never larger than `maxResults`
+        needs either way. Defaults to False (pages of `INTERNAL.CMR_PAGE_SIZE` products)
+    collapseSubqueries:
+        Query CMR with fewer subqueries where it can match several values in one, collapsing
+        consecutive orbits and frames into ranges, and OR'ing the values of a search's only
+        attribute parameter (like `beamMode`). Results are still sorted within each subquery,
+        so merging changes the order they're yielded in. See `explain()` for the subqueries
+        a search is split into. Defaults to False (one subquery per value)
+    temporalShards:
+        Split each subquery's `start`-`end` range into this many time windows, searched as
+        separate subqueries, so long searches can be fetched in parallel with `maxWorkers`.
+        Windows are read latest first, keeping results sorted by end date, and each granule
+        is only returned by the window its end time falls in. Has no effect on subqueries
+        without a `start`, or with a `season`. Defaults to 0 (not split)
+    balanceShards:
+        Size `temporalShards` windows to hold about the same number of granules, using hit
+        counts from `INTERNAL.TEMPORAL_SHARD_SAMPLES` windows per shard. Defaults to False
+        (windows of equal length)
+    spatialTiles:
+        Split a polygon `intersectsWith` AOI along a longitude/latitude grid of about this
+        many tiles, searched as separate subqueries, so large AOIs can be fetched in parallel
+        with `maxWorkers`. Granules overlapping several tiles are returned once, by the first
+        tile that finds them, and results are found tile by tile, so with `maxResults` set
+        they're the first found rather than the latest (unless `sortedStream` is set).
+        Defaults to 0 (not split)
+    sortedStream:
+        Merge the results of every subquery into one stream sorted by end date, latest first,
+        the way `search()` sorts its results. Each subquery is already sorted by CMR, so pages
+        are merged as they arrive rather than after the whole search is fetched, and with
+        `maxResults` set the latest results across all subqueries are returned.
+        `asCompleted` is ignored when set. Defaults to False (subqueries are yielded in turn)
+    dropDuplicates:
+        Return each granule once when subqueries overlap (like platform aliases, datasets
+        sharing collections, or repeated `granule_list` names), by CMR concept-id and
+        revision-id. Searches split by `spatialTiles` always drop duplicates.
+        Defaults to False
+    duplicateBloomCapacity:
+        Remember the granules returned by `dropDuplicates` in a `BloomFilter` sized for this
+        many granules, instead of a set, bounding memory for multi-million granule searches.
+        About `INTERNAL.DUPLICATE_BLOOM_ERROR_RATE` of unique granules are wrongly dropped.
+        Defaults to 0 (an exact set)
     opts:
         An ASFSearchOptions object describing the search parameters to be used.
         Search parameters specified outside this object will override in event of a conflict.
@@ -186,3 +268,47 @@ def search(
         ASF_LOGGER.warning(f'Failed to sort final results, leaving results unsorted. Reason: {exc}')
 
     return results
+
+
+async def search_async(
+    opts: ASFSearchOptions = None,
+    client: 'aiohttp.ClientSession' = None,  # type: ignore # noqa: F821
+    **kwargs,
+) -> ASFSearchResults:
+    """
+    Asynchronous counterpart to `asf_search.search()`,
+    returning all results in a single list without blocking the running event loop.
+
+    Accepts the same search parameters as `search()` as keyword arguments,
+    and/or an ASFSearchOptions object.
+    (For accessing results page by page see `asf_search.search_generator_async()`)
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    client:
+        The `aiohttp.ClientSession` used to query CMR.
+        Defaults to a new client that is closed once the search finishes.
+
+    Returns
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct)
+    """
+    results = ASFSearchResults([])
+
+    # The last page will be marked as complete if results sucessful
+    async for page in search_generator_async(opts=opts, client=client, **kwargs):
+        results.extend(page)
+        results.searchComplete = page.searchComplete
+        results.searchOptions = page.searchOptions
+
+    results.raise_if_incomplete()
+
+    try:
+        results.sort(key=lambda p: p.get_sort_keys(), reverse=True)
+    except TypeError as exc:
+        ASF_LOGGER.warning(f'Failed to sort final results, leaving results unsorted. Reason: {exc}')
+
+    return results
@@ -1,10 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from typing import Sequence, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 from copy import copy
 from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.ASFSession import ASFSession
 from asf_search.CMR.subquery import build_subqueries
 from asf_search.CMR import translate_opts
-from asf_search.search.search_generator import get_page, preprocess_opts
+from asf_search.search.search_generator import (
+    _get_async_client,
+    get_page,
+    get_page_async,
+    preprocess_opts,
+)
+from asf_search.search.page_size import set_page_size
 from asf_search import INTERNAL
 
 
@@ -55,8 +64,20 @@ def search_count(
     shortName: Union[str, Sequence[str]] = None,
     cmr_keywords: Union[Tuple[str, str], Sequence[Tuple[str, str]]] = None,
     maxResults: int = None,
+    maxWorkers: int = None,
+    collapseSubqueries: bool = None,
     opts: ASFSearchOptions = None,
 ) -> int:
+    """
+    Counts the products a search would return, without fetching them.
+    Accepts the same search parameters as `asf_search.search()`.
+
+    The count of every subquery is requested at once, on `maxWorkers` threads
+    when set, otherwise on as many threads as the session's connection pool holds.
+    Counts are reused for a while when the session has a `CountCache`
+    (`ASFSession(count_cache=CountCache())`).
+    See `search_count_breakdown()` for the count of each subquery.
+    """
     # Create a kwargs dict, that's all of the 'not None' items, and merge it with opts:
     kwargs = locals()
     opts = ASFSearchOptions() if kwargs['opts'] is None else copy(opts)
@@ -70,14 +91,189 @@ def search_count(
 
     preprocess_opts(opts)
 
-    url = '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
+    return sum(_get_subquery_counts(opts, build_subqueries(opts)))
+
+
+def search_count_breakdown(
+    opts: ASFSearchOptions = None,
+    by_collection: bool = False,
+    **kwargs,
+) -> List[Tuple[ASFSearchOptions, int]]:
+    """
+    Counts the products a search would return for each of its subqueries,
+    the parts `search_count()` adds up. Counts are requested at once, and cached,
+    like `search_count()`'s. Accepts the same search parameters as `search_count()`
+    as keyword arguments.
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    by_collection:
+        Count each subquery's CMR collections separately, one request per collection
+        concept-id (see the `collections` of each returned subquery). Defaults to False
+
+    Returns
+    -------
+    A list of `(subquery, count)` tuples, in subquery order
+    """
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
+    kw_opts = ASFSearchOptions(**kwargs)
+
+    # Anything passed in as kwargs has priority over anything in opts:
+    opts.merge_args(**dict(kw_opts))
+
+    preprocess_opts(opts)
+
+    queries = build_subqueries(opts)
+    if by_collection:
+        queries = [
+            collection_query
+            for query in queries
+            for collection_query in _split_by_collection(query)
+        ]
+
+    return list(zip(queries, _get_subquery_counts(opts, queries)))
+
+
+async def search_count_async(
+    opts: ASFSearchOptions = None,
+    client: 'aiohttp.ClientSession' = None,  # type: ignore # noqa: F821
+    **kwargs,
+) -> int:
+    """
+    Asynchronous counterpart to `asf_search.search_count()`,
+    requesting the count for every subquery at once.
+    Accepts the same search parameters as `search_count()` as keyword arguments.
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    client:
+        The `aiohttp.ClientSession` used to query CMR.
+        Defaults to a new client that is closed once the count finishes.
+    """
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
+    kw_opts = ASFSearchOptions(**kwargs)
+
+    # Anything passed in as kwargs has priority over anything in opts:
+    opts.merge_args(**dict(kw_opts))
+
+    preprocess_opts(opts)
+
+    url = _get_granule_url(opts)
+
+    close_client = client is None
+    if client is None:
+        client = _get_async_client()
+
+    try:
+        counts = await asyncio.gather(
+            *[
+                _get_subquery_hits_async(client, opts.session, url, query)
+                for query in build_subqueries(opts)
+            ]
+        )
+    finally:
+        if close_client:
+            await client.close()
+
+    return sum(counts)
+
+
+def _get_subquery_counts(opts: ASFSearchOptions, queries: List[ASFSearchOptions]) -> List[int]:
+    """
+    Requests the CMR hit count of every subquery at once, on `opts.maxWorkers` threads
+    when set, otherwise on as many threads as the session's connection pool holds
+
+    :returns the hit count of each subquery, in order
+    """
+    url = _get_granule_url(opts)
+
+    max_workers = opts.maxWorkers
+    if max_workers <= 1:
+        max_workers = getattr(opts.session, 'pool_maxsize', INTERNAL.HTTP_POOL_MAXSIZE)
+    max_workers = min(max_workers, len(queries))
+
+    if max_workers <= 1:
+        return [_get_subquery_hits(opts.session, url, query) for query in queries]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda query: _get_subquery_hits(opts.session, url, query), queries)
+        )
+
+
+def _get_subquery_hits(session: ASFSession, url: str, query: ASFSearchOptions) -> int:
+    """:returns the number of CMR hits for a subquery, without fetching any of them"""
+    translated_opts = _translate_count_opts(query)
+
+    cache = getattr(session, 'count_cache', None)
+    if cache is not None:
+        cache_key = cache.key(url, translated_opts, session.headers.get('Authorization'))
+        if (hits := cache.get(cache_key)) is not None:
+            return hits
+
+    response = get_page(session=session, url=url, translated_opts=translated_opts)
+    hits = response.json()['hits']
+
+    if cache is not None:
+        cache.set(cache_key, hits)
+
+    return hits
+
+
+async def _get_subquery_hits_async(
+    client: 'aiohttp.ClientSession',  # type: ignore # noqa: F821
+    session: ASFSession,
+    url: str,
+    query: ASFSearchOptions,
+) -> int:
+    """Asynchronous counterpart to `_get_subquery_hits()`"""
+    translated_opts = _translate_count_opts(query)
+
+    cache = getattr(session, 'count_cache', None)
+    if cache is not None:
+        cache_key = cache.key(url, translated_opts, session.headers.get('Authorization'))
+        if (hits := cache.get(cache_key)) is not None:
+            return hits
+
+    page, _ = await get_page_async(
+        client=client, session=session, url=url, translated_opts=translated_opts
+    )
+    hits = page['hits']
+
+    if cache is not None:
+        cache.set(cache_key, hits)
+
+    return hits
+
+
+def _split_by_collection(query: ASFSearchOptions) -> List[ASFSearchOptions]:
+    """:returns a copy of `query` for each of its collections, or `query` if it has none"""
+    if not query.collections:
+        return [query]
+
+    collection_queries = []
+    for collection in query.collections:
+        collection_query = copy(query)
+        collection_query.collections = [collection]
+        collection_queries.append(collection_query)
+
+    return collection_queries
+
+
+def _get_granule_url(opts: ASFSearchOptions) -> str:
+    return '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
 
-    count = 0
-    for query in build_subqueries(opts):
-        translated_opts = translate_opts(query)
-        idx = translated_opts.index(('page_size', INTERNAL.CMR_PAGE_SIZE))
-        translated_opts[idx] = ('page_size', 0)
 
-        response = get_page(session=opts.session, url=url, translated_opts=translated_opts)
-        count += response.json()['hits']
-    return count
+def _translate_count_opts(query: ASFSearchOptions) -> List:
+    """Translates a subquery to cmr keywords, requesting only the hit count"""
+    return set_page_size(translate_opts(query), 0)
@@ -1,17 +1,43 @@
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import multiprocessing
+import queue
+import threading
 import time
-from typing import Dict, Generator, Union, Sequence, Tuple, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Mapping,
+    Optional,
+    Union,
+    Sequence,
+    Tuple,
+    List,
+    Type,
+)
 from copy import copy
+from functools import partial
+from urllib.parse import urlencode
 from requests.exceptions import HTTPError
 from requests import ReadTimeout, Response
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
     wait_fixed,
+    wait_random,
 )
 import datetime
-import dateparser
 
 from asf_search import ASF_LOGGER
 
@@ -24,6 +50,7 @@ from asf_search.ASFSession import ASFSession
 from asf_search.ASFProduct import ASFProduct
 from asf_search.exceptions import (
     ASFSearch4xxError,
+    ASFSearch429Error,
     ASFSearch5xxError,
     ASFSearchError,
     CMRIncompleteError,
@@ -31,8 +58,25 @@ from asf_search.exceptions import (
 from asf_search.constants import INTERNAL
 from asf_search.WKT.validate_wkt import validate_wkt
 from asf_search.search.error_reporting import report_search_error
+from asf_search.search.page_size import PageSizer, get_page_size, set_page_size
+from asf_search.search.checkpoint import SearchCheckpoint, search_fingerprint
+from asf_search.search.duplicates import BloomFilter, drop_duplicates, duplicate_key
+from asf_search.search.spatial_tiles import tile_subqueries
+from asf_search.search.temporal_shards import EndTimeRange, filter_end_times, shard_subqueries
 import asf_search.Products as ASFProductType
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# `parseWorkers` process pools by number of processes, see `_get_parse_pool()`
+_parse_pools: Dict[int, ProcessPoolExecutor] = {}
+_parse_pools_lock = threading.Lock()
+
 
 def search_generator(
     absoluteOrbit: Union[
@@ -81,6 +125,22 @@ def search_generator(
     shortName: Union[str, Sequence[str]] = None,
     cmr_keywords: Union[Tuple[str, str], Sequence[Tuple[str, str]]] = None,
     maxResults: int = None,
+    maxWorkers: int = None,
+    asCompleted: bool = None,
+    prefetchDepth: int = None,
+    streamPages: bool = None,
+    lazyProducts: bool = None,
+    parseWorkers: int = None,
+    adaptivePageSize: bool = None,
+    collapseSubqueries: bool = None,
+    temporalShards: int = None,
+    balanceShards: bool = None,
+    spatialTiles: int = None,
+    sortedStream: bool = None,
+    dropDuplicates: bool = None,
+    duplicateBloomCapacity: int = None,
+    checkpoint: str = None,
+    resumeFromCheckpoint: bool = None,
     opts: ASFSearchOptions = None,
 ) -> Generator[ASFSearchResults, None, None]:
     """
@@ -178,6 +238,83 @@ def search_generator(
         used for Sentinel-1 Interferogram (BETA)
     maxResults:
         The maximum number of results to be returned by the search
+    maxWorkers:
+        The number of threads used to run subqueries concurrently.
+        Defaults to 1 (subqueries are run one after another)
+    asCompleted:
+        When running subqueries concurrently, return pages in the order they arrive
+        instead of in subquery order. Defaults to False
+    prefetchDepth:
+        The number of pages to request ahead of the page currently being parsed,
+        overlapping CMR response time with product parsing.
+        Defaults to 0 (each page is requested once the previous page has been consumed)
+    streamPages:
+        Decode each CMR page incrementally from the response stream, building products
+        as their UMM arrives instead of after the whole page is decoded.
+        Requires the optional `ijson` package. Defaults to False
+    lazyProducts:
+        Create products with `ASFProduct.lazy()`, reading each product's `properties`,
+        `geometry` and `baseline` from its UMM the first time they're accessed. Defaults to False
+    parseWorkers:
+        The number of processes each CMR page's products are built on,
+        for CPU bound harvests of many pages. CMR is still queried from this process.
+        The processes are spawned, so scripts using them need an `if __name__ == '__main__':`
+        guard, and are shared by every search with the same `parseWorkers`.
+        Has no effect with `lazyProducts`, and pages aren't streamed (`streamPages`) when set.
+        Defaults to 0 (products are built in this process)
+    adaptivePageSize:
+        Tune each subquery's CMR page size to the response times and sizes of its previous
+        pages, aiming for pages of `INTERNAL.CMR_PAGE_TARGET_TIME` seconds and at most
+        `INTERNAL.CMR_PAGE_MAX_BYTES` bytes. Pages are never larger than `maxResults`
+        needs either way. Defaults to False (pages of `INTERNAL.CMR_PAGE_SIZE` products)
+    collapseSubqueries:
+        Query CMR with fewer subqueries where it can match several values in one, collapsing
+        consecutive orbits and frames into ranges, and OR'ing the values of a search's only
+        attribute parameter (like `beamMode`). Results are still sorted within each subquery,
+        so merging changes the order they're yielded in. See `explain()` for the subqueries
+        a search is split into. Defaults to False (one subquery per value)
+    temporalShards:
+        Split each subquery's `start`-`end` range into this many time windows, searched as
+        separate subqueries, so long searches can be fetched in parallel with `maxWorkers`.
+        Windows are read latest first, keeping results sorted by end date, and each granule
+        is only returned by the window its end time falls in. Has no effect on subqueries
+        without a `start`, or with a `season`. Defaults to 0 (not split)
+    balanceShards:
+        Size `temporalShards` windows to hold about the same number of granules, using hit
+        counts from `INTERNAL.TEMPORAL_SHARD_SAMPLES` windows per shard. Defaults to False
+        (windows of equal length)
+    spatialTiles:
+        Split a polygon `intersectsWith` AOI along a longitude/latitude grid of about this
+        many tiles, searched as separate subqueries, so large AOIs can be fetched in parallel
+        with `maxWorkers`. Granules overlapping several tiles are returned once, by the first
+        tile that finds them, and results are found tile by tile, so with `maxResults` set
+        they're the first found rather than the latest (unless `sortedStream` is set).
+        Defaults to 0 (not split)
+    sortedStream:
+        Merge the results of every subquery into one stream sorted by end date, latest first,
+        the way `search()` sorts its results. Each subquery is already sorted by CMR, so pages
+        are merged as they arrive rather than after the whole search is fetched, and with
+        `maxResults` set the latest results across all subqueries are returned.
+        `asCompleted` is ignored when set. Defaults to False (subqueries are yielded in turn)
+    dropDuplicates:
+        Return each granule once when subqueries overlap (like platform aliases, datasets
+        sharing collections, or repeated `granule_list` names), by CMR concept-id and
+        revision-id. Searches split by `spatialTiles` always drop duplicates.
+        Defaults to False
+    duplicateBloomCapacity:
+        Remember the granules returned by `dropDuplicates` in a `BloomFilter` sized for this
+        many granules, instead of a set, bounding memory for multi-million granule searches.
+        About `INTERNAL.DUPLICATE_BLOOM_ERROR_RATE` of unique granules are wrongly dropped.
+        Defaults to 0 (an exact set)
+    checkpoint:
+        A file to save the search's progress to after each page is consumed: the subquery
+        it's on, that subquery's CMR-Search-After cursor, and the running counts. Continue
+        an interrupted search from it with `resume_search_generator()`. A page being
+        processed when the search stopped is yielded again. Cannot be used with
+        `sortedStream` or `asCompleted`. Defaults to None (no checkpoints)
+    resumeFromCheckpoint:
+        Continue the search from the progress saved to `checkpoint` instead of starting over,
+        see `resume_search_generator()`. Defaults to False
     opts:
         An ASFSearchOptions object describing the search parameters to be used.
         Search parameters specified outside this object will override in event of a conflict.
@@ -187,10 +324,166 @@ def search_generator(
     `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct, page by page)
     """
 
-    # Create a kwargs dict, that's all of the 'not None' items, and merge it with opts:
     kwargs = locals()
-    opts = ASFSearchOptions() if kwargs['opts'] is None else copy(opts)
-    del kwargs['opts']
+    opts, maxResults = _build_search_opts(kwargs.pop('opts'), kwargs)
+
+    url = '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
+    total = 0
+
+    queries = build_subqueries(opts)
+    if opts.spatialTiles > 1:
+        queries = tile_subqueries(queries, opts.spatialTiles)
+
+    # products returned by more than one subquery or tile are only yielded the first time
+    seen_keys = None
+    if opts.dropDuplicates or opts.spatialTiles > 1:
+        seen_keys = (
+            set() if opts.duplicateBloomCapacity <= 0 else BloomFilter(opts.duplicateBloomCapacity)
+        )
+
+    end_time_ranges = None
+    if opts.temporalShards > 1:
+        queries, end_time_ranges = shard_subqueries(
+            queries, opts.temporalShards, opts.balanceShards, opts
+        )
+
+    if opts.streamPages and ijson is None:
+        raise ImportError(
+            'Could not find ijson package in current python environment.'
+            '"ijson" is an optional dependency of asf-search required'
+            'for decoding CMR pages with `streamPages`.'
+            'Enable by including the appropriate pip or conda install.'
+            'Ex: `python3 -m pip install asf-search[extras]`'
+        )
+
+    checkpoint = None
+    if opts.checkpoint is not None:
+        checkpoint = _get_checkpoint(opts, queries, seen_keys)
+        if checkpoint.complete:
+            ASF_LOGGER.info(f'SEARCH COMPLETE: checkpoint "{opts.checkpoint}" already finished')
+            return
+        total = checkpoint.total
+
+    ASF_LOGGER.info(f'SEARCH: Using cmr endpoint: "{url}"')
+    ASF_LOGGER.debug(f'SEARCH: Built {len(queries)} subqueries')
+
+    if opts.parseWorkers > 0 and not opts.lazyProducts:
+        ASF_LOGGER.info(f'SEARCH: Building products with {opts.parseWorkers} processes')
+
+    # duplicates don't count towards maxResults, so fetching isn't limited by it when dropping them
+    fetch_max_results = maxResults if seen_keys is None else None
+    if opts.sortedStream:
+        # the merged stream's first maxResults products take at most maxResults from any one
+        # subquery, duplicates or not, as no subquery returns the same product twice
+        pages = _sorted_subquery_pages(queries, url, opts, maxResults, end_time_ranges)
+    elif opts.maxWorkers > 1 and len(queries) > 1:
+        ASF_LOGGER.info(f'SEARCH: Running subqueries with {opts.maxWorkers} workers')
+        pages = _concurrent_subquery_pages(
+            queries, url, opts, fetch_max_results, end_time_ranges, checkpoint
+        )
+    else:
+        pages = _serial_subquery_pages(
+            queries, url, opts, fetch_max_results, end_time_ranges, checkpoint
+        )
+
+    subquery_counts = [0] * len(queries)
+    if checkpoint is not None and checkpoint.subquery_idx < len(queries):
+        subquery_counts[checkpoint.subquery_idx] = checkpoint.subquery_count
+    try:
+        for subquery_idx, items, subquery_max_results, cursor in pages:
+            subquery_count = subquery_counts[subquery_idx]
+            duplicate_count = 0
+            new_keys = []
+            if seen_keys is not None:
+                unique_items = drop_duplicates(items, seen_keys)
+                duplicate_count = len(items) - len(unique_items)
+                items = unique_items
+                if checkpoint is not None:
+                    new_keys = [key for key in map(duplicate_key, items) if key is not None]
+            perf = time.time()
+            last_page = process_page(
+                items, maxResults, subquery_max_results, total, subquery_count, opts
+            )
+            ASF_LOGGER.info(f'Page Processing Time {time.time() - perf}')
+            subquery_counts[subquery_idx] += len(last_page) + duplicate_count
+            total += len(last_page)
+            last_page.searchComplete = (
+                subquery_counts[subquery_idx] == subquery_max_results or total == maxResults
+            )
+            yield last_page
+
+            # saved once the page has been consumed, a page being processed when the search
+            # stops is yielded again on resume
+            if checkpoint is not None:
+                checkpoint.update(
+                    subquery_idx, cursor, subquery_counts[subquery_idx], total, new_keys
+                )
+
+            if total == maxResults:  # the user has as many results as they wanted
+                ASF_LOGGER.info(f'SEARCH COMPLETE: MaxResults ({maxResults}) reached')
+                if checkpoint is not None:
+                    checkpoint.finish()
+                return
+            elif last_page.searchComplete:  # or we've gotten all possible results for this subquery
+                ASF_LOGGER.info(
+                    f'SUBQUERY {subquery_idx + 1} COMPLETE: results exhausted for subquery'
+                )
+    except CMRIncompleteError:
+        # If it's a CMRIncompleteError, we can just stop here and return what we have
+        # It's up to the user to call .raise_if_incomplete() if they're using the
+        # generator directly.
+        return
+    finally:
+        pages.close()
+
+    if checkpoint is not None:
+        checkpoint.finish()
+    ASF_LOGGER.info(f'SEARCH COMPLETE: results exhausted for search opts {opts}')
+
+
+def _get_checkpoint(
+    opts: ASFSearchOptions,
+    queries: List[ASFSearchOptions],
+    seen_keys: Optional[Union[set, BloomFilter]],
+) -> SearchCheckpoint:
+    """
+    Starts a new checkpoint at `opts.checkpoint`, or with `opts.resumeFromCheckpoint` set
+    loads the one saved there, adding the duplicate keys it had seen to `seen_keys`
+    """
+    if opts.sortedStream or opts.asCompleted:
+        raise ValueError(
+            'Cannot checkpoint a search with `sortedStream` or `asCompleted` set, '
+            'their pages are not yielded in a repeatable order'
+        )
+
+    fingerprint = search_fingerprint(queries)
+    if not opts.resumeFromCheckpoint:
+        return SearchCheckpoint(opts.checkpoint, fingerprint)
+
+    checkpoint = SearchCheckpoint.load(opts.checkpoint, fingerprint)
+    if seen_keys is not None:
+        checkpoint.load_seen_keys(seen_keys)
+    ASF_LOGGER.info(
+        f'SEARCH: Resuming from checkpoint "{opts.checkpoint}" at subquery '
+        f'{checkpoint.subquery_idx + 1}, {checkpoint.total} results already yielded'
+    )
+
+    return checkpoint
+
+
+def _build_search_opts(
+    opts: Optional[ASFSearchOptions], kwargs: Dict
+) -> Tuple[ASFSearchOptions, Optional[int]]:
+    """
+    Merges search keyword arguments into a copy of `opts` and preprocesses the result
+
+    :param opts: the user provided search options, if any
+    :param kwargs: search keyword arguments, `None` values are ignored
+
+    :returns the merged search options, and the `maxResults` popped from them
+    """
+    # Create a kwargs dict, that's all of the 'not None' items, and merge it with opts:
+    opts = ASFSearchOptions() if opts is None else copy(opts)
 
     kwargs = dict((k, v) for k, v in kwargs.items() if v is not None)
     kw_opts = ASFSearchOptions(**kwargs)
@@ -211,104 +504,722 @@ def search_generator(
 
     ASF_LOGGER.info(f'SEARCH: Using search opts {opts}')
 
-    url = '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
-    total = 0
+    return opts, maxResults
 
-    queries = build_subqueries(opts)
 
-    ASF_LOGGER.info(f'SEARCH: Using cmr endpoint: "{url}"')
-    ASF_LOGGER.debug(f'SEARCH: Built {len(queries)} subqueries')
+def _serial_subquery_pages(
+    queries: List[ASFSearchOptions],
+    url: str,
+    opts: ASFSearchOptions,
+    max_results: Optional[int] = None,
+    end_time_ranges: List[Optional[EndTimeRange]] = None,
+    resume: Optional[SearchCheckpoint] = None,
+) -> Generator[Tuple[int, List[ASFProduct], int, Dict], None, None]:
+    """
+    Runs each subquery one after another, yielding every page as
+    `(subquery index, page of products, subquery CMR hits, subquery cursor)`.
+    Products of temporally sharded subqueries are filtered by their `end_time_ranges`.
+    With `resume` set, subqueries before its subquery are skipped, and its subquery
+    continues from its cursor
+    """
+    start_idx, cursor, fetched_count = 0, None, 0
+    if resume is not None:
+        start_idx, cursor = resume.subquery_idx, resume.cursor()
+        fetched_count = resume.total - resume.subquery_count
+
+    for subquery_idx, query in enumerate(queries[start_idx:], start_idx):
+        if max_results is not None and fetched_count >= max_results:
+            return
+
+        subquery_max_results = None if max_results is None else max_results - fetched_count
+        if subquery_idx == start_idx and cursor is not None:
+            # products the resumed subquery fetched before its cursor
+            fetched_count += cursor['fetched'] - cursor['dropped']
+
+        for items, hits, subquery_cursor in _subquery_pages(
+            subquery_idx,
+            query,
+            url,
+            opts.session,
+            opts.prefetchDepth,
+            opts.streamPages,
+            opts.lazyProducts,
+            opts.parseWorkers,
+            max_results=subquery_max_results,
+            adaptive_page_size=opts.adaptivePageSize,
+            end_time_range=None if end_time_ranges is None else end_time_ranges[subquery_idx],
+            cursor=cursor if subquery_idx == start_idx else None,
+        ):
+            fetched_count += len(items)
+            yield subquery_idx, items, hits, subquery_cursor
+
+
+def _concurrent_subquery_pages(
+    queries: List[ASFSearchOptions],
+    url: str,
+    opts: ASFSearchOptions,
+    max_results: Optional[int],
+    end_time_ranges: List[Optional[EndTimeRange]] = None,
+    resume: Optional[SearchCheckpoint] = None,
+) -> Generator[Tuple[int, List[ASFProduct], int, Dict], None, None]:
+    """
+    Runs subqueries on a pool of `opts.maxWorkers` threads, yielding every page as
+    `(subquery index, page of products, subquery CMR hits, subquery cursor)`.
+    Products of temporally sharded subqueries are filtered by their `end_time_ranges`.
+    With `resume` set, subqueries before its subquery are skipped, and its subquery
+    continues from its cursor
+
+    Pages are yielded in subquery order by default, each subquery's worker fetching up to
+    `INTERNAL.SUBQUERY_PAGE_BUFFER` pages ahead of the subquery being yielded before it waits.
+    With `opts.asCompleted` set, pages are yielded as soon as any worker returns them instead,
+    workers waiting once that many pages per worker are waiting to be yielded.
+
+    Workers stop fetching once the generator is closed, or, in as-completed mode,
+    once enough products have been fetched across all workers to satisfy `max_results`
+    """
+    stop_fetching = threading.Event()
+    fetched_lock = threading.Lock()
+    fetched_count = 0
+
+    start_idx = 0 if resume is None else resume.subquery_idx
+    max_workers = min(opts.maxWorkers, len(queries))
+    if opts.asCompleted:
+        page_queues = [queue.Queue(maxsize=INTERNAL.SUBQUERY_PAGE_BUFFER * max_workers)] * len(
+            queries
+        )
+    else:
+        page_queues = [queue.Queue(maxsize=INTERNAL.SUBQUERY_PAGE_BUFFER) for _ in queries]
 
-    for subquery_idx, query in enumerate(queries):
-        ASF_LOGGER.info(f'SUBQUERY {subquery_idx + 1}: Beginning subquery with opts: {query}')
+    def put(subquery_idx: int, entry: Tuple) -> bool:
+        while not stop_fetching.is_set():
+            try:
+                page_queues[subquery_idx].put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def run_subquery(subquery_idx: int, query: ASFSearchOptions):
+        nonlocal fetched_count
+        start_cursor = resume.cursor() if resume is not None and subquery_idx == start_idx else None
+        try:
+            for items, hits, cursor in _subquery_pages(
+                subquery_idx,
+                query,
+                url,
+                opts.session,
+                opts.prefetchDepth,
+                opts.streamPages,
+                opts.lazyProducts,
+                opts.parseWorkers,
+                max_results=max_results,
+                adaptive_page_size=opts.adaptivePageSize,
+                end_time_range=(None if end_time_ranges is None else end_time_ranges[subquery_idx]),
+                cursor=start_cursor,
+            ):
+                if not put(subquery_idx, (subquery_idx, items, hits, cursor)):
+                    break
+
+                if opts.asCompleted and max_results is not None:
+                    with fetched_lock:
+                        fetched_count += len(items)
+                        if fetched_count >= max_results:
+                            stop_fetching.set()
+        except Exception as exc:
+            put(subquery_idx, (subquery_idx, exc, None, None))
+        finally:
+            put(subquery_idx, (subquery_idx, None, None, None))
+
+    pool_maxsize = getattr(opts.session, 'pool_maxsize', None)
+    if pool_maxsize is not None and pool_maxsize < max_workers:
+        ASF_LOGGER.warning(
+            f'Session pool_maxsize ({pool_maxsize}) is smaller than maxWorkers ({max_workers}), '
+            'connections beyond the pool size are discarded after each request. '
+            'Use `ASFSession.configure_pool(pool_maxsize=...)` to keep them open'
+        )
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asf_search')
+    for subquery_idx, query in enumerate(queries[start_idx:], start_idx):
+        executor.submit(run_subquery, subquery_idx, query)
 
-        ASF_LOGGER.debug(f'TRANSLATION: Translating subquery:\n{query}')
-        translated_opts = translate_opts(query)
-        ASF_LOGGER.debug(f'TRANSLATION: Subquery translated to cmr keywords:\n{translated_opts}')
-        cmr_search_after_header = ''
-        subquery_count = 0
+    # in order, each subquery's pages are read from its own queue until its worker finishes,
+    # as completed, from the queue every worker shares until they all finish
+    if opts.asCompleted:
+        queue_order = [page_queues[start_idx]] * (len(queries) - start_idx)
+    else:
+        queue_order = page_queues[start_idx:]
+
+    try:
+        for page_queue in queue_order:
+            while True:
+                subquery_idx, items, hits, cursor = page_queue.get()
+                if isinstance(items, Exception):
+                    raise items
+                if items is None:
+                    break
+
+                yield subquery_idx, items, hits, cursor
+    finally:
+        stop_fetching.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _sorted_subquery_pages(
+    queries: List[ASFSearchOptions],
+    url: str,
+    opts: ASFSearchOptions,
+    max_results: Optional[int] = None,
+    end_time_ranges: List[Optional[EndTimeRange]] = None,
+) -> Generator[Tuple[int, List[ASFProduct], int, None], None, None]:
+    """
+    Merges the products of every subquery into one stream, sorted by the primary key of
+    `ASFProduct.get_sort_keys()` (end time, latest first), yielding it in pages of
+    `INTERNAL.CMR_PAGE_SIZE` products as
+    `(0, page of products, CMR hits of all subqueries, None)`, the merge having no cursor.
+
+    CMR returns each subquery already sorted by `-end_date`, so only the current page of each
+    subquery is held, and products are k-way merged across them with a heap. Products with
+    the same end time keep the order CMR returned them in, earlier subqueries first.
+    The first merged page needs the first page of every subquery.
+
+    With `opts.maxWorkers` above 1, subquery pages are fetched on a pool of that many threads,
+    each subquery's next page requested as soon as its current page arrives
+    """
+    subquery_pages = [
+        _subquery_pages(
+            subquery_idx,
+            query,
+            url,
+            opts.session,
+            opts.prefetchDepth,
+            opts.streamPages,
+            opts.lazyProducts,
+            opts.parseWorkers,
+            max_results=max_results,
+            adaptive_page_size=opts.adaptivePageSize,
+            end_time_range=(None if end_time_ranges is None else end_time_ranges[subquery_idx]),
+        )
+        for subquery_idx, query in enumerate(queries)
+    ]
+    subquery_hits = [0] * len(queries)
+
+    executor = None
+    futures = [None] * len(queries)
+    if opts.maxWorkers > 1 and len(queries) > 1:
+        ASF_LOGGER.info(f'SEARCH: Merging subqueries with {opts.maxWorkers} workers')
+        executor = ThreadPoolExecutor(
+            max_workers=min(opts.maxWorkers, len(queries)), thread_name_prefix='asf_search'
+        )
+        futures = [executor.submit(next, pages, None) for pages in subquery_pages]
 
-        page_number = 1
-        while cmr_search_after_header is not None:
+    def next_page(subquery_idx: int):
+        if executor is None:
+            return next(subquery_pages[subquery_idx], None)
+
+        page = futures[subquery_idx].result()
+        futures[subquery_idx] = (
+            None if page is None else executor.submit(next, subquery_pages[subquery_idx], None)
+        )
+        return page
+
+    def subquery_items(subquery_idx: int):
+        while (page := next_page(subquery_idx)) is not None:
+            items, subquery_hits[subquery_idx], _ = page
+            yield from items
+
+    merged = heapq.merge(
+        *(subquery_items(subquery_idx) for subquery_idx in range(len(queries))),
+        key=lambda product: product.get_sort_keys()[0],
+        reverse=True,
+    )
+
+    try:
+        page_count = 0
+        while len(page := list(itertools.islice(merged, INTERNAL.CMR_PAGE_SIZE))):
+            page_count += 1
+            yield 0, page, sum(subquery_hits), None
+
+        if page_count == 0:
+            yield 0, [], sum(subquery_hits), None
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for pages, future in zip(subquery_pages, futures):
+            # a subquery still fetching its next page is closed once the page arrives
+            if future is None:
+                pages.close()
+            else:
+                future.add_done_callback(lambda _, pages=pages: pages.close())
+
+
+def _subquery_pages(
+    subquery_idx: int,
+    query: ASFSearchOptions,
+    url: str,
+    session: ASFSession,
+    prefetch_depth: int = 0,
+    stream_pages: bool = False,
+    lazy_products: bool = False,
+    parse_workers: int = 0,
+    max_results: Optional[int] = None,
+    adaptive_page_size: bool = False,
+    end_time_range: Optional[EndTimeRange] = None,
+    cursor: Optional[Dict] = None,
+) -> Generator[Tuple[List[ASFProduct], int, Dict], None, None]:
+    """
+    Pages through a single subquery with CMR-Search-After,
+    yielding each page of products along with the subquery's total CMR hits,
+    and the cursor to continue the subquery from after it
+
+    A cursor holds the CMR-Search-After header to request the next page with
+    (`None` after the last page), and the number of products `fetched` from CMR and
+    `dropped` by the `end_time_range` so far. Paging starts from `cursor` when given
+
+    At most `max_results` products are requested, sizing pages down to fit,
+    and with `adaptive_page_size` set page sizes follow `PageSizer`'s observations
+
+    With a `prefetch_depth` above 0, pages are requested on a background thread
+    as soon as the previous page's CMR-Search-After header arrives,
+    keeping at most `prefetch_depth` unparsed pages waiting
+
+    With `stream_pages` set, products are built while each page is read from CMR,
+    with `lazy_products` set, products are created with `ASFProduct.lazy()`.
+    With `parse_workers` above 0, products are built from each page's response body
+    on that many processes, see `_parse_page_in_pool()`
+
+    With an `end_time_range` set (a temporal shard, see `shard_subqueries()`), only products
+    ending within it are yielded, and the hits yielded leave out the products dropped so far
+    """
+    ASF_LOGGER.info(f'SUBQUERY {subquery_idx + 1}: Beginning subquery with opts: {query}')
+
+    ASF_LOGGER.debug(f'TRANSLATION: Translating subquery:\n{query}')
+    translated_opts = translate_opts(query)
+    ASF_LOGGER.debug(f'TRANSLATION: Subquery translated to cmr keywords:\n{translated_opts}')
+
+    # cached pages are stored whole, so they're decoded whole too,
+    # as are pages built by other processes
+    pool_pages = parse_workers > 0 and not lazy_products
+    stream_pages = stream_pages and getattr(session, 'cmr_cache', None) is None and not pool_pages
+    if pool_pages:
+        fetch = partial(
+            fetch_page, decode=partial(_parse_page_in_pool, session=session, workers=parse_workers)
+        )
+    elif stream_pages:
+        fetch = partial(fetch_page_stream, lazy=lazy_products)
+    else:
+        fetch = fetch_page
+    if end_time_range is not None:
+        # products dropped by the shard's filter don't count towards max_results
+        max_results = None
+    if cursor is None:
+        cursor = {'search_after': None, 'fetched': 0, 'dropped': 0}
+    pages = _cmr_pages(
+        session,
+        url,
+        translated_opts,
+        fetch,
+        max_results,
+        PageSizer(adaptive_page_size),
+        search_after=cursor['search_after'],
+        fetched=cursor['fetched'],
+    )
+    if prefetch_depth > 0:
+        pages = _prefetch_pages(pages, prefetch_depth)
+
+    page_number = 1
+    fetched_count = cursor['fetched']
+    dropped_count = cursor['dropped']
+    try:
+        while True:
             try:
                 ASF_LOGGER.debug(f'SUBQUERY {subquery_idx + 1}: Fetching page {page_number}')
-                items, subquery_max_results, cmr_search_after_header = query_cmr(
-                    opts.session, url, translated_opts, subquery_count
-                )
+                page = next(pages, None)
             except (ASFSearchError, CMRIncompleteError) as exc:
                 message = str(exc)
                 ASF_LOGGER.error(message)
                 report_search_error(query, message)
-                opts.session.headers.pop('CMR-Search-After', None)
-                # If it's a CMRIncompleteError, we can just stop here and return what we have
-                # It's up to the user to call .raise_if_incomplete() if they're using the
-                # generator directly.
-                if isinstance(exc, CMRIncompleteError):
-                    return
-                else:
-                    raise
+                raise
 
+            if page is None:
+                break
+
+            page, search_after = page
+            if stream_pages or pool_pages:
+                items, subquery_max_results = page['items'], page['hits']
+            else:
+                items, subquery_max_results = _parse_page(page, session, lazy_products)
+            fetched_count += len(items)
+            if end_time_range is not None:
+                filtered_items = filter_end_times(items, end_time_range)
+                dropped_count += len(items) - len(filtered_items)
+                items, subquery_max_results = filtered_items, subquery_max_results - dropped_count
             ASF_LOGGER.debug(
                 f'SUBQUERY {subquery_idx + 1}: Page {page_number} fetched, returned {len(items)} items.'
             )
-            opts.session.headers.update({'CMR-Search-After': cmr_search_after_header})
-            perf = time.time()
-            last_page = process_page(
-                items, maxResults, subquery_max_results, total, subquery_count, opts
+            yield (
+                items,
+                subquery_max_results,
+                {'search_after': search_after, 'fetched': fetched_count, 'dropped': dropped_count},
             )
-            ASF_LOGGER.info(f'Page Processing Time {time.time() - perf}')
-            subquery_count += len(last_page)
-            total += len(last_page)
-            last_page.searchComplete = subquery_count == subquery_max_results or total == maxResults
-            yield last_page
-
-            if last_page.searchComplete:
-                if total == maxResults:  # the user has as many results as they wanted
-                    ASF_LOGGER.info(f'SEARCH COMPLETE: MaxResults ({maxResults}) reached')
-                    opts.session.headers.pop('CMR-Search-After', None)
-                    return
-                else:  # or we've gotten all possible results for this subquery
-                    ASF_LOGGER.info(
-                        f'SUBQUERY {subquery_idx + 1} COMPLETE: results exhausted for subquery'
-                    )
-                    cmr_search_after_header = None
 
             page_number += 1
+    finally:
+        pages.close()
 
-        opts.session.headers.pop('CMR-Search-After', None)
 
-    ASF_LOGGER.info(f'SEARCH COMPLETE: results exhausted for search opts {opts}')
+def _cmr_pages(
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    fetch: Callable = None,
+    max_results: Optional[int] = None,
+    page_sizer: PageSizer = None,
+    search_after: Optional[str] = None,
+    fetched: int = 0,
+) -> Generator[Tuple[Dict, Optional[str]], None, None]:
+    """
+    Follows CMR-Search-After through every page of a translated subquery,
+    yielding each page returned by `fetch` (`fetch_page()` by default) along with
+    the CMR-Search-After header to request the next page with, `None` after the last page.
+    Paging starts from `search_after`, with `fetched` items already fetched before it
+
+    The CMR-Search-After cursor is sent with each page's request rather than stored
+    in the session's headers, so any number of subqueries can page through CMR
+    on the same session at once
+
+    Each page's size is chosen by `page_sizer`, and paging stops once
+    `max_results` items have been fetched
+    """
+    if fetch is None:
+        fetch = fetch_page
+    if page_sizer is None:
+        page_sizer = PageSizer()
+
+    cmr_search_after_header = search_after
+    subquery_count = fetched
+
+    while True:
+        remaining = None if max_results is None else max_results - subquery_count
+        page, cmr_search_after_header = fetch(
+            session,
+            url,
+            set_page_size(translated_opts, page_sizer.next_page_size(remaining)),
+            subquery_count,
+            search_after=cmr_search_after_header,
+            page_sizer=page_sizer,
+        )
+        subquery_count += len(page['items'])
+        if (
+            cmr_search_after_header is None
+            or subquery_count >= page['hits']
+            or (max_results is not None and subquery_count >= max_results)
+        ):
+            yield page, None
+            return
+
+        yield page, cmr_search_after_header
+
+
+def _prefetch_pages(pages: Generator, prefetch_depth: int) -> Generator:
+    """
+    Runs a page generator on a background thread, so the next page is requested
+    while the current one is being parsed.
+    Blocks the background thread once `prefetch_depth` pages are waiting to be consumed
+    """
+    page_queue = queue.Queue(maxsize=prefetch_depth)
+    stop_fetching = threading.Event()
+
+    def put(entry):
+        while not stop_fetching.is_set():
+            try:
+                page_queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def fetch():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    break
+        except Exception as exc:
+            put((None, exc))
+        finally:
+            pages.close()
+            put((None, None))
+
+    thread = threading.Thread(target=fetch, name='asf_search_prefetch', daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            page, exc = page_queue.get()
+            if exc is not None:
+                raise exc
+            if page is None:
+                return
+
+            yield page
+    finally:
+        stop_fetching.set()
 
 
 @retry(
     reraise=True,
     retry=retry_if_exception_type(CMRIncompleteError),
-    wait=wait_fixed(2),
+    wait=wait_fixed(2) + wait_random(0, 1),
     stop=stop_after_attempt(3),
 )
+def fetch_page(
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    sub_query_count: int,
+    search_after: str = None,
+    page_sizer: PageSizer = None,
+    decode: Callable[[bytes], Dict] = json.loads,
+) -> Tuple[Dict, Optional[str]]:
+    """
+    Requests a single page from CMR, retrying when CMR returns an incomplete page
+
+    :param search_after: the CMR-Search-After header returned with the previous page
+    :param page_sizer: observes the page's response time and size, if given
+    :param decode: decodes the response body into the page, `json.loads` by default
+    :returns the decoded CMR UMM page, and the response's CMR-Search-After header
+    """
+    cache = getattr(session, 'cmr_cache', None)
+    if cache is not None:
+        cache_key = cache.key(
+            url,
+            translated_opts,
+            search_after,
+            session.headers.get('Authorization'),
+        )
+        if (cached := cache.get(cache_key)) is not None:
+            body, cmr_search_after_header = cached
+            return decode(body), cmr_search_after_header
+
+    perf = time.time()
+    response = get_page(
+        session=session, url=url, translated_opts=translated_opts, search_after=search_after
+    )
+    page = decode(response.content)
+    _check_page_complete(page, sub_query_count, get_page_size(translated_opts))
+    if page_sizer is not None:
+        page_sizer.observe(len(page['items']), time.time() - perf, len(response.content))
+
+    cmr_search_after_header = response.headers.get('CMR-Search-After', None)
+    if cache is not None:
+        cache.set(cache_key, response.content, cmr_search_after_header)
+
+    return page, cmr_search_after_header
+
+
+@retry(
+    reraise=True,
+    retry=retry_if_exception_type(CMRIncompleteError),
+    wait=wait_fixed(2) + wait_random(0, 1),
+    stop=stop_after_attempt(3),
+)
+def fetch_page_stream(
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    sub_query_count: int,
+    lazy: bool = False,
+    search_after: str = None,
+    page_sizer: PageSizer = None,
+) -> Tuple[Dict, Optional[str]]:
+    """
+    Requests a single page from CMR and decodes it incrementally with `ijson`,
+    building each product as soon as its UMM has been read from the response
+
+    :param search_after: the CMR-Search-After header returned with the previous page
+    :param page_sizer: observes the page's response time and size, if given
+    :returns the CMR page with its items as products, and the response's CMR-Search-After header
+    """
+    perf = time.time()
+    response = get_page(
+        session=session,
+        url=url,
+        translated_opts=translated_opts,
+        stream=True,
+        search_after=search_after,
+    )
+    try:
+        page = _stream_page(response, session, lazy)
+    finally:
+        response.close()
+
+    _check_page_complete(page, sub_query_count, get_page_size(translated_opts))
+    if page_sizer is not None:
+        size = response.headers.get('Content-Length')
+        page_sizer.observe(len(page['items']), time.time() - perf, size and int(size))
+
+    return page, response.headers.get('CMR-Search-After', None)
+
+
+def _stream_page(response: Response, session: ASFSession, lazy: bool = False) -> Dict:
+    """
+    Decodes a streamed CMR UMM response one item at a time, reading `hits` once
+
+    :returns the page's products and the total CMR hits for the subquery
+    """
+    page = {'hits': 0}
+
+    def events():
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if prefix == 'hits':
+                page['hits'] = value
+            yield prefix, event, value
+
+    perf = time.time()
+    # CMR responses are usually gzipped, decompress as the stream is read
+    response.raw.decode_content = True
+    page['items'] = [
+        as_ASFProduct(item, session=session, lazy=lazy)
+        for item in ijson.items(events(), 'items.item')
+    ]
+    ASF_LOGGER.debug(f'Product Decoding & Subclassing Time {time.time() - perf}')
+
+    return page
+
+
 def query_cmr(
     session: ASFSession,
     url: str,
     translated_opts: Dict,
     sub_query_count: int,
+    search_after: str = None,
 ):
-    response = get_page(session=session, url=url, translated_opts=translated_opts)
+    page, cmr_search_after_header = fetch_page(
+        session, url, translated_opts, sub_query_count, search_after=search_after
+    )
 
-    perf = time.time()
-    items = [as_ASFProduct(f, session=session) for f in response.json()['items']]
-    ASF_LOGGER.debug(f'Product Subclassing Time {time.time() - perf}')
-    hits: int = response.json()['hits']  # total count of products given search opts
-    # 9-10 per process
-    # 3.9-5 per process
+    items, hits = _parse_page(page, session)
+
+    return items, hits, cmr_search_after_header
+
+
+def _check_page_complete(page: Dict, sub_query_count: int, page_size: int = None) -> None:
+    """
+    Raises `CMRIncompleteError` if CMR returned fewer items than expected for a page
+    of `page_size` items (defaults to `INTERNAL.CMR_PAGE_SIZE`)
+    """
+    if page_size is None:
+        page_size = INTERNAL.CMR_PAGE_SIZE
+
+    item_count = len(page['items'])
+    hits: int = page['hits']  # total count of products given search opts
     # sometimes CMR returns results with the wrong page size
-    if len(items) != INTERNAL.CMR_PAGE_SIZE and len(items) + sub_query_count < hits:
+    if item_count != page_size and item_count + sub_query_count < hits:
         raise CMRIncompleteError(
             'CMR returned page of incomplete results.'
-            f'Expected {min(INTERNAL.CMR_PAGE_SIZE, hits - sub_query_count)} results,'
-            f'got {len(items)}'
+            f'Expected {min(page_size, hits - sub_query_count)} results,'
+            f'got {item_count}'
         )
 
-    return items, hits, response.headers.get('CMR-Search-After', None)
+
+def _parse_page(
+    page: Dict, session: ASFSession, lazy: bool = False
+) -> Tuple[List[ASFProduct], int]:
+    """
+    Builds the products for a decoded CMR UMM page, with `ASFProduct.lazy()` if `lazy` is set
+
+    :returns the page's products, and the total CMR hits for the subquery
+    """
+    perf = time.time()
+    items = [as_ASFProduct(f, session=session, lazy=lazy) for f in page['items']]
+    ASF_LOGGER.debug(f'Product Subclassing Time {time.time() - perf}')
+
+    return items, page['hits']
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    :returns the process pool of `workers` processes products are built on, shared by every
+    search with `parseWorkers=workers`. Processes are spawned rather than forked, as forking
+    while search threads hold locks can deadlock the new process
+    """
+    with _parse_pools_lock:
+        pool = _parse_pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+            )
+            _parse_pools[workers] = pool
+
+        return pool
+
+
+def _parse_page_in_pool(body: bytes, session: ASFSession, workers: int = 1) -> Dict:
+    """
+    Builds the products for a CMR UMM response body on a pool of `workers` processes.
+    The body is decoded once here, where the products keep their UMM, and each process
+    is sent only its chunk of the page's items along with their ASFProduct subclasses,
+    chosen here so subclasses added with `register_product_type()` are used,
+    sending back each product's `properties`, `geometry` and `baseline`.
+    The products are then rebuilt around the UMM already in this process
+
+    :returns the page, with its items as products
+    """
+    perf = time.time()
+    page = json.loads(body)
+    umm_items = page['items']
+    chunk_size = max(1, math.ceil(len(umm_items) / workers))
+    matched_types = [get_product_type(item) for item in umm_items]
+    product_types = [ASFProduct if subclass is None else subclass for subclass in matched_types]
+
+    pool = _get_parse_pool(workers)
+    try:
+        futures = [
+            pool.submit(
+                _translate_items,
+                umm_items[idx : idx + chunk_size],
+                product_types[idx : idx + chunk_size],
+            )
+            for idx in range(0, len(umm_items), chunk_size)
+        ]
+        translated_chunks = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # a pool is broken for good once one of its processes dies, the next page starts another
+        with _parse_pools_lock:
+            if _parse_pools.get(workers) is pool:
+                del _parse_pools[workers]
+        raise
+
+    items = []
+    translated_items = itertools.chain.from_iterable(translated_chunks)
+    for item, matched_type, product_type, translated in zip(
+        umm_items, matched_types, product_types, translated_items
+    ):
+        product = product_type.lazy(item, session=session)
+        product.properties, product.geometry, product.baseline = translated
+        if matched_type is None:
+            _warn_default_product_type(product)
+        items.append(product)
+    ASF_LOGGER.debug(f'Product Decoding & Subclassing Time {time.time() - perf}')
+
+    return {'items': items, 'hits': page['hits']}
+
+
+def _translate_items(
+    items: List[Dict], subclasses: List[Type[ASFProduct]]
+) -> List[Tuple[Dict, Dict, Optional[Dict]]]:
+    """
+    Runs in a `parseWorkers` process, translating each UMM item with its ASFProduct subclass
+
+    :returns each item's `properties`, `geometry` and `baseline`
+    """
+    translated = []
+    for item, subclass in zip(items, subclasses):
+        product = subclass(item, session=None)
+        translated.append((product.properties, product.geometry, product.baseline))
+
+    return translated
 
 
 def process_page(
@@ -328,36 +1239,354 @@ def process_page(
     return last_page
 
 
+# Wait 2^x * 1 starting with 3 seconds, max 10 seconds between retries,
+# plus up to a second of jitter so workers that failed together don't retry together
+_wait_backoff = wait_exponential(multiplier=1, min=3, max=10) + wait_random(0, 1)
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """
+    :returns how long to wait before retrying a page request, the `retry_after` of an
+    `ASFSearch429Error`, or an exponential backoff
+    """
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, ASFSearch429Error) and exc.retry_after is not None:
+        return exc.retry_after
+
+    return _wait_backoff(retry_state)
+
+
+def _timeout_error_message(url: str, timeout: float) -> str:
+    """:returns the error message for a CMR request to `url` that timed out"""
+    return (
+        'Connection Error (Timeout): CMR took too long to respond. '
+        'Set asf constant "asf_search.constants.INTERNAL.CMR_TIMEOUT" to increase. '
+        f'({url=}, timeout={timeout})'
+    )
+
+
+def _get_retry_after(session: ASFSession, url: str, headers: Mapping) -> Optional[float]:
+    """
+    :returns how long to wait before retrying a request CMR answered with HTTP 429.
+    No longer if the session's rate limiter is already holding requests to `url` back
+    (see `ASFSession._after_throttled_request()`), otherwise the `Retry-After` header, if any
+    """
+    if getattr(session, 'rate_limiter', None) is not None and session._get_throttled_host(url):
+        return 0.0
+
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
 @retry(
     reraise=True,
-    retry=retry_if_exception_type(ASFSearch5xxError),
-    wait=wait_exponential(
-        multiplier=1, min=3, max=10
-    ),  # Wait 2^x * 1 starting with 3 seconds, max 10 seconds between retries
+    retry=retry_if_exception_type((ASFSearch5xxError, ASFSearch429Error)),
+    wait=_wait_before_retry,
     stop=stop_after_attempt(3),
 )
-def get_page(session: ASFSession, url: str, translated_opts: List) -> Response:
+def get_page(
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    stream: bool = False,
+    search_after: str = None,
+) -> Response:
     from asf_search.constants.INTERNAL import CMR_TIMEOUT
 
+    # the cursor is a per-request header, so concurrent searches can share `session`
+    headers = {'CMR-Search-After': search_after} if search_after else None
+
+    send = partial(
+        session.post,
+        url=url,
+        data=translated_opts,
+        timeout=CMR_TIMEOUT,
+        stream=stream,
+        headers=headers,
+    )
+    request_hedger = getattr(session, 'request_hedger', None)
+
     perf = time.time()
     try:
-        response = session.post(url=url, data=translated_opts, timeout=CMR_TIMEOUT)
+        response = send() if request_hedger is None else request_hedger.request(send)
         response.raise_for_status()
     except HTTPError as exc:
+        if response.status_code == 429:
+            raise ASFSearch429Error(
+                'HTTP 429: Too Many Requests',
+                retry_after=_get_retry_after(session, url, response.headers),
+            ) from exc
+
         error_message = f'HTTP {response.status_code}: {response.json()["errors"]}'
         if 400 <= response.status_code <= 499:
             raise ASFSearch4xxError(error_message) from exc
         if 500 <= response.status_code <= 599:
             raise ASFSearch5xxError(error_message) from exc
     except ReadTimeout as exc:
-        raise ASFSearchError(
-            f'Connection Error (Timeout): CMR took too long to respond. Set asf constant "asf_search.constants.INTERNAL.CMR_TIMEOUT" to increase. ({url=}, timeout={CMR_TIMEOUT})'
-        ) from exc
+        raise ASFSearchError(_timeout_error_message(url, CMR_TIMEOUT)) from exc
 
     ASF_LOGGER.info(f'Query Time Elapsed {time.time() - perf}')
     return response
 
 
+async def search_generator_async(
+    opts: ASFSearchOptions = None,
+    client: 'aiohttp.ClientSession' = None,
+    **kwargs,
+) -> AsyncGenerator[ASFSearchResults, None]:
+    """
+    Asynchronous counterpart to `asf_search.search_generator()`,
+    yielding results page by page without blocking the running event loop.
+
+    Accepts the same search parameters as `search_generator()` as keyword arguments,
+    and/or an ASFSearchOptions object, except `spatialTiles`, `temporalShards`,
+    `sortedStream`, `checkpoint` and `resumeFromCheckpoint`, which raise `ValueError`. `maxWorkers`, `asCompleted`, `prefetchDepth`,
+    `streamPages` and `parseWorkers` only change how `search_generator()` runs,
+    and are ignored.
+
+    requires installing optional dependencies via pip or conda to use the `aiohttp` package:
+
+    `python3 -m pip install asf-search[extras]`
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+        Search parameters specified outside this object will override in event of a conflict.
+    client:
+        The `aiohttp.ClientSession` used to query CMR. Sharing one client between
+        many concurrent searches lets them reuse connections.
+        Defaults to a new client that is closed once the search finishes.
+        Headers (including EDL authorization) are always taken from `opts.session`
+
+    Yields
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct, page by page)
+    """
+    opts, maxResults = _build_search_opts(opts, kwargs)
+
+    unsupported = {
+        'spatialTiles': opts.spatialTiles > 1,
+        'temporalShards': opts.temporalShards > 1,
+        'sortedStream': opts.sortedStream,
+        'checkpoint': opts.checkpoint is not None,
+        'resumeFromCheckpoint': opts.resumeFromCheckpoint,
+    }
+    if any(unsupported.values()):
+        raise ValueError(
+            f'{", ".join(name for name, used in unsupported.items() if used)} '
+            'cannot be used with asynchronous searches, use `search_generator()` instead'
+        )
+
+    url = '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
+    total = 0
+
+    queries = build_subqueries(opts)
+
+    # products returned by more than one subquery are only yielded the first time
+    seen_keys = None
+    if opts.dropDuplicates:
+        seen_keys = (
+            set() if opts.duplicateBloomCapacity <= 0 else BloomFilter(opts.duplicateBloomCapacity)
+        )
+
+    ASF_LOGGER.info(f'SEARCH: Using cmr endpoint: "{url}"')
+    ASF_LOGGER.debug(f'SEARCH: Built {len(queries)} subqueries')
+
+    close_client = client is None
+    if client is None:
+        client = _get_async_client()
+
+    try:
+        for subquery_idx, query in enumerate(queries):
+            ASF_LOGGER.info(f'SUBQUERY {subquery_idx + 1}: Beginning subquery with opts: {query}')
+            translated_opts = translate_opts(query)
+            page_sizer = PageSizer(opts.adaptivePageSize)
+            cmr_search_after_header = ''
+            subquery_count = 0
+
+            while cmr_search_after_header is not None:
+                # duplicates don't count towards maxResults, so pages aren't sized down for it
+                remaining = (
+                    None if maxResults is None or seen_keys is not None else maxResults - total
+                )
+                page_opts = set_page_size(translated_opts, page_sizer.next_page_size(remaining))
+                perf = time.time()
+                try:
+                    items, subquery_max_results, cmr_search_after_header = await query_cmr_async(
+                        client,
+                        opts.session,
+                        url,
+                        page_opts,
+                        subquery_count,
+                        cmr_search_after_header,
+                        opts.lazyProducts,
+                    )
+                except (ASFSearchError, CMRIncompleteError) as exc:
+                    message = str(exc)
+                    ASF_LOGGER.error(message)
+                    await asyncio.to_thread(report_search_error, query, message)
+                    if isinstance(exc, CMRIncompleteError):
+                        return
+                    else:
+                        raise
+
+                page_sizer.observe(len(items), time.time() - perf)
+
+                duplicate_count = 0
+                if seen_keys is not None:
+                    unique_items = drop_duplicates(items, seen_keys)
+                    duplicate_count = len(items) - len(unique_items)
+                    items = unique_items
+
+                last_page = process_page(
+                    items, maxResults, subquery_max_results, total, subquery_count, opts
+                )
+                subquery_count += len(last_page) + duplicate_count
+                total += len(last_page)
+                last_page.searchComplete = (
+                    subquery_count == subquery_max_results or total == maxResults
+                )
+                yield last_page
+
+                if total == maxResults:
+                    ASF_LOGGER.info(f'SEARCH COMPLETE: MaxResults ({maxResults}) reached')
+                    return
+                elif last_page.searchComplete:
+                    ASF_LOGGER.info(
+                        f'SUBQUERY {subquery_idx + 1} COMPLETE: results exhausted for subquery'
+                    )
+                    cmr_search_after_header = None
+    finally:
+        if close_client:
+            await client.close()
+
+    ASF_LOGGER.info(f'SEARCH COMPLETE: results exhausted for search opts {opts}')
+
+
+@retry(
+    reraise=True,
+    retry=retry_if_exception_type(CMRIncompleteError),
+    wait=wait_fixed(2) + wait_random(0, 1),
+    stop=stop_after_attempt(3),
+)
+async def query_cmr_async(
+    client: 'aiohttp.ClientSession',
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    sub_query_count: int,
+    search_after: str = None,
+    lazy: bool = False,
+):
+    page, cmr_search_after_header = await get_page_async(
+        client=client,
+        session=session,
+        url=url,
+        translated_opts=translated_opts,
+        search_after=search_after,
+    )
+
+    _check_page_complete(page, sub_query_count, get_page_size(translated_opts))
+    # building products is CPU bound, so it's done off the event loop like decoding
+    items, hits = await asyncio.to_thread(_parse_page, page, session, lazy)
+
+    return items, hits, cmr_search_after_header
+
+
+@retry(
+    reraise=True,
+    retry=retry_if_exception_type((ASFSearch5xxError, ASFSearch429Error)),
+    wait=_wait_before_retry,
+    stop=stop_after_attempt(3),
+)
+async def get_page_async(
+    client: 'aiohttp.ClientSession',
+    session: ASFSession,
+    url: str,
+    translated_opts: List,
+    search_after: str = None,
+) -> Tuple[Dict, Optional[str]]:
+    """
+    Asynchronous counterpart to `get_page()`, using `session` only for its headers
+
+    :returns the decoded CMR response, and the response's CMR-Search-After header
+    """
+    from asf_search.constants.INTERNAL import CMR_TIMEOUT
+
+    headers = {
+        **session.headers,
+        'Content-Type': 'application/x-www-form-urlencoded',
+    }
+    if search_after:
+        headers['CMR-Search-After'] = search_after
+
+    async def post():
+        async with client.post(url, data=urlencode(translated_opts), headers=headers) as response:
+            return response.status, await response.read(), response.headers
+
+    # the session's rate limiter and circuit breaker apply to requests made with `client` too
+    throttled_host = session._get_throttled_host(url)
+    if throttled_host is not None:
+        delay = session._before_throttled_request(throttled_host)
+        if delay > 0:
+            ASF_LOGGER.debug(f'RATE LIMIT: waiting {delay:.2f}s for {throttled_host}')
+            await asyncio.sleep(delay)
+
+    perf = time.time()
+    try:
+        status, body, response_headers = await asyncio.wait_for(post(), CMR_TIMEOUT)
+    except asyncio.TimeoutError as exc:
+        if throttled_host is not None:
+            session._after_throttled_request(throttled_host, None)
+        raise ASFSearchError(_timeout_error_message(url, CMR_TIMEOUT)) from exc
+    except Exception:
+        if throttled_host is not None:
+            session._after_throttled_request(throttled_host, None)
+        raise
+
+    if throttled_host is not None:
+        session._after_throttled_request(throttled_host, status, response_headers)
+
+    cmr_search_after_header = response_headers.get('CMR-Search-After', None)
+
+    # 429 responses aren't always JSON, and their body isn't used
+    if status == 429:
+        raise ASFSearch429Error(
+            'HTTP 429: Too Many Requests',
+            retry_after=_get_retry_after(session, url, response_headers),
+        )
+
+    # decoding a large page on the event loop would hold up every other task on it
+    page = await asyncio.to_thread(json.loads, body)
+    if 400 <= status <= 599:
+        error_message = f'HTTP {status}: {page["errors"]}'
+        if status <= 499:
+            raise ASFSearch4xxError(error_message)
+        raise ASFSearch5xxError(error_message)
+
+    ASF_LOGGER.info(f'Query Time Elapsed {time.time() - perf}')
+    return page, cmr_search_after_header
+
+
+def _get_async_client() -> 'aiohttp.ClientSession':
+    # aiohttp is slow to import, so it's only imported for asynchronous searches
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            'Could not find aiohttp package in current python environment.'
+            '"aiohttp" is an optional dependency of asf-search required'
+            'for asynchronous searches.'
+            'Enable by including the appropriate pip or conda install.'
+            'Ex: `python3 -m pip install asf-search[extras]`'
+        ) from None
+
+    return aiohttp.ClientSession()
+
+
 def preprocess_opts(opts: ASFSearchOptions):
     # Repair WKT here so it only happens once, and you can save the result to the new Opts object:
     wrap_wkt(opts=opts)
@@ -381,6 +1610,8 @@ def wrap_wkt(opts: ASFSearchOptions):
 
 
 def set_default_dates(opts: ASFSearchOptions):
+    import dateparser
+
     if opts.start is not None and isinstance(opts.start, str):
         opts.start = dateparser.parse(opts.start, settings={'RETURN_AS_TIMEZONE_AWARE': True})
     if opts.end is not None and isinstance(opts.end, str):
@@ -436,59 +1667,130 @@ def set_platform_alias(opts: ASFSearchOptions):
         opts.platform = list(set(platform_list))
 
 
-_dataset_collection_items = dataset_collections.items()
-
-
-def as_ASFProduct(item: Dict, session: ASFSession) -> ASFProduct:
+def as_ASFProduct(item: Dict, session: ASFSession, lazy: bool = False) -> ASFProduct:
     """Returns the granule umm as the corresponding ASFProduct subclass,
     or ASFProduct if no equivalent is found
 
     :param item: the granule umm json
     :param session: the session used to query CMR for the product
+    :param lazy: create the product with `ASFProduct.lazy()`
 
     :returns the granule as an object of type ASFProduct
     """
-    if ASFProductType.OPERAS1Product._is_subclass(item):
-        return ASFProductType.OPERAS1Product(item, session=session)
+    subclass = get_product_type(item)
+    if subclass is not None:
+        return _create_product(subclass, item, session, lazy)
+
+    output = _create_product(ASFProduct, item, session, lazy)
+    _warn_default_product_type(output)
+    return output
+
+
+def _warn_default_product_type(product: ASFProduct) -> None:
+    granule_concept_id = product.meta.get('concept-id', 'Missing Granule Concept ID')
+    fileID = product.properties.get(
+        'fileID', product.properties.get('sceneName', 'fileID and sceneName Missing')
+    )
+
+    ASF_LOGGER.warning(
+        f'Failed to find corresponding ASFProduct subclass for \
+        Product: "{fileID}", Granule Concept ID: "{granule_concept_id}", \
+        default to "ASFProduct"'
+    )
+
+
+def get_product_type(item: Dict) -> Optional[Type[ASFProduct]]:
+    """Finds the ASFProduct subclass for a granule umm, checking (in order) its
+    collection concept-id, collection shortName (or dataset), and platform
+
+    Each check is a single dict lookup, see `register_product_type()`
+    to have custom subclasses matched the same way
+
+    :param item: the granule umm json
+
+    :returns the matching ASFProduct subclass, or None if no subclass matches
+    """
+    # not all umm products have this field set,
+    # but when it's available it's convenient for fast matching
+    subclass = product_types_by_concept_id.get(item['meta'].get('collection-concept-id'))
+    if subclass is not None:
+        return subclass
 
     product_type_key = _get_product_type_key(item)
 
     # if there's a direct entry in our dataset to product type dict
-    # perf = time.time()
     subclass = dataset_to_product_types.get(product_type_key)
     if subclass is not None:
-        # ASF_LOGGER.warning(f'subclass selection time {time.time() - perf}')
-        return subclass(item, session=session)
+        return subclass
 
     # if the key matches one of the shortnames in any of our datasets
-    for dataset, collections in _dataset_collection_items:
-        if collections.get(product_type_key) is not None:
-            subclass = dataset_to_product_types.get(dataset)
-            if subclass is not None:
-                # ASF_LOGGER.warning(f'subclass selection time {time.time() - perf}')
-                return subclass(item, session=session)
-            break  # dataset exists, but is not in dataset_to_product_types yet
+    # (a dataset may exist without being in dataset_to_product_types yet)
+    dataset = _get_short_name_datasets().get(product_type_key)
+    if (subclass := dataset_to_product_types.get(dataset)) is not None:
+        return subclass
 
     # If the platform exists, try to match it
     platform = _get_platform(item=item)
     if ASFProductType.ARIAS1GUNWProduct._is_subclass(item=item):
-        return dataset_to_product_types.get('ARIA S1 GUNW')(item, session=session)
-    elif (subclass := dataset_to_product_types.get(platform)) is not None:
-        return subclass(item, session=session)
+        return dataset_to_product_types.get('ARIA S1 GUNW')
 
-    output = ASFProduct(item, session=session)
+    return product_types_by_platform.get(platform, dataset_to_product_types.get(platform))
 
-    granule_concept_id = output.meta.get('concept-id', 'Missing Granule Concept ID')
-    fileID = output.properties.get(
-        'fileID', output.properties.get('sceneName', 'fileID and sceneName Missing')
-    )
 
-    ASF_LOGGER.warning(
-        f'Failed to find corresponding ASFProduct subclass for \
-        Product: "{fileID}", Granule Concept ID: "{granule_concept_id}", \
-        default to "ASFProduct"'
-    )
-    return output
+def register_product_type(
+    subclass: Type[ASFProduct],
+    short_names: Sequence[str] = (),
+    concept_ids: Sequence[str] = (),
+    platforms: Sequence[str] = (),
+) -> None:
+    """Registers an ASFProduct subclass, so search results matching any of the given
+    collections or platforms are returned as that subclass
+
+    Registrations replace any existing subclass for the same key
+
+    :param subclass: the ASFProduct subclass to create results with
+    :param short_names: collection shortNames (UMM `CollectionReference.ShortName`)
+        or dataset names (see `asf_search.DATASET`)
+    :param concept_ids: collection concept-ids (`collection-concept-id` in the UMM meta),
+        these take precedence over shortNames and platforms
+    :param platforms: platform shortNames (UMM `Platforms.ShortName`), used for results
+        that don't match a collection
+    """
+    if not (isinstance(subclass, type) and issubclass(subclass, ASFProduct)):
+        raise TypeError(f'Expected an ASFProduct subclass, got {subclass}')
+
+    for short_name in short_names:
+        dataset_to_product_types[short_name] = subclass
+    for concept_id in concept_ids:
+        product_types_by_concept_id[concept_id] = subclass
+    for platform in platforms:
+        product_types_by_platform[platform] = subclass
+
+
+_short_name_datasets = None
+
+
+def _get_short_name_datasets() -> Dict[str, str]:
+    """Maps every collection shortName in `dataset_collections` to its dataset,
+    built on first use. The first dataset listing a shortName wins"""
+    global _short_name_datasets
+    if _short_name_datasets is None:
+        short_name_datasets = {}
+        for dataset, collections in dataset_collections.items():
+            for short_name in collections:
+                short_name_datasets.setdefault(short_name, dataset)
+        _short_name_datasets = short_name_datasets
+
+    return _short_name_datasets
+
+
+def _create_product(
+    subclass: Type[ASFProduct], item: Dict, session: ASFSession, lazy: bool
+) -> ASFProduct:
+    if lazy:
+        return subclass.lazy(item, session=session)
+
+    return subclass(item, session=session)
 
 
 def _get_product_type_key(item: Dict) -> str:
@@ -538,3 +1840,13 @@ dataset_to_product_types = {
     'SEASAT 1': ASFProductType.SEASATProduct,
     'NISAR': ASFProductType.NISARProduct,
 }
+
+# Maps collection concept-ids to ASFProduct subclasses, checked before shortNames
+product_types_by_concept_id = {
+    concept_id: ASFProductType.OPERAS1Product
+    for concept_id in ASFProductType.OPERAS1Product._subclass_concept_ids
+}
+
+# Maps platform shortNames to ASFProduct subclasses registered with `register_product_type()`,
+# checked before platforms in `dataset_to_product_types`
+product_types_by_platform = {}
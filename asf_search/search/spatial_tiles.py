@@ -0,0 +1,81 @@
+from copy import copy
+import math
+from typing import List
+
+from shapely import wkt
+from shapely.geometry import MultiPolygon, Polygon, box
+from shapely.geometry.polygon import orient
+
+from asf_search import ASF_LOGGER
+from asf_search.ASFSearchOptions import ASFSearchOptions
+
+
+def tile_subqueries(queries: List[ASFSearchOptions], tiles: int) -> List[ASFSearchOptions]:
+    """
+    Splits each subquery with a polygon `intersectsWith` into one subquery per tile of
+    its AOI (see `tile_wkt()`), keeping the subquery order. Subqueries searching a point
+    or line, or without an AOI, aren't split.
+
+    Granules overlapping more than one tile are returned by each of those tiles' subqueries,
+    see `asf_search.search.duplicates.drop_duplicates()`
+    """
+    tiled_queries = []
+    for query in queries:
+        if query.intersectsWith is None:
+            tiled_queries.append(query)
+            continue
+
+        for tile in tile_wkt(query.intersectsWith, tiles):
+            tiled_query = copy(query)
+            tiled_query.intersectsWith = tile
+            tiled_queries.append(tiled_query)
+
+    ASF_LOGGER.debug(f'SPATIAL TILES: {len(queries)} subqueries split into {len(tiled_queries)}')
+    return tiled_queries
+
+
+def tile_wkt(aoi: str, tiles: int) -> List[str]:
+    """
+    Splits a polygon AOI along a longitude/latitude grid of about `tiles` cells,
+    shaped to the AOI's bounding box. Cells the AOI doesn't cover are skipped, and cells
+    it covers in several separate parts give one tile per part.
+
+    :returns the WKT of each tile, counter-clockwise and in grid order
+    (west to east, then south to north), or `aoi` itself if it isn't a polygon
+    """
+    shape = wkt.loads(aoi)
+    if tiles <= 1 or not isinstance(shape, (Polygon, MultiPolygon)):
+        return [aoi]
+
+    min_x, min_y, max_x, max_y = shape.bounds
+    width, height = max_x - min_x, max_y - min_y
+    if width == 0 or height == 0:
+        return [aoi]
+
+    columns = max(1, min(tiles, round(math.sqrt(tiles * width / height))))
+    rows = math.ceil(tiles / columns)
+
+    tile_wkts = []
+    for row in range(rows):
+        for column in range(columns):
+            cell = box(
+                min_x + width * column / columns,
+                min_y + height * row / rows,
+                max_x if column == columns - 1 else min_x + width * (column + 1) / columns,
+                max_y if row == rows - 1 else min_y + height * (row + 1) / rows,
+            )
+            tile = shape.intersection(cell)
+            for part in getattr(tile, 'geoms', [tile]):
+                if isinstance(part, Polygon) and part.area > 0:
+                    tile_wkts.append(_clean_tile(part))
+
+    return tile_wkts if len(tile_wkts) else [aoi]
+
+
+def _clean_tile(tile: Polygon) -> str:
+    """
+    Rounds away the floating point noise cell intersections leave in a tile's coordinates,
+    dropping the near duplicate points it leaves behind
+    """
+    rounded = wkt.loads(wkt.dumps(tile, rounding_precision=8, trim=True)).simplify(0)
+    return wkt.dumps(orient(rounded, sign=1.0), rounding_precision=8, trim=True)
@@ -0,0 +1,182 @@
+from copy import copy
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple, Union
+
+from asf_search import ASF_LOGGER
+from asf_search.ASFProduct import ASFProduct
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.ASFSearchOptions.validators import parse_date
+from asf_search.constants import INTERNAL
+
+# (earliest end time, latest end time) of the granules a shard returns, upper bound exclusive,
+# `None` for no bound
+EndTimeRange = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def shard_subqueries(
+    queries: List[ASFSearchOptions],
+    shards: int,
+    balance: bool = False,
+    opts: ASFSearchOptions = None,
+) -> Tuple[List[ASFSearchOptions], List[Optional[EndTimeRange]]]:
+    """
+    Splits each subquery's `start`-`end` range into up to `shards` time windows,
+    one subquery per window, latest window first.
+
+    CMR matches granules whose time range overlaps a window, so a granule can match two
+    adjacent windows. Each window only keeps the granules whose end time falls within it
+    (see `filter_end_times()`), so every granule is returned once, and results from the
+    windows of a subquery, read in order, keep the `-end_date` sort of the whole subquery.
+
+    Subqueries without a `start`, with a `season`, or shorter than
+    `INTERNAL.TEMPORAL_SHARD_MIN_SECONDS` per window aren't split.
+    Subqueries without an `end` are split up to the current time.
+
+    :param queries: the subqueries to split
+    :param shards: the number of windows to split each subquery into
+    :param balance: size windows to hold roughly the same number of granules,
+    from the hit counts of `INTERNAL.TEMPORAL_SHARD_SAMPLES` windows per shard
+    :param opts: the search options, for the session and workers used to count hits
+    :returns the split subqueries, and each one's `EndTimeRange` (`None` if not split)
+    """
+    sharded_queries, end_time_ranges = [], []
+
+    for query in queries:
+        windows = _get_windows(query, shards, balance, opts)
+        if windows is None:
+            sharded_queries.append(query)
+            end_time_ranges.append(None)
+            continue
+
+        # latest window first, so pages are read in the same order CMR sorts them
+        for idx, (window_start, window_end) in enumerate(reversed(windows)):
+            shard = copy(query)
+            shard.start = _format_date(window_start)
+            shard.end = _format_date(window_end)
+            sharded_queries.append(shard)
+            end_time_ranges.append(
+                (
+                    None if idx == len(windows) - 1 else window_start,
+                    None if idx == 0 else window_end,
+                )
+            )
+
+    ASF_LOGGER.debug(
+        f'TEMPORAL SHARDS: {len(queries)} subqueries split into {len(sharded_queries)}'
+    )
+    return sharded_queries, end_time_ranges
+
+
+def filter_end_times(
+    items: List[ASFProduct], end_time_range: Optional[EndTimeRange]
+) -> List[ASFProduct]:
+    """:returns the products whose UMM end time falls within `end_time_range`"""
+    if end_time_range is None:
+        return items
+
+    earliest, latest = end_time_range
+    filtered = []
+    for item in items:
+        end_time = _get_end_time(item)
+        if end_time is None:
+            # without an end time to place it by, the product is kept by the latest window
+            if latest is None:
+                filtered.append(item)
+        elif (earliest is None or end_time >= earliest) and (latest is None or end_time < latest):
+            filtered.append(item)
+
+    return filtered
+
+
+def _get_windows(
+    query: ASFSearchOptions, shards: int, balance: bool, opts: Optional[ASFSearchOptions]
+) -> Optional[List[Tuple[datetime, datetime]]]:
+    """:returns the `(start, end)` of each window `query` is split into, earliest first"""
+    if query.start is None or query.season is not None:
+        return None
+
+    start = _to_datetime(query.start).replace(microsecond=0)
+    end = datetime.now(timezone.utc) if query.end is None else _to_datetime(query.end)
+    end = end.replace(microsecond=0)
+
+    shards = min(shards, int((end - start).total_seconds() // INTERNAL.TEMPORAL_SHARD_MIN_SECONDS))
+    if shards <= 1:
+        return None
+
+    edges = _equal_edges(start, end, shards)
+    if balance:
+        edges = _balanced_edges(query, start, end, shards, opts)
+
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _equal_edges(start: datetime, end: datetime, count: int) -> List[datetime]:
+    # CMR dates are sent to the second, so edges are too, keeping the windows contiguous
+    step = (end - start) / count
+    return [(start + step * idx).replace(microsecond=0) for idx in range(count)] + [end]
+
+
+def _balanced_edges(
+    query: ASFSearchOptions,
+    start: datetime,
+    end: datetime,
+    shards: int,
+    opts: Optional[ASFSearchOptions],
+) -> List[datetime]:
+    """
+    Places window edges so each window holds about the same number of CMR hits,
+    counting the hits of `INTERNAL.TEMPORAL_SHARD_SAMPLES` equal windows per shard
+    """
+    # search_count imports search_generator, which imports this module
+    from asf_search.search.search_count import _get_subquery_counts
+
+    sample_edges = _equal_edges(start, end, shards * INTERNAL.TEMPORAL_SHARD_SAMPLES)
+    samples = []
+    for sample_start, sample_end in zip(sample_edges[:-1], sample_edges[1:]):
+        sample = copy(query)
+        sample.start = _format_date(sample_start)
+        sample.end = _format_date(sample_end)
+        samples.append(sample)
+
+    counts = _get_subquery_counts(query if opts is None else opts, samples)
+    total = sum(counts)
+    if total == 0:
+        return _equal_edges(start, end, shards)
+
+    edges = [start]
+    cumulative = 0
+    for sample_end, count in zip(sample_edges[1:-1], counts):
+        cumulative += count
+        if len(edges) < shards and cumulative >= total * len(edges) / shards:
+            edges.append(sample_end)
+    edges.append(end)
+
+    ASF_LOGGER.debug(f'TEMPORAL SHARDS: balanced {total} hits into {len(edges) - 1} windows')
+    return edges
+
+
+def _get_end_time(item: ASFProduct) -> Optional[datetime]:
+    temporal = (item.umm or {}).get('TemporalExtent', {})
+    end_time = temporal.get('RangeDateTime', {}).get('EndingDateTime') or temporal.get(
+        'SingleDateTime'
+    )
+    if end_time is None:
+        return None
+
+    return _to_datetime(end_time)
+
+
+def _to_datetime(value: Union[str, datetime]) -> datetime:
+    if not isinstance(value, datetime):
+        try:
+            value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            value = datetime.strptime(parse_date(value), '%Y-%m-%dT%H:%M:%SZ')
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return value
+
+
+def _format_date(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
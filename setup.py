@@ -28,6 +28,10 @@ test_requirements = [
 extra_requirements = [
     'remotezip>=0.10.0',
     'ciso8601',
+    'aiohttp',
+    'ijson',
+    'pyarrow',
+    'pandas',
 ]
 
 
@@ -1,5 +1,11 @@
+import os
+import sys
+import time
+from typing import Dict
+
 import pytest
 import unittest
+import yaml
 
 from asf_search import (
     ASFProduct,
@@ -7,6 +13,12 @@ from asf_search import (
     ASFSearchOptions,
     ASFSession,
     FileDownloadType,
+    ALOSProduct,
+    OPERAS1Product,
+    S1BurstProduct,
+    S1Product,
+    get_product_type,
+    register_product_type,
 )
 from unittest.mock import patch
 from shapely.geometry import shape
@@ -104,3 +116,202 @@ def run_test_ASFProduct_download(reference, filename, filetype, additional_urls)
                     product.download('./', filename=filename, fileType=filetype)
             else:
                 product.download('./', filename=filename, fileType=filetype)
+
+
+UMM_PROPERTY_FIXTURES = {
+    'S1': 'S1_response.yml',
+    'SLC-BURST': 'SLC_BURST.yml',
+    'OPERA-S1': 'OPERA_Products.yml',
+    'ALOS': 'Alos_response.yml',
+}
+
+
+def _load_umm_property_fixtures():
+    resources = os.path.join(os.path.dirname(__file__), '..', 'yml_tests', 'Resources')
+    fixtures = {}
+    for name, filename in UMM_PROPERTY_FIXTURES.items():
+        with open(os.path.join(resources, filename), 'r') as f:
+            items = yaml.safe_load(f)
+        fixtures[name] = items if isinstance(items, list) else [items]
+
+    return fixtures
+
+
+def _read_umm_properties_uncompiled(product: ASFProduct, umm: Dict) -> Dict:
+    return {
+        prop: product._read_umm_property(umm, mapping)
+        for prop, mapping in product._base_properties.items()
+    }
+
+
+def test_ASFProduct_compiled_property_readers():
+    for name, items in _load_umm_property_fixtures().items():
+        for item in items:
+            product = as_ASFProduct(item, ASFSession())
+            properties = product.translate_product(item)['properties']
+
+            expected = _read_umm_properties_uncompiled(product, item['umm'])
+            for prop, value in expected.items():
+                if value is None and prop in product._fallback_properties:
+                    continue
+                assert properties[prop] == value, f'{name}: {prop}'
+
+            for prop, mapping in product._fallback_properties.items():
+                if expected.get(prop) is None:
+                    assert properties[prop] == product._read_umm_property(item['umm'], mapping)
+
+
+@pytest.mark.skipif(
+    'ASF_SEARCH_BENCHMARKS' not in os.environ,
+    reason='set ASF_SEARCH_BENCHMARKS=1 to run benchmarks',
+)
+def test_ASFProduct_compiled_property_readers_benchmark():
+    """
+    Compares products/second reading `_base_properties` with the compiled readers
+    and with `umm_get()` for each path, run with `-s` to see the results
+    """
+    iterations = 200
+    for name, items in _load_umm_property_fixtures().items():
+        products = [(as_ASFProduct(item, ASFSession()), item) for item in items]
+
+        perf = time.perf_counter()
+        for _ in range(iterations):
+            uncompiled = [
+                _read_umm_properties_uncompiled(product, item['umm']) for product, item in products
+            ]
+        uncompiled_rate = iterations * len(products) / (time.perf_counter() - perf)
+
+        perf = time.perf_counter()
+        for _ in range(iterations):
+            compiled = []
+            for product, item in products:
+                read_properties, _ = product._get_property_readers()
+                umm_indexes = {}
+                compiled.append(
+                    {prop: read(item['umm'], umm_indexes) for prop, read in read_properties.items()}
+                )
+        compiled_rate = iterations * len(products) / (time.perf_counter() - perf)
+
+        print(
+            f'{name}: {uncompiled_rate:.0f} products/s uncompiled, '
+            f'{compiled_rate:.0f} products/s compiled ({compiled_rate / uncompiled_rate:.1f}x)'
+        )
+        assert compiled == uncompiled, name
+
+
+def test_ASFProduct_lazy():
+    for name, items in _load_umm_property_fixtures().items():
+        for item in items:
+            eager = as_ASFProduct(item, ASFSession())
+            lazy = as_ASFProduct(item, ASFSession(), lazy=True)
+
+            assert type(lazy) is type(eager)
+            for attr in ['_properties', '_geometry', '_baseline']:
+                assert attr not in lazy.__dict__, f'{name}: {attr}'
+
+            assert lazy.geometry == eager.geometry
+            assert '_properties' not in lazy.__dict__
+            assert lazy.properties == eager.properties
+            assert lazy.baseline == eager.baseline
+            assert lazy.geojson() == eager.geojson()
+
+            assert lazy.centroid() is lazy.centroid()
+            assert lazy.centroid().equals(eager.centroid())
+
+
+def test_ASFProduct_translate_product_override():
+    class TranslatedProduct(ALOSProduct):
+        def translate_product(self, item: Dict) -> Dict:
+            translated = super().translate_product(item)
+            translated['properties']['granuleUR'] = item['umm']['GranuleUR']
+            translated['properties']['groupID'] = None
+            translated['geometry'] = {'coordinates': None, 'type': 'Polygon'}
+            return translated
+
+    item = _load_umm_property_fixtures()['ALOS'][0]
+    expected = ALOSProduct(item, ASFSession())
+    for product in [
+        TranslatedProduct(item, ASFSession()),
+        TranslatedProduct.lazy(item, ASFSession()),
+    ]:
+        assert product.properties['granuleUR'] == item['umm']['GranuleUR']
+        # ALOSProduct._init_properties() still runs on the overridden properties
+        assert product.properties['groupID'] == product.properties['sceneName']
+        assert product.geometry == {'coordinates': None, 'type': 'Polygon'}
+        assert product.baseline == expected.baseline
+
+
+def test_S1Product_baseline_calculated_once():
+    item = _load_umm_property_fixtures()['S1'][0]
+    S1Product = type(as_ASFProduct(item, ASFSession()))
+
+    with patch.object(
+        S1Product,
+        'get_baseline_calc_properties',
+        autospec=True,
+        side_effect=S1Product.get_baseline_calc_properties,
+    ) as baseline_calc:
+        product = as_ASFProduct(item, ASFSession())
+        assert baseline_calc.call_count == 1
+        assert product.baseline is not None
+
+        lazy = as_ASFProduct(item, ASFSession(), lazy=True)
+        _ = lazy.properties
+        assert baseline_calc.call_count == 1
+        assert lazy.baseline == product.baseline
+        assert baseline_calc.call_count == 2
+
+
+def test_get_product_type():
+    expected = {
+        'S1': S1Product,
+        'SLC-BURST': S1BurstProduct,
+        'OPERA-S1': OPERAS1Product,
+        'ALOS': ALOSProduct,
+    }
+    for name, items in _load_umm_property_fixtures().items():
+        for item in items:
+            assert get_product_type(item) is expected[name]
+            assert type(as_ASFProduct(item, ASFSession())) is expected[name]
+
+    unknown = {'meta': {}, 'umm': {'Platforms': [{'ShortName': 'UNKNOWN'}]}}
+    assert get_product_type(unknown) is None
+    assert type(as_ASFProduct(unknown, ASFSession())) is ASFProduct
+
+
+def test_register_product_type(monkeypatch):
+    class CustomProduct(ASFProduct):
+        pass
+
+    # registrations are global, restore the dispatch tables afterwards
+    search_generator = sys.modules['asf_search.search.search_generator']
+    for name in ['dataset_to_product_types', 'product_types_by_concept_id']:
+        monkeypatch.setattr(search_generator, name, {**getattr(search_generator, name)})
+    monkeypatch.setattr(search_generator, 'product_types_by_platform', {})
+
+    register_product_type(
+        CustomProduct,
+        short_names=['CUSTOM_SHORT_NAME'],
+        concept_ids=['C0000000001-ASF'],
+        platforms=['CUSTOM_PLATFORM'],
+    )
+
+    by_short_name = {
+        'meta': {},
+        'umm': {'CollectionReference': {'ShortName': 'CUSTOM_SHORT_NAME'}},
+    }
+    by_concept_id = {
+        'meta': {'collection-concept-id': 'C0000000001-ASF'},
+        'umm': {'CollectionReference': {'ShortName': 'SENTINEL-1'}},
+    }
+    by_platform = {'meta': {}, 'umm': {'Platforms': [{'ShortName': 'CUSTOM_PLATFORM'}]}}
+    for item in [by_short_name, by_concept_id, by_platform]:
+        assert get_product_type(item) is CustomProduct
+        assert type(as_ASFProduct(item, ASFSession())) is CustomProduct
+
+    item = _load_umm_property_fixtures()['S1'][0]
+    register_product_type(CustomProduct, platforms=[item['umm']['Platforms'][0]['ShortName']])
+    assert get_product_type(item) is S1Product
+
+    with pytest.raises(TypeError):
+        register_product_type(dict, short_names=['CUSTOM_SHORT_NAME'])
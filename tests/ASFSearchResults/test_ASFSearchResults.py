@@ -1,3 +1,4 @@
+from copy import copy
 from typing import Dict, List
 
 import asf_search as asf
@@ -8,6 +9,11 @@ import json
 import shapely.wkt as WKT
 import requests
 import csv
+import os
+
+import numpy as np
+import pytest
+import yaml
 
 from shapely.geometry import Polygon
 from shapely.wkt import loads
@@ -19,6 +25,7 @@ from asf_search import ASF_LOGGER
 import re
 
 from asf_search.exceptions import ASFSearchError
+from asf_search.search.search_generator import as_ASFProduct
 
 # when this replaces SearchAPI change values to cached
 API_URL = 'https://api.daac.asf.alaska.edu/services/search/param?'
@@ -238,3 +245,92 @@ def run_test_ASFSearchResults_intersection(wkt: str):
                     overlap_check(product_geom_wrapped, wrapped)
                     or overlap_check(product_geom_wrapped, original_shape)
                 ), f"OVERLAP FAIL: {product.properties['sceneName']}, {product.geometry} \nproduct: {product_geom_wrapped.wkt} \naoi: {wrapped.wkt}"
+
+
+def _load_columnar_fixture_products() -> List[asf.ASFProduct]:
+    resources = os.path.join(os.path.dirname(__file__), '..', 'yml_tests', 'Resources')
+    products = []
+    for filename in ['S1_response.yml', 'SLC_BURST.yml', 'OPERA_Products.yml', 'Alos_response.yml']:
+        with open(os.path.join(resources, filename), 'r') as f:
+            items = yaml.safe_load(f)
+        items = items if isinstance(items, list) else [items]
+        products.extend(as_ASFProduct(item, asf.ASFSession()) for item in items)
+
+    return products
+
+
+def test_ASFColumnarResults():
+    products = _load_columnar_fixture_products()
+    page = ASFSearchResults(products[1:], opts=asf.ASFSearchOptions(maxResults=10))
+    page.searchComplete = True
+
+    results = asf.ASFColumnarResults(products[:1])
+    results.extend(page)
+
+    assert len(results) == len(products)
+    assert results.searchComplete
+    assert results.searchOptions.maxResults == 10
+    assert isinstance(results[-1], asf.ASFColumnarProduct)
+    with pytest.raises(IndexError):
+        results[len(products)]
+
+    for view, product in zip(results, products):
+        assert view.umm is None
+        assert view.baseline is None
+        assert view.geometry == product.geometry
+        assert view.centroid() == product.centroid()
+        for name, value in view.properties.items():
+            expected = product.properties.get(name)
+            if isinstance(expected, list):
+                assert value == '+'.join(expected)
+            elif name == 'bytes' and isinstance(expected, dict):
+                assert value == sum(file['bytes'] for file in expected.values())
+            elif name in ['bytes', 'pathNumber', 'frameNumber', 'orbit'] and expected is not None:
+                assert value == int(expected)
+            else:
+                assert value == expected, f'{name}: {value} != {expected}'
+
+    assert results.column('fileID').tolist() == [p.properties['fileID'] for p in products]
+    assert results.column('startTime').dtype == np.dtype('datetime64[ms]')
+    assert len(results.geojson()['features']) == len(products)
+
+    # timestamps are returned as the strings they were read from, whatever their format
+    start_times = [
+        '2023-01-01T01:02:03.000Z',
+        '2023-01-01T01:02:03Z',
+        '2023-01-01T01:02:03.456',
+        '2023-01-01T01:02:03.456789Z',
+        '2023-01-01T01:02:03+00:00',
+        '2023-01-01',
+        None,
+    ]
+    products = [copy(products[0]) for _ in start_times]
+    for product, start_time in zip(products, start_times):
+        product.properties = {**product.properties, 'startTime': start_time}
+
+    results = asf.ASFColumnarResults(products)
+    assert [view.properties['startTime'] for view in results] == start_times
+    assert results.column('startTime')[3] == np.datetime64('2023-01-01T01:02:03.456')
+
+
+def test_ASFColumnarResults_to_arrow():
+    pytest.importorskip('pyarrow')
+    pytest.importorskip('pandas')
+
+    products = _load_columnar_fixture_products()
+    results = asf.ASFColumnarResults(products)
+
+    table = results.to_arrow()
+    assert table.num_rows == len(products)
+    assert (
+        str(table.schema.field('platform').type)
+        == 'dictionary<values=string, indices=int32, ordered=0>'
+    )
+    assert str(table.schema.field('startTime').type) == 'timestamp[ms, tz=UTC]'
+    assert table.column('sceneName').to_pylist() == [p.properties['sceneName'] for p in products]
+    assert table.column('geometry').to_pylist()[0] == products[0].geometry['coordinates'][0]
+
+    df = results.to_pandas()
+    assert len(df) == len(products)
+    assert df['platform'].dtype.name == 'category'
+    assert df['fileID'].tolist() == [p.properties['fileID'] for p in products]
@@ -2,10 +2,13 @@ import numbers
 from typing import List
 import asf_search
 from asf_search.ASFSession import ASFSession
+from asf_search.constants import CMR_PAGE_SIZE
 from requests.cookies import create_cookie
 import http.cookiejar
 import requests
+import requests_mock
 from multiprocessing import Pool
+import pickle
 
 from unittest.mock import patch
 
@@ -186,3 +189,55 @@ def _assert_pooled_instance_variables(session):
     assert session.asf_auth_host == auth_host
     assert session.cmr_collections == cmr_collection
     assert session.edl_client_id == edl_client_id
+
+
+def test_ASFSession_connection_pool():
+    session = ASFSession()
+    adapter = session.get_adapter('https://cmr.earthdata.nasa.gov')
+    assert adapter is session.get_adapter('http://cmr.earthdata.nasa.gov')
+    assert adapter._pool_maxsize == asf_search.INTERNAL.HTTP_POOL_MAXSIZE
+    assert session.headers['Connection'] == 'keep-alive'
+
+    session = ASFSession(pool_connections=2, pool_maxsize=16, max_retries=3, keep_alive=False)
+    adapter = session.get_adapter('https://cmr.earthdata.nasa.gov')
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+    assert session.headers['Connection'] == 'close'
+
+    assert session.configure_pool(pool_maxsize=32, keep_alive=True) is session
+    adapter = session.get_adapter('https://cmr.earthdata.nasa.gov')
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert session.headers['Connection'] == 'keep-alive'
+
+    # subqueries share the search's session rather than copies of it
+    granule_list = [f'S1A_IW_SLC__1SDV_{idx}' for idx in range(3 * CMR_PAGE_SIZE)]
+    opts = asf_search.ASFSearchOptions(session=session, granule_list=granule_list)
+    subqueries = asf_search.CMR.build_subqueries(opts)
+    assert len(subqueries) > 1
+    for subquery in subqueries:
+        assert subquery.session is session
+
+    unpickled = pickle.loads(pickle.dumps(session))
+    assert unpickled.pool_maxsize == 32
+    assert unpickled.get_adapter('https://cmr.earthdata.nasa.gov')._pool_maxsize == 32
+
+
+def test_ASFSession_error_report_credentials(monkeypatch):
+    from asf_search.search.error_reporting import report_search_error
+
+    monkeypatch.setattr(asf_search, 'REPORT_ERRORS', True)
+    session = ASFSession(pool_maxsize=16)
+    session.headers['Authorization'] = 'Bearer token'
+    session.cookies.set('urs-access-token', 'token', domain='.asf.alaska.edu')
+    opts = asf_search.ASFSearchOptions(session=session, platform='SENTINEL-1')
+
+    # error reports don't carry the search session's EDL token or cookies
+    with requests_mock.Mocker() as m:
+        m.post(f'https://{asf_search.INTERNAL.ERROR_REPORTING_ENDPOINT}')
+        report_search_error(opts, 'HTTP 500')
+
+    assert m.call_count == 1
+    assert 'Authorization' not in m.last_request.headers
+    assert 'Cookie' not in m.last_request.headers
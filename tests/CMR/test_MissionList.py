@@ -4,6 +4,7 @@ import pytest
 import requests_mock
 
 from asf_search.constants.INTERNAL import CMR_COLLECTIONS_PATH, CMR_HOST
+from asf_search.ASFSession import ASFSession
 from asf_search.exceptions import CMRError
 
 
@@ -30,3 +31,12 @@ def test_getMissions_error_parsing():
 
 def run_test_get_project_names(cmr_ummjson, campaigns):
     assert _get_project_names(cmr_ummjson) == campaigns
+
+
+def test_getMissions_session():
+    session = ASFSession()
+    with requests_mock.Mocker(session=session) as m:
+        m.post('https://' + CMR_HOST + CMR_COLLECTIONS_PATH, json={'feed': {'entry': []}})
+
+        assert get_campaigns({}, session) == {'feed': {'entry': []}}
+        assert m.call_count == 1
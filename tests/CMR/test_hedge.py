@@ -0,0 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+
+import requests
+import requests_mock
+
+from asf_search import ASFSession, RequestHedger
+from asf_search.constants.INTERNAL import CMR_GRANULE_PATH, CMR_HOST
+from asf_search.search.search_generator import get_page
+
+
+def _response(status_code: int = 200, text: str = '') -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode('utf-8')
+    return response
+
+
+def _warm_up(hedger: RequestHedger, latency: float = 0.01) -> None:
+    for _ in range(hedger.min_samples):
+        hedger.record_latency(latency)
+
+
+def test_RequestHedger():
+    hedger = RequestHedger(percentile=50, min_samples=4, min_delay=0.05, max_hedge_ratio=1)
+    assert hedger.hedge_delay() is None
+    assert hedger.request(lambda: _response(text='unhedged')).text == 'unhedged'
+
+    for latency in [0.1, 0.2, 0.3]:
+        hedger.record_latency(latency)
+    assert hedger.hedge_delay() == 0.1
+    hedger.record_latency(0.01)
+    assert hedger.hedge_delay() == 0.1
+
+    release = threading.Event()
+    calls = itertools.count()
+
+    def send():
+        if next(calls) == 0:
+            release.wait(5)
+            return _response(text='original')
+        return _response(text='hedge')
+
+    perf = time.monotonic()
+    assert hedger.request(send).text == 'hedge'
+    assert time.monotonic() - perf < 1
+    release.set()
+
+    # a failed duplicate doesn't replace a slow original
+    release.clear()
+    calls = itertools.count()
+
+    def send_hedge_fails():
+        if next(calls) == 0:
+            release.wait(0.3)
+            return _response(text='original')
+        return _response(503)
+
+    assert hedger.request(send_hedge_fails).text == 'original'
+
+    stats = hedger.stats()
+    assert stats['requests'] == 3
+    assert stats['hedged'] == 2
+    assert stats['hedge_wins'] == 1
+
+
+def test_RequestHedger_budget():
+    hedger = RequestHedger(percentile=50, min_samples=10, min_delay=0.01, max_hedge_ratio=0.5)
+    _warm_up(hedger)
+
+    def send():
+        time.sleep(0.1)
+        return _response()
+
+    for _ in range(4):
+        hedger.request(send)
+
+    assert hedger.stats()['requests'] == 4
+    assert hedger.stats()['hedged'] == 2
+
+
+def test_RequestHedger_concurrent():
+    hedger = RequestHedger(min_samples=1, min_delay=0.2, max_hedge_ratio=1, max_workers=1)
+    _warm_up(hedger)
+
+    def send():
+        time.sleep(0.05)
+        return _response()
+
+    # requests made at once aren't queued behind each other, so none wait long enough to hedge
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(hedger.request, send) for _ in range(8)]:
+            future.result()
+
+    assert hedger.stats()['requests'] == 8
+    assert hedger.stats()['hedged'] == 0
+
+
+def test_get_page_hedged(monkeypatch):
+    hedger = RequestHedger(min_samples=1, min_delay=0.05, max_hedge_ratio=1)
+    _warm_up(hedger)
+    session = ASFSession(request_hedger=hedger)
+
+    # requests_mock sends one request at a time, so the original is held up before it's sent
+    release = threading.Event()
+    calls = itertools.count()
+    session_request = session.request
+
+    def request(*args, **kwargs):
+        if next(calls) == 0:
+            release.wait(5)
+        return session_request(*args, **kwargs)
+
+    monkeypatch.setattr(session, 'request', request)
+
+    url = f'https://{CMR_HOST}{CMR_GRANULE_PATH}'
+    with requests_mock.Mocker(session=session) as m:
+        m.post(url, json={'items': [], 'hits': 0})
+        perf = time.monotonic()
+        try:
+            assert get_page(session, url, []).json() == {'items': [], 'hits': 0}
+            assert time.monotonic() - perf < 1
+        finally:
+            release.set()
+
+    assert hedger.stats()['hedged'] == 1
+    assert hedger.stats()['hedge_wins'] == 1
@@ -0,0 +1,177 @@
+import pickle
+import sys
+
+import pytest
+import requests
+import requests_mock
+
+from asf_search import ASFSession, CircuitBreaker, RateLimiter
+from asf_search.constants.INTERNAL import CMR_GRANULE_PATH, CMR_HOST
+from asf_search.exceptions import ASFCircuitOpenError, ASFSearch429Error, ASFSearch5xxError
+from asf_search.search.search_generator import get_page
+
+
+class MockClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = MockClock()
+    monkeypatch.setattr('asf_search.CMR.throttle.time.monotonic', clock.monotonic)
+    return clock
+
+
+def test_RateLimiter(clock):
+    limiter = RateLimiter(rate=2, burst=3, hosts={'slow.host': (0.5, 1)})
+
+    assert [limiter.reserve(CMR_HOST) for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+    clock.now += 1.0
+    assert limiter.reserve(CMR_HOST) == 0.5
+
+    assert limiter.get_limit('slow.host') == (0.5, 1)
+    assert [limiter.reserve('slow.host') for _ in range(2)] == [0, 2.0]
+
+    limiter.set_limit('other.host', 10)
+    assert limiter.get_limit('other.host') == (10, 10)
+
+    limiter.pause('other.host', 3)
+    assert limiter.reserve('other.host') == pytest.approx(3.1)
+    clock.now += 3.1
+    assert limiter.reserve('other.host') == pytest.approx(0.1)
+
+    unpickled = pickle.loads(pickle.dumps(limiter))
+    assert unpickled.get_limit('slow.host') == (0.5, 1)
+    assert unpickled.reserve('unused.host') == 0
+
+
+def test_CircuitBreaker(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    for _ in range(2):
+        breaker.record_failure(CMR_HOST)
+        breaker.before_request(CMR_HOST)
+    breaker.record_success(CMR_HOST)
+
+    for _ in range(3):
+        breaker.before_request(CMR_HOST)
+        breaker.record_failure(CMR_HOST)
+    assert breaker.state(CMR_HOST) == CircuitBreaker.OPEN
+    assert breaker.state('other.host') == CircuitBreaker.CLOSED
+    with pytest.raises(ASFCircuitOpenError):
+        breaker.before_request(CMR_HOST)
+
+    # a single request is let through to test the host
+    clock.now += 10
+    breaker.before_request(CMR_HOST)
+    assert breaker.state(CMR_HOST) == CircuitBreaker.HALF_OPEN
+    with pytest.raises(ASFCircuitOpenError):
+        breaker.before_request(CMR_HOST)
+
+    breaker.record_failure(CMR_HOST)
+    assert breaker.state(CMR_HOST) == CircuitBreaker.OPEN
+
+    clock.now += 10
+    breaker.before_request(CMR_HOST)
+    breaker.record_success(CMR_HOST)
+    assert breaker.state(CMR_HOST) == CircuitBreaker.CLOSED
+    breaker.before_request(CMR_HOST)
+
+
+def test_ASFSession_circuit_breaker(clock, monkeypatch):
+    monkeypatch.setattr(get_page.retry, 'sleep', lambda seconds: None)
+    session = ASFSession(circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=10))
+    url = f'https://{CMR_HOST}{CMR_GRANULE_PATH}'
+
+    with requests_mock.Mocker(session=session) as m:
+        m.post(url, status_code=503, json={'errors': ['Service Unavailable']})
+        m.get('https://other.host/file.zip', exc=requests.exceptions.ConnectionError)
+
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                session.get('https://other.host/file.zip')
+
+        with pytest.raises((ASFSearch5xxError, ASFCircuitOpenError)):
+            get_page(session, url, [])
+
+        # the circuit opened during get_page's retries, so the rest were never sent
+        assert m.call_count == 3 + 2
+        with pytest.raises(ASFCircuitOpenError):
+            session.post(url)
+
+        clock.now += 10
+        m.post(url, json={'items': [], 'hits': 0})
+        assert session.post(url).status_code == 200
+        assert session.circuit_breaker.state(CMR_HOST) == CircuitBreaker.CLOSED
+
+
+def test_ASFSession_rate_limiter(clock, monkeypatch):
+    delays = []
+    monkeypatch.setattr(sys.modules['asf_search.ASFSession'].time, 'sleep', delays.append)
+
+    session = ASFSession(rate_limiter=RateLimiter(rate=1, burst=2))
+    url = f'https://{CMR_HOST}{CMR_GRANULE_PATH}'
+
+    with requests_mock.Mocker(session=session) as m:
+        m.post(url, json={'items': [], 'hits': 0})
+        m.get('https://other.host/file.zip')
+
+        for _ in range(3):
+            session.post(url)
+            session.get('https://other.host/file.zip')
+        assert delays == [1.0]
+
+        # a 429's Retry-After pauses the host for every request sharing the limiter
+        clock.now += 1.0
+        m.post(url, status_code=429, headers={'Retry-After': '5'})
+        session.post(url)
+        assert delays == [1.0, 1.0]
+
+        session.rate_limiter.set_limit('other.host', 1, 1)
+        session.get('https://other.host/file.zip')
+        session.get('https://other.host/file.zip')
+        assert delays == [1.0, 1.0, 1.0]
+
+        m.post(url, json={'items': [], 'hits': 0})
+        session.post(url)
+        assert delays[-1] == pytest.approx(6.0)
+
+
+def test_get_page_retries_429(clock, monkeypatch):
+    retry_delays = []
+    monkeypatch.setattr(get_page.retry, 'sleep', retry_delays.append)
+    url = f'https://{CMR_HOST}{CMR_GRANULE_PATH}'
+    responses = [
+        {'status_code': 429, 'headers': {'Retry-After': '5'}},
+        {'status_code': 429},
+        {'json': {'items': [], 'hits': 0}},
+    ]
+
+    session = ASFSession()
+    with requests_mock.Mocker(session=session) as m:
+        m.post(url, responses)
+        assert get_page(session, url, []).json() == {'items': [], 'hits': 0}
+
+        # without a Retry-After, CMR is backed off from as after a 5xx
+        assert retry_delays[0] == 5.0
+        assert 3 <= retry_delays[1] <= 11
+
+        m.post(url, status_code=429)
+        with pytest.raises(ASFSearch429Error):
+            get_page(session, url, [])
+        assert m.call_count == 3 + 3
+
+    # the session's rate limiter holds the retry back instead
+    delays, retry_delays[:] = [], []
+    monkeypatch.setattr(sys.modules['asf_search.ASFSession'].time, 'sleep', delays.append)
+    session = ASFSession(rate_limiter=RateLimiter(rate=10))
+    with requests_mock.Mocker(session=session) as m:
+        m.post(url, responses)
+        assert get_page(session, url, []).json() == {'items': [], 'hits': 0}
+
+    assert retry_delays == [0.0, 0.0]
+    assert delays[0] == pytest.approx(5.1)
@@ -0,0 +1,120 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+# `import asf_search` took ~0.65s of CPU time when every submodule was imported eagerly,
+# and ~0.03s lazily. Lazy imports are held to a fraction of an eager import on the same machine,
+# so the test doesn't depend on how fast the machine is
+IMPORT_TIME_RATIO = 0.5
+
+DEFERRED_MODULES = [
+    'aiohttp',
+    'dateparser',
+    'numpy',
+    'requests',
+    'shapely',
+    'asf_search.ASFSession',
+    'asf_search.ASFProduct',
+    'asf_search.CMR.datasets',
+    'asf_search.Products',
+    'asf_search.baseline',
+    'asf_search.export',
+    'asf_search.search',
+]
+
+# every public name `import asf_search` provided when it star-imported its submodules
+BASELINE_NAMESPACE = """
+AIRSARProduct ALOSProduct ARIAS1GUNWProduct ASFAuthenticationError ASFBaselineError
+ASFDownloadError ASFError ASFProduct ASFSearch4xxError ASFSearch5xxError ASFSearchError
+ASFSearchOptions ASFSearchResults ASFSearchResults_to_properties_list ASFSession
+ASFStackableProduct ASFWKTError ASF_LOGGER BEAMMODE CMR CMRConceptIDError CMRError
+CMRIncompleteError DATASET ERSProduct FLIGHT_DIRECTION FileDownloadType INSTRUMENT INTERNAL
+JERSProduct List MissionList NISARProduct OPERAS1Product PLATFORM POLARIZATION PRODUCT_TYPE
+PackageNotFoundError Products RADARSATProduct REPORT_ERRORS S1BurstProduct S1Product
+SEASATProduct SIRCProduct SMAPProduct Tuple UAVSARProduct Union WKT a baseline baseline_search
+build_subqueries calc calculate_perpendicular_baselines calculate_temporal_baselines campaigns
+check_reference collections_by_processing_level collections_per_platform constants cos csv
+dataset_collections datasets download download_url download_urls error_reporting exceptions
+export export_translators f field_map file_download_type find_new_reference geo_search geojson
+get_along_beam_vector get_baseline_from_stack get_campaigns get_concept_id_alias
+get_dataset_concept_ids get_granule_position get_paired_granule_baseline get_pos_at_rel_time
+get_shared_sv_time get_up_beam_vector get_vel_at_rel_time granule_search health interpolate
+jsonlite jsonlite2 kml logging metalink np offset_perpendicular_baselines parse_datetime
+preprocess_opts product_search pytz radians radius_fix remotezip results_to_csv
+results_to_geojson results_to_jsonlite results_to_jsonlite2 results_to_kml results_to_metalink
+search search_count search_generator sin sqrt stack stack_from_id subquery translate
+translate_opts validate_wkt validators version
+""".split()
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _import_time(modules: List[str]) -> float:
+    # CPU time rather than wall time, so the comparison holds while other tests load the machine
+    code = (
+        'import time; t = time.process_time(); '
+        f'import {", ".join(modules)}; print(time.process_time() - t)'
+    )
+    return statistics.median(float(_run_python(code)) for _ in range(5))
+
+
+def test_import_time_budget():
+    lazy_time = _import_time(['asf_search'])
+    # asf_search's own modules, which import its required dependencies
+    eager_time = _import_time([module for module in DEFERRED_MODULES if module.startswith('asf_')])
+
+    assert lazy_time < eager_time * IMPORT_TIME_RATIO
+
+
+def test_import_is_lazy():
+    loaded = json.loads(
+        _run_python('import asf_search, sys, json; print(json.dumps(list(sys.modules)))')
+    )
+
+    assert [module for module in DEFERRED_MODULES if module in loaded] == []
+
+
+def test_default_sessions_deferred():
+    code = (
+        'from asf_search.ASFSearchOptions.config import config\n'
+        'from asf_search import ASFProduct, ASFSession\n'
+        "print(isinstance(dict.__getitem__(config, 'session'), ASFSession))\n"
+        'print(ASFProduct._default_session is not None)\n'
+    )
+    assert _run_python(code).split() == ['False', 'False']
+
+
+def test_lazy_attributes():
+    import asf_search.ASFProduct
+
+    assert isinstance(asf_search.ASFProduct, type)
+    assert callable(asf_search.search)
+    assert asf_search.CMR.dataset_collections is asf_search.dataset_collections
+    assert 'search_generator' in dir(asf_search)
+    assert set(asf_search.__all__) <= set(dir(asf_search))
+
+    with pytest.raises(AttributeError):
+        _ = asf_search.not_an_attribute
+
+    assert asf_search.ASFSearchOptions().session is asf_search.ASFSearchOptions().session
+    assert asf_search.ASFProduct().session is asf_search.ASFProduct().session
+
+
+def test_baseline_namespace():
+    import asf_search
+
+    assert [name for name in BASELINE_NAMESPACE if not hasattr(asf_search, name)] == []
+    assert set(BASELINE_NAMESPACE) <= set(dir(asf_search))
+
+    from asf_search.download import remotezip
+
+    assert asf_search.remotezip is remotezip
+    assert asf_search.datasets is asf_search.CMR.datasets
@@ -5,13 +5,21 @@ from asf_search import ASFSession
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 from asf_search import ASF_LOGGER
-from asf_search.CMR.subquery import build_subqueries
-from asf_search.CMR.translate import try_parse_date
+from asf_search.CMR.subquery import build_subqueries, plan_subqueries
+from asf_search.CMR.translate import translate_opts
+from asf_search.CMR.translate import should_use_asf_frame, try_parse_date
 from asf_search.constants import INTERNAL
 from asf_search.exceptions import ASFSearchError
-from asf_search.search import search
+from asf_search.search import explain, search
 from asf_search.ASFSearchResults import ASFSearchResults
-from asf_search.CMR import dataset_collections
+from asf_search.CMR import (
+    collections_by_processing_level,
+    collections_per_platform,
+    dataset_collections,
+    get_collection_registry,
+    get_concept_id_alias,
+    get_dataset_concept_ids,
+)
 from pytest import raises
 from typing import List
 import requests
@@ -197,3 +205,94 @@ def query_endpoint(params):
     response.raise_for_status()
 
     return response.json()
+
+
+def test_collection_registry():
+    registry = get_collection_registry()
+    assert registry is get_collection_registry()
+
+    for platform, concept_ids in collections_per_platform.items():
+        assert registry.platform_concept_ids[platform] == frozenset(concept_ids)
+        for concept_id in concept_ids:
+            assert platform in registry.platforms_by_concept_id[concept_id]
+
+    for dataset in dataset_collections:
+        assert registry.get_dataset_concept_ids([dataset]) == frozenset(
+            get_dataset_concept_ids([dataset])
+        )
+        for concept_id in registry.dataset_concept_ids[dataset]:
+            assert dataset in registry.datasets_by_concept_id[concept_id]
+
+    for processing_level, concept_ids in collections_by_processing_level.items():
+        for concept_id in concept_ids:
+            assert processing_level in registry.processing_levels_by_concept_id[concept_id]
+
+    platforms = ['SENTINEL-1A', 'ALOS']
+    assert registry.get_concept_id_alias(platforms, registry.platform_concept_ids) == frozenset(
+        get_concept_id_alias(platforms, collections_per_platform)
+    )
+    assert (
+        registry.get_concept_id_alias(
+            ['SENTINEL-1A', 'NOT-A-PLATFORM'], registry.platform_concept_ids
+        )
+        == frozenset()
+    )
+    with raises(ValueError):
+        registry.get_dataset_concept_ids(['NOT-A-DATASET'])
+
+    assert should_use_asf_frame([('platform[]', 'alos')])
+    assert should_use_asf_frame(
+        [('echo_collection_id[]', collections_per_platform['SENTINEL-1A'][0])]
+    )
+    assert not should_use_asf_frame([('platform[]', 'UAVSAR')])
+
+
+def test_plan_subqueries():
+    params = {
+        'platform': 'SENTINEL-1',
+        'beamMode': ['IW', 'EW', 'SM'],
+        'polarization': ['VV', 'HH'],
+        'absoluteOrbit': [5, 6, 7, 9],
+    }
+
+    opts = ASFSearchOptions(**params)
+    preprocess_opts(opts)
+    assert len(build_subqueries(opts)) == 3 * 2 * 4
+
+    # polarization is a second attribute parameter, and CMR can only OR all of them
+    opts = ASFSearchOptions(**params, collapseSubqueries=True)
+    preprocess_opts(opts)
+    plan = plan_subqueries(opts)
+    assert len(plan) == 3 * 2 * 2
+    assert sorted({tuple(query.absoluteOrbit) for query in plan.subqueries}) == [(5, 7), (9,)]
+    assert 'absoluteOrbit' in plan.merged_params
+    assert 'beamMode' in plan.split_params
+
+    del params['polarization']
+    opts = ASFSearchOptions(**params, collapseSubqueries=True)
+    preprocess_opts(opts)
+    plan = plan_subqueries(opts)
+    assert len(plan) == 2
+    assert plan.list_params['beamMode'] == ['IW', 'EW', 'SM']
+    for query in plan.subqueries:
+        translated = translate_opts(query)
+        assert ('options[attribute][or]', 'true') in translated
+        assert [val for key, val in translated if key == 'attribute[]'] == [
+            'string,BEAM_MODE,IW',
+            'string,BEAM_MODE,EW',
+            'string,BEAM_MODE,SM',
+        ]
+
+    # custom attribute keywords would be OR'd too, so the beam modes are still split
+    opts = ASFSearchOptions(
+        **params,
+        collapseSubqueries=True,
+        cmr_keywords=[('attribute[]', 'string,GROUP_ID,S1A_IW')],
+    )
+    preprocess_opts(opts)
+    assert len(plan_subqueries(opts)) == 3 * 2
+
+    explanation = explain(**params, collapseSubqueries=True)
+    assert explanation.startswith('2 subqueries')
+    assert "beamMode: 3 values OR'd in each subquery" in explanation
+    assert 'absoluteOrbit: 4 values collapsed into 2 ranges' in explanation
@@ -1,11 +1,33 @@
 
-from asf_search import ASFSearchOptions, ASFSearchResults
+from asf_search import ASFSearchOptions, ASFSearchResults, ASFSession, CMRCache, CountCache
+from asf_search import ALOSProduct, BloomFilter, register_product_type
 from asf_search import INTERNAL
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Dict, List
+from urllib.parse import parse_qs
 
+import asyncio
+import importlib
+import json
 import math
+import os
+import threading
+import time
+import pytest
+import requests_mock
+import yaml
+from shapely.geometry import Polygon, box
 
-from asf_search.search import search_generator, preprocess_opts
+from asf_search.search import search, search_async, search_generator, preprocess_opts
+from asf_search.search import explain, search_count, search_count_breakdown, search_estimate
+from asf_search.search import search_generator_async, resume_search_generator
+from asf_search.search.search_generator import _get_parse_pool, get_page_async
+from asf_search.search.page_size import PageSizer, get_page_size, set_page_size
+
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), '..', 'yml_tests', 'Resources')
 
 
 def run_test_search_generator_multi(search_opts: List[ASFSearchOptions]):
@@ -73,3 +95,864 @@ def run_test_search_generator(search_opts: ASFSearchOptions):
     for key, val in search_opts:
         if key != 'maxResults':
             assert getattr(results.searchOptions, key) == val
+
+
+def _get_mock_items(name: str, count: int) -> List[Dict]:
+    """Builds `count` unique CMR UMM items for the mock CMR endpoint from an ALOS resource"""
+    with open(os.path.join(RESOURCES_PATH, 'Alos_response_maxResults3.yml'), 'r') as f:
+        template = yaml.safe_load(f)[0]
+
+    items = []
+    for idx in range(count):
+        item = {'umm': deepcopy(template['umm']), 'meta': deepcopy(template['meta'])}
+        item['meta']['concept-id'] = f'G{idx:04d}-{name}'
+        item['umm']['GranuleUR'] = f'{name}_{idx:04d}'
+        items.append(item)
+
+    return items
+
+
+def mock_cmr_pages(responses: Dict[str, List[Dict]], page_size: int):
+    """
+    Returns a requests_mock json callback paging through the items in `responses`,
+    keyed by the BEAM_MODE attribute of each subquery, `page_size` items at a time
+    unless the request asks for a different `page_size`
+    """
+
+    def callback(request, context):
+        body = parse_qs(request.body)
+        beam_mode = [
+            attr.split(',')[-1]
+            for attr in body.get('attribute[]', [])
+            if attr.startswith('string,BEAM_MODE,')
+        ][0]
+        items = responses[beam_mode]
+        size = int(body.get('page_size', [page_size])[0])
+        offset = int(request.headers.get('CMR-Search-After') or 0)
+        page = items[offset : offset + size]
+        if offset + size < len(items):
+            context.headers['CMR-Search-After'] = str(offset + size)
+
+        return {'items': page, 'hits': len(items)}
+
+    return callback
+
+
+def _run_mocked_search(monkeypatch, **kwargs) -> List[ASFSearchResults]:
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 2)
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+        return list(search_generator(beamMode=['FBS', 'FBD', 'PLR'], **kwargs))
+
+
+def _page_ids(pages: List[ASFSearchResults]) -> List[str]:
+    return [product.properties['fileID'] for page in pages for product in page]
+
+
+def test_search_generator_concurrent_ordered(monkeypatch):
+    serial = _run_mocked_search(monkeypatch)
+    concurrent = _run_mocked_search(monkeypatch, maxWorkers=3)
+
+    assert len(_page_ids(serial)) == 12
+    assert _page_ids(concurrent) == _page_ids(serial)
+    assert [page.searchComplete for page in concurrent] == [
+        page.searchComplete for page in serial
+    ]
+    assert concurrent[-1].searchComplete
+
+
+def test_search_generator_concurrent_as_completed(monkeypatch):
+    serial = _run_mocked_search(monkeypatch)
+    concurrent = _run_mocked_search(monkeypatch, maxWorkers=3, asCompleted=True)
+
+    assert sorted(_page_ids(concurrent)) == sorted(_page_ids(serial))
+    assert len([page for page in concurrent if page.searchComplete]) == 3
+
+
+def test_search_generator_concurrent_max_results(monkeypatch):
+    for as_completed in [False, True]:
+        pages = _run_mocked_search(
+            monkeypatch, maxWorkers=3, asCompleted=as_completed, maxResults=7
+        )
+
+        assert len(_page_ids(pages)) == 7
+        assert pages[-1].searchComplete
+
+
+def test_search_generator_concurrent_backpressure(monkeypatch):
+    responses = {beam_mode: _get_mock_items(beam_mode, 20) for beam_mode in ['FBS', 'FBD', 'PLR']}
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 1)
+    monkeypatch.setattr(INTERNAL, 'SUBQUERY_PAGE_BUFFER', 2)
+    for as_completed in [False, True]:
+        with requests_mock.Mocker() as m:
+            m.post(
+                f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+                json=mock_cmr_pages(responses, page_size=1),
+            )
+            pages = search_generator(
+                beamMode=['FBS', 'FBD', 'PLR'], maxWorkers=3, asCompleted=as_completed
+            )
+            next(pages)
+            time.sleep(0.5)
+            request_count = m.call_count
+            pages.close()
+
+        # one page yielded, a full buffer, and one page waiting to be queued, per worker
+        assert request_count <= 3 * (INTERNAL.SUBQUERY_PAGE_BUFFER + 2)
+
+
+def test_search_generator_max_results_page_size(monkeypatch):
+    responses = {'FBS': _get_mock_items('FBS', 5), 'FBD': _get_mock_items('FBD', 3)}
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 4)
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=4),
+        )
+        pages = list(search_generator(beamMode=['FBS', 'FBD'], maxResults=6))
+        page_sizes = [int(parse_qs(r.body)['page_size'][0]) for r in m.request_history]
+
+    assert [len(page) for page in pages] == [4, 1, 1]
+    # pages after the first only ask for as many results as are still wanted
+    assert page_sizes == [4, 2, 1]
+    assert pages[-1].searchComplete
+
+
+def test_search_estimate(monkeypatch):
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 2)
+    monkeypatch.setattr(INTERNAL, 'SUBQUERY_WARNING_COUNT', 2)
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+        estimate = search_estimate(beamMode=['FBS', 'FBD', 'PLR'])
+        limited = search_estimate(beamMode=['FBS', 'FBD', 'PLR'], maxResults=6)
+        # the mock ignores time windows, each window counts all of its beam mode's hits
+        sharded = search_estimate(
+            beamMode=['FBS', 'FBD', 'PLR'], start='2020-01-01', end='2020-01-05', temporalShards=2
+        )
+        page_sizes = {int(parse_qs(r.body)['page_size'][0]) for r in m.request_history}
+
+    # only hit counts are requested
+    assert page_sizes == {0}
+    assert len(estimate) == 3
+    assert estimate.hits == [5, 3, 4]
+    assert estimate.total_hits == estimate.results == 12
+    assert estimate.pages == [3, 2, 2]
+    assert estimate.requests == 7
+    assert estimate.bytes == 12 * INTERNAL.CMR_ITEM_BYTES_ESTIMATE
+    assert len(estimate.warnings) == 1
+    assert '12 CMR hits' in str(estimate)
+
+    # the last subquery isn't needed to reach maxResults
+    assert limited.results == 6
+    assert limited.pages == [3, 1, 0]
+    assert limited.requests == 4
+
+    # searched the same way as search_generator() splits them
+    assert len(sharded) == 6
+    assert sharded.hits == [5, 5, 3, 3, 4, 4]
+    assert 'start/end: up to 2 even time windows' in str(sharded)
+
+    explanation = explain(
+        beamMode='FBS', intersectsWith='POLYGON((1 1, 9 1, 9 9, 1 8, 1 1))', spatialTiles=4
+    )
+    assert explanation.startswith('4 subqueries')
+    assert 'intersectsWith: up to 4 spatial tiles' in explanation
+
+
+def test_search_count(monkeypatch):
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+
+    session = ASFSession(count_cache=CountCache(ttl=30))
+    opts = ASFSearchOptions(session=session)
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+        assert search_count(beamMode=['FBS', 'FBD', 'PLR'], opts=opts) == 12
+        assert m.call_count == 3
+
+        # counts are reused from the session's cache
+        breakdown = search_count_breakdown(beamMode=['PLR', 'FBS', 'FBD'], opts=opts)
+        assert [(query.beamMode, count) for query, count in breakdown] == [
+            (['PLR'], 4),
+            (['FBS'], 5),
+            (['FBD'], 3),
+        ]
+        assert m.call_count == 3
+        assert session.count_cache.stats() == {'hits': 3, 'misses': 3, 'entries': 3}
+
+        breakdown = search_count_breakdown(
+            platform='ALOS', beamMode=['FBS', 'FBD'], by_collection=True, opts=opts
+        )
+        assert len(breakdown) == m.call_count - 3
+        assert len(breakdown) > 2
+        assert all(len(query.collections) == 1 for query, _ in breakdown)
+        # every collection of each beam mode's subquery answers with that beam mode's hits
+        assert sum(count for _, count in breakdown) == (5 + 3) * len(breakdown) // 2
+
+    session.count_cache.clear()
+    assert session.count_cache.stats()['entries'] == 0
+
+
+def mock_temporal_cmr_pages(items: List[Dict], page_size: int):
+    """
+    Returns a requests_mock json callback for `items` like CMR's: matching the items whose
+    time range overlaps the request's `temporal`, sorted by end date, then GranuleUR
+    """
+
+    def end_time(item):
+        return item['umm']['TemporalExtent']['RangeDateTime']['EndingDateTime']
+
+    def callback(request, context):
+        body = parse_qs(request.body)
+        start, end = [date.replace('Z', '.000Z') for date in body['temporal'][0].split(',')[:2]]
+        matches = [
+            item
+            for item in items
+            if item['umm']['TemporalExtent']['RangeDateTime']['BeginningDateTime'] <= end
+            and end_time(item) >= start
+        ]
+        matches = sorted(matches, key=lambda item: item['umm']['GranuleUR'])
+        matches = sorted(matches, key=end_time, reverse=True)
+
+        size = int(body.get('page_size', [page_size])[0])
+        offset = int(request.headers.get('CMR-Search-After') or 0)
+        if offset + size < len(matches):
+            context.headers['CMR-Search-After'] = str(offset + size)
+
+        return {'items': matches[offset : offset + size], 'hits': len(matches)}
+
+    return callback
+
+
+def test_search_generator_temporal_shards(monkeypatch, tmp_path):
+    # granules 36 hours long, ending every 12 hours, so many overlap a shard's edge
+    items = _get_mock_items('FBS', 40)
+    first_end = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    for idx, item in enumerate(items):
+        granule_end = first_end + timedelta(hours=12 * idx)
+        item['umm']['TemporalExtent'] = {
+            'RangeDateTime': {
+                'BeginningDateTime': (granule_end - timedelta(hours=36)).strftime(
+                    '%Y-%m-%dT%H:%M:%S.000Z'
+                ),
+                'EndingDateTime': granule_end.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            }
+        }
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 3)
+    search_opts = {'beamMode': 'FBS', 'start': '2020-01-01', 'end': '2020-01-21'}
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_temporal_cmr_pages(items, page_size=3),
+        )
+        expected = [product.properties['fileID'] for product in search(**search_opts)]
+        assert len(expected) == len(items)
+
+        for shard_opts in [
+            {'temporalShards': 4},
+            {'temporalShards': 4, 'maxWorkers': 4},
+            {'temporalShards': 5, 'balanceShards': True, 'maxWorkers': 2},
+            # fewer windows than asked for, each is at least a day long
+            {'temporalShards': 100},
+        ]:
+            results = search(**search_opts, **shard_opts)
+            assert [product.properties['fileID'] for product in results] == expected
+            results.raise_if_incomplete()
+
+        results = search(**search_opts, temporalShards=4, maxResults=15)
+        assert [product.properties['fileID'] for product in results] == expected[:15]
+
+        # resumed partway through a shard, with the products its filter dropped so far
+        pages = list(search_generator(**search_opts, temporalShards=4))
+        checkpoint = str(tmp_path / 'shards.json')
+        stopped = search_generator(**search_opts, temporalShards=4, checkpoint=checkpoint)
+        consumed = [next(stopped) for _ in range(6)]
+        del stopped
+        resumed = list(resume_search_generator(checkpoint, **search_opts, temporalShards=4))
+        assert _page_ids(consumed[:-1] + resumed) == _page_ids(pages)
+        assert [page.searchComplete for page in consumed[:-1] + resumed] == [
+            page.searchComplete for page in pages
+        ]
+
+        m.reset_mock()
+        list(search_generator(**search_opts, temporalShards=4))
+        requested_ranges = [parse_qs(r.body)['temporal'][0] for r in m.request_history]
+        assert requested_ranges[0].startswith('2020-01-16T00:00:00Z,2020-01-21T00:00:00Z')
+        assert requested_ranges[-1].startswith('2020-01-01T00:00:00Z,2020-01-06T00:00:00Z')
+
+
+def test_search_generator_spatial_tiles(monkeypatch):
+    # 1x1 degree footprints offset from the grid, so many overlap two or four tiles
+    items = _get_mock_items('FBS', 100)
+    footprints = {}
+    for idx, item in enumerate(items):
+        item['umm']['TemporalExtent']['RangeDateTime']['EndingDateTime'] = (
+            datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(hours=idx)
+        ).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        lon, lat = idx % 10 + 0.3, idx // 10 + 0.3
+        footprints[item['meta']['concept-id']] = box(lon, lat, lon + 1, lat + 1)
+
+    def callback(request, context):
+        body = parse_qs(request.body)
+        if 'bounding_box' in body:
+            aoi = box(*[float(coord) for coord in body['bounding_box'][0].split(',')])
+        else:
+            coords = [float(coord) for coord in body['polygon'][0].split(',')]
+            aoi = Polygon(list(zip(coords[::2], coords[1::2])))
+
+        matches = [item for item in items if footprints[item['meta']['concept-id']].intersects(aoi)]
+        matches = sorted(
+            matches,
+            key=lambda item: item['umm']['TemporalExtent']['RangeDateTime']['EndingDateTime'],
+            reverse=True,
+        )
+
+        size = int(body.get('page_size', [7])[0])
+        offset = int(request.headers.get('CMR-Search-After') or 0)
+        if offset + size < len(matches):
+            context.headers['CMR-Search-After'] = str(offset + size)
+
+        return {'items': matches[offset : offset + size], 'hits': len(matches)}
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 7)
+    aoi = 'POLYGON((1 1, 9 1, 9 9, 1 8, 1 1))'
+    with requests_mock.Mocker() as m:
+        m.post(f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}', json=callback)
+
+        expected = search(intersectsWith=aoi)
+        expected_ids = [product.meta['concept-id'] for product in expected]
+        assert m.call_count == math.ceil(len(expected) / 7)
+
+        m.reset_mock()
+        tiled = search(intersectsWith=aoi, spatialTiles=4)
+        assert m.call_count > math.ceil(len(expected) / 7)
+        tiled.raise_if_incomplete()
+        assert [product.meta['concept-id'] for product in tiled] == expected_ids
+
+        # tiles are yielded in order, however many workers fetch them
+        tiled_ids = [
+            product.meta['concept-id']
+            for page in search_generator(intersectsWith=aoi, spatialTiles=4)
+            for product in page
+        ]
+        assert sorted(tiled_ids) == sorted(expected_ids)
+        parallel_ids = [
+            product.meta['concept-id']
+            for page in search_generator(intersectsWith=aoi, spatialTiles=4, maxWorkers=4)
+            for product in page
+        ]
+        assert parallel_ids == tiled_ids
+
+        limited = search(intersectsWith=aoi, spatialTiles=4, maxResults=len(expected) - 5)
+        assert sorted(product.meta['concept-id'] for product in limited) == sorted(tiled_ids[:-5])
+
+        # merged across tiles, the latest results are returned
+        limited = search(intersectsWith=aoi, spatialTiles=4, sortedStream=True, maxResults=20)
+        assert [product.meta['concept-id'] for product in limited] == expected_ids[:20]
+
+
+def test_search_generator_sorted_stream(monkeypatch):
+    # each subquery sorted latest first, with end times interleaved between subqueries
+    responses = {}
+    for mode_idx, (beam_mode, count, hours) in enumerate(
+        [('FBS', 12, 2), ('FBD', 5, 5), ('PLR', 9, 3)]
+    ):
+        responses[beam_mode] = _get_mock_items(beam_mode, count)
+        for idx, item in enumerate(responses[beam_mode]):
+            item['umm']['TemporalExtent']['RangeDateTime']['EndingDateTime'] = (
+                datetime(2020, 1, 1, tzinfo=timezone.utc)
+                - timedelta(hours=hours * idx, minutes=20 * mode_idx)
+            ).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 4)
+    search_opts = {'beamMode': ['FBS', 'FBD', 'PLR']}
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=4),
+        )
+        expected = [product.properties['fileID'] for product in search(**search_opts)]
+        assert len(expected) == 26
+
+        for stream_opts in [{}, {'maxWorkers': 3}, {'maxWorkers': 2, 'prefetchDepth': 1}]:
+            pages = list(search_generator(**search_opts, sortedStream=True, **stream_opts))
+            assert [len(page) for page in pages] == [4] * 6 + [2]
+            assert [product.properties['fileID'] for page in pages for product in page] == expected
+            assert pages[-1].searchComplete
+            assert not any(page.searchComplete for page in pages[:-1])
+
+        m.reset_mock()
+        results = search(**search_opts, sortedStream=True, maxResults=6)
+        assert [product.properties['fileID'] for product in results] == expected[:6]
+        # the first page of each subquery, and the second of those the results reach into
+        assert m.call_count < math.ceil(12 / 4) + math.ceil(5 / 4) + math.ceil(9 / 4)
+
+
+def test_search_generator_drop_duplicates(monkeypatch):
+    fbs = _get_mock_items('FBS', 6)
+    fbd = _get_mock_items('FBD', 4)
+    # FBD also returns three FBS granules, one of them at a newer revision
+    fbd[1], fbd[2], fbd[3] = deepcopy(fbs[0]), deepcopy(fbs[3]), deepcopy(fbs[5])
+    fbd[3]['meta']['revision-id'] = 2
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 4)
+    search_opts = {'beamMode': ['FBS', 'FBD']}
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages({'FBS': fbs, 'FBD': fbd}, page_size=4),
+        )
+        assert len(search(**search_opts)) == 10
+
+        def keys(results):
+            return sorted(
+                (product.meta['concept-id'], product.meta['revision-id']) for product in results
+            )
+
+        expected = sorted(
+            [(item['meta']['concept-id'], item['meta']['revision-id']) for item in fbs]
+            + [('G0000-FBD', 1), ('G0005-FBS', 2)]
+        )
+        for dedup_opts in [
+            {'dropDuplicates': True},
+            {'dropDuplicates': True, 'maxWorkers': 2},
+            {'dropDuplicates': True, 'duplicateBloomCapacity': 1000},
+        ]:
+            results = search(**search_opts, **dedup_opts)
+            results.raise_if_incomplete()
+            assert keys(results) == expected
+
+        # duplicates don't count towards maxResults
+        results = search(**search_opts, dropDuplicates=True, maxResults=7)
+        assert keys(results) == [key for key in expected if key != ('G0005-FBS', 2)]
+
+    client = MockAsyncClient(mock_cmr_pages({'FBS': fbs, 'FBD': fbd}, page_size=4))
+    for dedup_opts in [{}, {'duplicateBloomCapacity': 1000}]:
+        results = asyncio.run(
+            search_async(**search_opts, dropDuplicates=True, **dedup_opts, client=client)
+        )
+        assert keys(results) == expected
+
+    results = asyncio.run(
+        search_async(**search_opts, dropDuplicates=True, maxResults=7, client=client)
+    )
+    assert keys(results) == [key for key in expected if key != ('G0005-FBS', 2)]
+
+
+def test_search_generator_checkpoint(monkeypatch, tmp_path):
+    responses = {
+        'FBS': _get_mock_items('FBS', 7),
+        'FBD': _get_mock_items('FBD', 4),
+        'PLR': _get_mock_items('PLR', 5),
+    }
+    # PLR also returns two FBS granules, dropped with dropDuplicates
+    responses['PLR'][1], responses['PLR'][4] = responses['FBS'][2], responses['FBS'][6]
+
+    def page_keys(pages):
+        return [[product.meta['concept-id'] for product in page] for page in pages]
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 2)
+    search_opts = {'beamMode': ['FBS', 'FBD', 'PLR']}
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+
+        for run_idx, run_opts in enumerate(
+            [{}, {'maxWorkers': 2}, {'dropDuplicates': True}, {'maxResults': 9}]
+        ):
+            opts = {**search_opts, **run_opts}
+            expected = list(search_generator(**opts))
+            for stop_after in [1, 4, len(expected)]:
+                checkpoint = str(tmp_path / f'{run_idx}_{stop_after}.json')
+                pages = search_generator(**opts, checkpoint=checkpoint)
+                consumed = [next(pages) for _ in range(stop_after)]
+                # the search dies while the last page is processed
+                del pages
+
+                m.reset_mock()
+                resumed = list(resume_search_generator(checkpoint, **opts))
+                assert page_keys(consumed[:-1] + resumed) == page_keys(expected)
+                assert [page.searchComplete for page in consumed[:-1] + resumed] == [
+                    page.searchComplete for page in expected
+                ]
+                assert list(resume_search_generator(checkpoint, **opts)) == []
+                if run_opts.get('maxWorkers'):
+                    continue  # the stopped search's workers may still be finishing a request
+
+                # only the pages after the checkpoint are requested
+                assert m.call_count <= len(resumed) + 1
+                if stop_after == 4:  # checkpointed partway through FBS
+                    assert m.request_history[0].headers.get('CMR-Search-After') == '6'
+
+        # no checkpoint saved yet, the search starts from the beginning
+        missing = str(tmp_path / 'missing.json')
+        assert page_keys(resume_search_generator(missing, **search_opts)) == page_keys(
+            search_generator(**search_opts)
+        )
+
+        with pytest.raises(ValueError):
+            list(resume_search_generator(missing, beamMode=['FBS', 'FBD']))
+        with pytest.raises(ValueError):
+            list(search_generator(**search_opts, sortedStream=True, checkpoint=missing))
+
+
+def test_BloomFilter():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    keys = [f'G{idx:07d}-ASF:1' for idx in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert len(bloom) == 1000
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f'G{idx:07d}-ASF:2' in bloom for idx in range(10000))
+    assert false_positives < 300
+    assert len(bloom._bits) < 1000 * 10 / 8 + 1
+
+
+def test_PageSizer():
+    sizer = PageSizer(page_size=250, min_page_size=25, max_page_size=2000, target_time=5)
+    assert sizer.next_page_size() == 250
+    assert sizer.next_page_size(10) == 10
+
+    # not adaptive, observations are ignored
+    sizer.observe(250, 50.0)
+    assert sizer.page_size == 250
+
+    sizer = PageSizer(True, page_size=250, min_page_size=25, max_page_size=2000, target_time=5)
+    sizer.observe(250, 10.0)  # 125 items fit in 5 seconds
+    assert sizer.page_size == 188
+    for _ in range(20):
+        sizer.observe(sizer.page_size, sizer.page_size / 25)
+    assert abs(sizer.page_size - 125) <= 1
+
+    for _ in range(20):
+        sizer.observe(sizer.page_size, 0.01)
+    assert sizer.page_size == 2000
+    for _ in range(20):
+        sizer.observe(sizer.page_size, 1000.0)
+    assert sizer.page_size == 25
+
+    # pages are kept under max_bytes
+    sizer = PageSizer(True, page_size=250, max_bytes=1024 * 100, target_time=5)
+    for _ in range(20):
+        sizer.observe(sizer.page_size, 0.1, sizer.page_size * 1024)
+    assert sizer.page_size == 100
+
+    translated_opts = [('provider', 'ASF'), ('page_size', 250), ('sort_key[]', 'granule_ur')]
+    assert get_page_size(translated_opts) == 250
+    assert set_page_size(translated_opts, 10) == [
+        ('provider', 'ASF'),
+        ('page_size', 10),
+        ('sort_key[]', 'granule_ur'),
+    ]
+    assert get_page_size([('provider', 'ASF')], 250) == 250
+    assert set_page_size([], 0) == [('page_size', 0)]
+
+
+def test_search_generator_shared_session(monkeypatch):
+    serial = _page_ids(_run_mocked_search(monkeypatch))
+
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+    session = ASFSession()
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+
+        def run_search(max_workers: int):
+            opts = ASFSearchOptions(session=session, maxWorkers=max_workers)
+            pages = search_generator(opts=opts, beamMode=['FBS', 'FBD', 'PLR'])
+            return _page_ids(list(pages))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run_search, [1, 3, 1, 3, 1, 3, 1, 3]))
+
+    assert all(page_ids == serial for page_ids in results)
+    assert 'CMR-Search-After' not in session.headers
+
+
+class MockAsyncResponse:
+    def __init__(self, callback, data: str, headers: Dict):
+        request = SimpleNamespace(body=data, headers=headers)
+        context = SimpleNamespace(headers={}, status_code=200)
+        self._page = callback(request, context)
+        self.headers, self.status = context.headers, context.status_code
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def read(self):
+        return json.dumps(self._page).encode('utf-8')
+
+
+class MockAsyncClient:
+    """Minimal stand-in for `aiohttp.ClientSession` serving a requests_mock json callback"""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = 0
+
+    def post(self, url: str, data: str, headers: Dict):
+        self.requests += 1
+        return MockAsyncResponse(self.callback, data, headers)
+
+
+def test_search_generator_async(monkeypatch, tmp_path):
+    serial = _run_mocked_search(monkeypatch)
+
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+    client = MockAsyncClient(mock_cmr_pages(responses, page_size=2))
+
+    # pages are parsed off the event loop's thread
+    parse_threads = []
+    search_generator_module = importlib.import_module('asf_search.search.search_generator')
+    parse_page = search_generator_module._parse_page
+
+    def record_parse_thread(*args):
+        parse_threads.append(threading.current_thread())
+        return parse_page(*args)
+
+    monkeypatch.setattr(search_generator_module, '_parse_page', record_parse_thread)
+
+    async def collect_pages():
+        return [
+            page
+            async for page in search_generator_async(
+                beamMode=['FBS', 'FBD', 'PLR'], client=client
+            )
+        ]
+
+    pages = asyncio.run(collect_pages())
+
+    assert len(parse_threads) == 7
+    assert threading.main_thread() not in parse_threads
+    assert _page_ids(pages) == _page_ids(serial)
+    assert [page.searchComplete for page in pages] == [page.searchComplete for page in serial]
+    assert client.requests == 7
+
+    results = asyncio.run(search_async(beamMode=['FBS', 'FBD', 'PLR'], maxResults=4, client=client))
+    assert len(results) == 4
+    assert results.searchComplete
+
+    for unsupported_opts in [
+        {'spatialTiles': 4},
+        {'temporalShards': 2},
+        {'sortedStream': True},
+        {'checkpoint': str(tmp_path / 'search.json')},
+        {'resumeFromCheckpoint': True},
+    ]:
+        with pytest.raises(ValueError, match=list(unsupported_opts)[0]):
+            asyncio.run(search_async(beamMode='FBS', **unsupported_opts, client=client))
+
+
+def test_search_generator_async_retries_429(monkeypatch):
+    retry_delays = []
+
+    async def sleep(seconds: float):
+        retry_delays.append(seconds)
+
+    monkeypatch.setattr(get_page_async.retry, 'sleep', sleep)
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 2)
+    responses = {'FBS': _get_mock_items('FBS', 3)}
+    callback = mock_cmr_pages(responses, page_size=2)
+    throttled = iter([True, False, True])
+
+    def throttling_callback(request, context):
+        if next(throttled, False):
+            context.status_code = 429
+            context.headers['Retry-After'] = '2'
+            return None
+        return callback(request, context)
+
+    client = MockAsyncClient(throttling_callback)
+
+    async def collect_pages():
+        return [page async for page in search_generator_async(beamMode='FBS', client=client)]
+
+    pages = asyncio.run(collect_pages())
+
+    assert len(_page_ids(pages)) == 3
+    assert client.requests == 4
+    assert retry_delays == [2.0, 2.0]
+
+
+def test_search_generator_prefetch(monkeypatch):
+    serial = _run_mocked_search(monkeypatch)
+
+    for prefetch_depth in [1, 3]:
+        prefetched = _run_mocked_search(monkeypatch, prefetchDepth=prefetch_depth)
+        assert _page_ids(prefetched) == _page_ids(serial)
+        assert [page.searchComplete for page in prefetched] == [
+            page.searchComplete for page in serial
+        ]
+
+    pages = _run_mocked_search(monkeypatch, prefetchDepth=2, maxWorkers=3, maxResults=7)
+    assert _page_ids(pages) == _page_ids(serial)[:7]
+
+
+def test_search_generator_cmr_cache(monkeypatch, tmp_path):
+    responses = {
+        'FBS': _get_mock_items('FBS', 5),
+        'FBD': _get_mock_items('FBD', 3),
+        'PLR': _get_mock_items('PLR', 4),
+    }
+    cache = CMRCache(path=str(tmp_path))
+    opts = ASFSearchOptions(session=ASFSession(cmr_cache=cache))
+
+    monkeypatch.setattr(INTERNAL, 'CMR_PAGE_SIZE', 2)
+    with requests_mock.Mocker() as m:
+        m.post(
+            f'https://{INTERNAL.CMR_HOST}{INTERNAL.CMR_GRANULE_PATH}',
+            json=mock_cmr_pages(responses, page_size=2),
+        )
+        uncached = list(search_generator(beamMode=['FBS', 'FBD', 'PLR'], opts=opts))
+        assert m.call_count == 7
+
+        cached = list(search_generator(beamMode=['FBS', 'FBD', 'PLR'], opts=opts))
+        assert m.call_count == 7
+        assert _page_ids(cached) == _page_ids(uncached)
+
+        stats = cache.stats()
+        assert stats['hits'] == 7
+        assert stats['misses'] == 7
+        assert stats['entries'] == 7
+
+        # a fresh cache picks up pages already on disk
+        assert CMRCache(path=str(tmp_path)).stats()['entries'] == 7
+
+        cache.ttl = 0
+        list(search_generator(beamMode=['FBS', 'FBD', 'PLR'], opts=opts))
+        assert m.call_count == 14
+        assert cache.stats()['expired'] == 7
+
+        # least recently used pages are evicted down to the size limit
+        max_size = cache.stats()['size'] // 2
+        small_cache = CMRCache(path=str(tmp_path), max_size=max_size)
+        assert 0 < small_cache.stats()['size'] <= max_size
+        assert small_cache.stats()['evictions'] > 0
+
+
+def test_search_generator_stream_pages(monkeypatch):
+    pages = _run_mocked_search(monkeypatch)
+    streamed_pages = _run_mocked_search(monkeypatch, streamPages=True)
+
+    assert len(streamed_pages) == len(pages)
+    assert _page_ids(streamed_pages) == _page_ids(pages)
+    assert [page.searchComplete for page in streamed_pages] == [
+        page.searchComplete for page in pages
+    ]
+    for streamed_page, page in zip(streamed_pages, pages):
+        for streamed_product, product in zip(streamed_page, page):
+            assert streamed_product.properties == product.properties
+            assert streamed_product.geometry == product.geometry
+
+
+def test_search_generator_lazy_products(monkeypatch):
+    pages = _run_mocked_search(monkeypatch)
+    lazy_pages = _run_mocked_search(monkeypatch, lazyProducts=True)
+
+    assert _page_ids(lazy_pages) == _page_ids(pages)
+    for lazy_page, page in zip(lazy_pages, pages):
+        assert [product.geojson() for product in lazy_page] == [
+            product.geojson() for product in page
+        ]
+
+
+def test_search_generator_parse_workers(monkeypatch):
+    pages = _run_mocked_search(monkeypatch)
+    pool_pages = _run_mocked_search(monkeypatch, parseWorkers=2)
+    concurrent_pool_pages = _run_mocked_search(monkeypatch, parseWorkers=2, maxWorkers=3)
+
+    assert _page_ids(pool_pages) == _page_ids(pages)
+    assert _page_ids(concurrent_pool_pages) == _page_ids(pages)
+    for pool_page, page in zip(pool_pages, pages):
+        assert [type(product) for product in pool_page] == [type(product) for product in page]
+        assert [product.geojson() for product in pool_page] == [
+            product.geojson() for product in page
+        ]
+        assert [product.baseline for product in pool_page] == [product.baseline for product in page]
+        assert [product.umm for product in pool_page] == [product.umm for product in page]
+
+    # the pool is spawned once, and shared by every search with the same number of processes
+    pool = _get_parse_pool(2)
+    assert pool._mp_context.get_start_method() == 'spawn'
+
+    # each process is sent only its own chunk of a page's items
+    chunk_sizes = []
+    submit = pool.submit
+
+    def record_submit(fn, chunk, product_types):
+        chunk_sizes.append(len(chunk))
+        return submit(fn, chunk, product_types)
+
+    monkeypatch.setattr(pool, 'submit', record_submit)
+    _run_mocked_search(monkeypatch, parseWorkers=2)
+    assert _get_parse_pool(2) is pool
+    assert chunk_sizes == [1] * 12
+
+
+class GranuleURProduct(ALOSProduct):
+    """Registered by `test_search_generator_parse_workers_registered_type()`"""
+
+    _base_properties = {**ALOSProduct._base_properties, 'granuleUR': {'path': ['GranuleUR']}}
+
+
+def test_search_generator_parse_workers_registered_type(monkeypatch):
+    # registrations are global, restore the dispatch tables afterwards
+    search_generator_module = importlib.import_module('asf_search.search.search_generator')
+    for name in ['dataset_to_product_types', 'product_types_by_concept_id']:
+        monkeypatch.setattr(
+            search_generator_module, name, {**getattr(search_generator_module, name)}
+        )
+    register_product_type(GranuleURProduct, short_names=['ALOS'])
+
+    pages = _run_mocked_search(monkeypatch, parseWorkers=2)
+
+    products = [product for page in pages for product in page]
+    assert len(products) == 12
+    assert all(type(product) is GranuleURProduct for product in products)
+    assert [product.properties['granuleUR'] for product in products] == [
+        product.umm['GranuleUR'] for product in products
+    ]